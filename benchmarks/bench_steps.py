@@ -0,0 +1,55 @@
+"""
+Times the generation of LaTeX steps for long chains of calculations, and for calculations sharing a lot of work
+
+Run with `python -m benchmarks.bench_steps` from the root of the repository.
+"""
+import time
+
+from physics_utils import MeasuredData
+
+def chain(length: int) -> MeasuredData:
+    # each result is used once by the next, e.g. a running total
+    total = MeasuredData(0, 0.1)
+    x = MeasuredData(1.5, 0.2)
+
+    for _ in range(length):
+        total = total + x
+
+    return total
+
+def ladder(rungs: int) -> MeasuredData:
+    # each result is used twice by the next, so the number of paths through the calculation doubles with every rung
+    a = MeasuredData(1.2, 0.1)
+    b = MeasuredData(0.8, 0.05)
+
+    for _ in range(rungs):
+        a, b = a + b, a - b
+
+    return a - b
+
+def timed(name: str, fn) -> None:
+    start = time.perf_counter()
+
+    try:
+        fn()
+    except RecursionError:
+        print("{:<40} RecursionError".format(name))
+        return
+
+    print("{:<40} {:.4f} s".format(name, time.perf_counter() - start))
+
+def main() -> None:
+    for length in (16, 1000, 5000):
+        x = chain(length)
+        timed("chain of {}, sequential".format(length), lambda: x.all_steps_sequential())
+
+    for length in (16, 20, 5000):
+        x = chain(length)
+        timed("chain of {}, composite".format(length), lambda: x.all_steps_composite(False))
+
+    for rungs in (16, 20):
+        x = ladder(rungs)
+        timed("ladder of {}, sequential".format(rungs), lambda: x.all_steps_sequential())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+"""
+Times (and measures the peak memory of) the main paths through the library: arithmetic, steps, the script interpreter,
+tables and graphs, and compares the results against a stored baseline
+
+Run with `python -m benchmarks.suite` from the root of the repository. Use `--save benchmarks/baseline.json` to store
+the results as the new baseline, and `--compare benchmarks/baseline.json` to report how they've changed since then (the
+exit code is 1 if anything got slower by more than the threshold.)
+"""
+import argparse
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+import matplotlib
+
+# graphs are drawn without a display
+matplotlib.use("Agg")
+
+import numpy as np
+
+from physics_utils import MeasuredData
+from physics_utils.data import MeasuredArray
+from physics_utils.table import Table2D
+from .bench_steps import chain, ladder
+
+# every benchmark by name, as a function which does the setup and returns the function to be timed
+benchmarks: dict[str, Callable[[], Callable[[], object]]] = {}
+
+def benchmark(name: str):
+    def register(setup: Callable[[], Callable[[], object]]):
+        benchmarks[name] = setup
+        return setup
+
+    return register
+
+def import_time(code: str) -> Callable[[], None]:
+    """
+    Returns a function which runs the given code in a new interpreter, to time how long imports take from scratch
+    """
+    import subprocess
+
+    return lambda: subprocess.run([sys.executable, "-c", code], check=True)
+
+@benchmark("import.measured_data")
+def import_measured_data():
+    return import_time("from physics_utils import MeasuredData")
+
+@benchmark("import.everything")
+def import_everything():
+    return import_time("import physics_utils.graph, physics_utils.table, physics_utils.script.main")
+
+@benchmark("data.scalar_ops")
+def scalar_ops():
+    x, y = MeasuredData(3.2, 0.1), MeasuredData(1.5, 0.2, 0.05)
+
+    def run():
+        for _ in range(2000):
+            (x * y + x / y - 2 * x) ** 2 + y.sine() * x.cosine()
+
+    return run
+
+@benchmark("data.long_chain")
+def long_chain():
+    return lambda: chain(20000)
+
+@benchmark("data.array_ops")
+def array_ops():
+    x = MeasuredArray(np.linspace(1, 2, 100000), 0.01, 0.02)
+    y = MeasuredArray(np.linspace(2, 3, 100000), 0.03)
+
+    return lambda: ((x * y + x / y - 2 * x) ** 2 + y.sine() * x.cosine()).latex()
+
+@benchmark("steps.chain_sequential")
+def chain_sequential():
+    x = chain(3000)
+    return lambda: x.all_steps_sequential()
+
+@benchmark("steps.chain_composite")
+def chain_composite():
+    x = chain(3000)
+    return lambda: x.all_steps_composite(False)
+
+@benchmark("steps.ladder_sequential")
+def ladder_sequential():
+    x = ladder(20)
+    return lambda: x.all_steps_sequential()
+
+@benchmark("steps.ladder_composite")
+def ladder_composite():
+    x = ladder(14)
+    return lambda: x.all_steps_composite(False)
+
+def script(source: str, compiled=True) -> Callable[[], None]:
+    """
+    Returns a function which parses and runs the given script, without printing anything, either compiled or by
+    visiting its parse tree
+    """
+    from antlr4 import InputStream
+    from physics_utils.script.main import parse_stream
+    from physics_utils.script.antlr_build.ExprParser import ExprParser
+    from physics_utils.script.visitor_interpreter import VisitorInterpreter
+
+    def run():
+        parser = ExprParser(None)
+        tree = parse_stream(parser, InputStream(source))
+
+        interpreter = VisitorInterpreter()
+        interpreter.output_expr = False
+
+        if compiled:
+            interpreter.run(tree)
+        else:
+            interpreter.visit(tree)
+
+    return run
+
+loop_source = """
+total := 0
+for i from 1 to 3000 loop
+    if i > 10 then
+        total := total + i * 2 ~ 0.1
+    end if
+end loop
+"""
+
+@benchmark("script.loop")
+def script_loop():
+    return script(loop_source)
+
+@benchmark("script.loop_visited")
+def script_loop_visited():
+    return script(loop_source, compiled=False)
+
+@benchmark("script.loop_cached")
+def script_loop_cached():
+    import tempfile
+    from physics_utils.script.transpiler import load_script
+    from physics_utils.script.visitor_interpreter import VisitorInterpreter
+
+    directory = tempfile.mkdtemp()
+    file_name = directory + "/loop.phys"
+
+    with open(file_name, "w") as f:
+        f.write(loop_source)
+
+    # the first load transpiles the script and caches it, so the timed runs only load the cache
+    load_script(file_name)
+
+    return lambda: load_script(file_name)(VisitorInterpreter())
+
+signals_source = """
+found := 0
+for i from 1 to 3000 loop
+    if i > 2000 then
+        continue
+    end if
+    n := 0
+    while true loop
+        n := n + 1
+        if n > 2 then
+            break
+        end if
+    end loop
+    found := found + n
+end loop
+"""
+
+@benchmark("script.signals")
+def script_signals():
+    return script(signals_source)
+
+@benchmark("script.signals_visited")
+def script_signals_visited():
+    return script(signals_source, compiled=False)
+
+literals_source = """
+total := 0
+for i from 1 to 3000 loop
+    values := [0.312249, 0.343593, 0.365498, 0.688140, 0.205810]
+    total := total + values[2] * (9.81 ~ 0.02 * 2 - 1) / (3 ^ 2)
+end loop
+"""
+
+@benchmark("script.literals")
+def script_literals():
+    return script(literals_source)
+
+@benchmark("script.literals_visited")
+def script_literals_visited():
+    return script(literals_source, compiled=False)
+
+@benchmark("script.literals_no_steps")
+def script_literals_no_steps():
+    from physics_utils.data import no_steps
+
+    run = script(literals_source)
+
+    def run_without_steps():
+        with no_steps():
+            run()
+
+    return run_without_steps
+
+@benchmark("script.nested_calls")
+def script_nested_calls():
+    return script("""
+define outer(a) as
+    define inner(b) as
+        return sin(a) * cos(b) + a * b
+    end inner
+    total := 0
+    for i from 1 to 50 loop
+        total := total + inner(i)
+    end loop
+    return total
+end outer
+for j from 1 to 40 loop
+    x := outer(j)
+end loop
+""")
+
+@benchmark("script.star_call")
+def script_star_call():
+    values = ", ".join(str(i) for i in range(1000))
+
+    return script("""
+define momentum(mass, velocity) as
+    return mass * velocity
+end momentum
+masses := [{0}]
+velocities := [{0}]
+result := momentum*(*masses, *velocities)
+""".format(values))
+
+# a long script of the kind of functions an analysis has, for timing the parsers on their own
+large_source = "".join("""
+define kinetic_{0}(mass, velocity) as
+    energy := mass * velocity ^ 2 / 2 ~ 0.01
+    if energy > 100 and mass != 0 then
+        return [energy, mass, (velocity + 1*10^-3) / 2]
+    else if energy < 1*10^-3 then
+        return #[energy]
+    end if
+    for i from 1 to 3 loop
+        energy := energy | i
+    end loop
+    return kinetic*(*[mass, mass], velocity)
+end kinetic_{0}
+""".format(i) for i in range(100))
+
+def parse(parser: str) -> Callable[[], object]:
+    from physics_utils.script.main import parse_source
+
+    return lambda: parse_source(large_source, parser)
+
+@benchmark("parse.antlr")
+def parse_antlr():
+    return parse("antlr")
+
+@benchmark("parse.precedence")
+def parse_precedence():
+    return parse("precedence")
+
+@benchmark("table.latex")
+def table_latex():
+    rows = [[MeasuredData(i * 1.2345, 0.01 * i, 0.002) for i in range(1, 6)] for _ in range(2000)]
+    table = Table2D(rows, ["a", "b", "c", "d", "e"])
+
+    return table.latex
+
+@benchmark("graph.plot")
+def graph_plot():
+    import matplotlib.pyplot as plt
+    from physics_utils.graph import SimpleGraph
+
+    x = [MeasuredData(i, 0.1) for i in range(300)]
+    y = [MeasuredData(2 * i + 1, 0.5, 0.2) for i in range(300)]
+
+    def run():
+        graph = SimpleGraph("Benchmark")
+        graph.set_x_axis(x, "x")
+        graph.set_y_axis(y, "y")
+        graph.plot_points()
+        graph.best_fit()
+        graph.put_labels()
+        graph.put_legend()
+        graph.figure.savefig(io.BytesIO(), format="png")
+        plt.close(graph.figure)
+
+    return run
+
+def measure(run: Callable[[], object], repeat: int) -> dict[str, float]:
+    """
+    Returns the best and median times of running a function repeat times, and the peak memory allocated by one run
+    """
+    times = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    # measured on its own run, since tracing allocations slows everything down
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"time": min(times), "median": statistics.median(times), "peak_memory": peak}
+
+def run_all(names: list[str], repeat: int) -> dict:
+    results = {}
+
+    for name in names:
+        try:
+            run = benchmarks[name]()
+        except ImportError as e:
+            # e.g., the script parser not having been built
+            print("{:<28} skipped ({})".format(name, e), file=sys.stderr)
+            continue
+
+        result = results[name] = measure(run, repeat)
+        print("{:<28} {:>10.4f} s {:>10.1f} KiB".format(name, result["time"], result["peak_memory"] / 1024), file=sys.stderr)
+
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+def compare(baseline: dict, current: dict, threshold: float) -> tuple[str, bool]:
+    """
+    Builds a report of how each benchmark changed from the baseline, and whether any got slower by more than threshold
+    """
+    lines = ["{:<28} {:>10} {:>10} {:>8} {:>8}".format("benchmark", "baseline", "current", "time", "memory")]
+    regressed = False
+
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            lines.append("{:<28} {:>10} {:>10.4f}".format(name, "-", result["time"]))
+            continue
+
+        old = baseline["results"][name]
+        time_ratio = result["time"] / old["time"]
+        memory_ratio = result["peak_memory"] / old["peak_memory"] if old["peak_memory"] else 1.0
+
+        status = ""
+        if time_ratio > threshold:
+            status = "slower"
+            regressed = True
+        elif time_ratio < 1 / threshold:
+            status = "faster"
+
+        lines.append("{:<28} {:>10.4f} {:>10.4f} {:>7.2f}x {:>7.2f}x  {}".format(
+            name, old["time"], result["time"], time_ratio, memory_ratio, status
+        ).rstrip())
+
+    return "\n".join(lines), regressed
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="the number of timed runs of each benchmark")
+    parser.add_argument("--save", help="where to save the results as JSON")
+    parser.add_argument("--compare", help="a saved baseline to compare the results against")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="how many times slower a benchmark can get before it counts as a regression")
+    args = parser.parse_args(argv)
+
+    current = run_all([name for name in benchmarks if args.filter in name], args.repeat)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(current, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        report, regressed = compare(baseline, current, args.threshold)
+        print(report)
+
+        return 1 if regressed else 0
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
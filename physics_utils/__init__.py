@@ -1,10 +1,33 @@
 from .data import MeasuredData
-from . import data, graph, table, script
+from . import data
+from .instrument import stats, reset_stats, instrument, instrumenting, instrumented, steps_size
 
 __all__ = [
     "MeasuredData",
     "data",
     "graph",
     "table",
-    "script"
-]
\ No newline at end of file
+    "script",
+    "stats",
+    "reset_stats",
+    "instrument",
+    "instrumenting",
+    "instrumented",
+    "steps_size"
+]
+
+# imported the first time they're used rather than with the package, since graph imports matplotlib and script the
+# ANTLR runtime, which take far longer to import than the rest of the package
+lazy_modules = ("graph", "table", "script")
+
+def __getattr__(name: str):
+    if name in lazy_modules:
+        from importlib import import_module
+
+        # importing the module also sets it as an attribute of the package, so this is only called once for each
+        return import_module("." + name, __name__)
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(lazy_modules))
@@ -3,6 +3,19 @@ Defines the MeasuredData class and helper functions for error propagation
 """
 from . import math
 from .measureddata import MeasuredData
-from .util import avg_from_set, avg_measured_datas
+from .md_array import MeasuredArray
+from .md_correlated import CorrelatedData
+from .md_steps import no_steps, track_steps, tracking_steps
+from .md_tape import StepTape, recording
+from .measured_csv import load_measured_csv
+from .md_lazy import LazyData, lazy, evaluate
+from .montecarlo import monte_carlo
+from .md_propagate import propagate
+from .streaming import RunningStats
+from .util import avg_from_set, avg_measured_datas, avg_weighted, avg_weighted_groups
 
-__all__ = ["MeasuredData", "avg_from_set", "avg_measured_datas", "math"]
+__all__ = [
+    "MeasuredData", "MeasuredArray", "CorrelatedData", "avg_from_set", "avg_measured_datas", "avg_weighted",
+    "avg_weighted_groups", "math", "no_steps", "track_steps", "tracking_steps", "StepTape", "recording", "LazyData",
+    "lazy", "evaluate", "monte_carlo", "propagate", "RunningStats", "load_measured_csv"
+]
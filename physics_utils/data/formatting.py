@@ -0,0 +1,158 @@
+"""
+Formatting of values with uncertainty, for single values or whole arrays of them at once
+"""
+import numpy as np
+
+__all__ = ["format_measurement", "format_many", "latex_many"]
+
+# the error strings for each (leading digit, exponent) pair seen so far, e.g. (5, -2) -> "0.05"
+_error_strings = {}
+
+def _error_string(digit: int, exponent: int) -> str:
+    """
+    Writes out a single significant digit at the given power of ten, as np.format_float_positional would
+    """
+    key = (digit, exponent)
+
+    if key not in _error_strings:
+        if exponent >= 0:
+            _error_strings[key] = str(digit) + "0" * exponent + "."
+        else:
+            _error_strings[key] = "0." + "0" * (-exponent - 1) + str(digit)
+
+    return _error_strings[key]
+
+def format_measurement(value, error: float) -> str:
+    """
+    Formats a value with its uncertainty, as done by MeasuredData.__str__
+
+    The uncertainty is rounded to one significant digit, and the value is then rounded to the same place as the
+    uncertainty
+
+    Examples
+    --------
+    >>> format_measurement(1234.56789, 0.05333)
+    '1234.57±0.05'
+    >>> format_measurement(1234.567, 543)
+    '1200.0±500.'
+    """
+    if error == 0:
+        return str(value)
+
+    if not np.isfinite(error):
+        return _format_non_finite(value, error)
+
+    # rounding to one significant digit in scientific notation gives exactly the digit and place that
+    # np.format_float_positional(error, precision=1, fractional=False) rounds to
+    digit, exponent = ("%.0e" % error).split("e")
+    exponent = int(exponent)
+
+    return str(round(value, -exponent)) + "±" + _error_string(int(digit), exponent)
+
+def _format_non_finite(value, error: float) -> str:
+    # infinite and nan errors are written out by numpy as words, which are then read as if they were numbers
+    err = np.format_float_positional(error, precision=1, fractional=False)
+
+    decimal_num = 0
+    change = -1
+    for c in err[1:-1]:
+        decimal_num += change
+        if c == '.':
+            change = 1
+            decimal_num = 0
+
+    if err[-1] != '.':
+        decimal_num += change
+
+    return str(round(value, decimal_num)) + "±" + err
+
+def _values_and_errors(data) -> tuple[list, np.ndarray]:
+    """
+    Splits a MeasuredArray or an iterable of MeasuredDatas into a list of values and an array of their uncertainties
+    """
+    if isinstance(getattr(data, "value", None), np.ndarray):
+        return data.value.tolist(), data.error()
+
+    data = list(data)
+
+    reading = np.fromiter((x.reading_error for x in data), dtype=float, count=len(data))
+    standard = np.fromiter((x.standard_error for x in data), dtype=float, count=len(data))
+
+    return [x.value for x in data], np.maximum(np.abs(reading), np.abs(standard))
+
+def format_many(data) -> list[str]:
+    """
+    Formats many values with uncertainty at once, giving the same text as calling str on each of them
+
+    The place each value is rounded to is worked out for the whole array at once, leaving only the final rounding of
+    each value to be done one at a time.
+
+    Parameters
+    ----------
+    data : MeasuredArray | Iterable[MeasuredData]
+        The values to format
+
+    Returns
+    -------
+    list[str]
+        The formatted text of each value
+
+    Examples
+    --------
+    >>> from physics_utils import MeasuredData
+    >>> format_many([MeasuredData(1234.56789, 0.05333), MeasuredData(100.4, 0.0, 4.3)])
+    ['1234.57±0.05', '100.0±4.']
+    """
+    values, errors = _values_and_errors(data)
+
+    if len(values) == 0:
+        return []
+
+    usable = np.isfinite(errors) & (errors > 1e-300) & (errors < 1e300)
+
+    # anything unusable is formatted one at a time below, so it's given a stand in error of 1 here
+    with np.errstate(all="ignore"):
+        exponents = np.floor(np.log10(np.where(usable, errors, 1.0)))
+        mantissas = np.where(usable, errors, 1.0) / 10.0 ** exponents
+
+    digits = np.rint(mantissas)
+
+    # rounding up to 10 carries over into the next place
+    carry = digits == 10
+    digits[carry] = 1
+    exponents[carry] += 1
+
+    # mantissas sitting right on a rounding boundary (or at the edge of a power of ten, where log10 may have gone the
+    # wrong way) can't be trusted to round the same way as the exact error would, so those are done one at a time
+    fraction = mantissas - np.floor(mantissas)
+    fast = usable & (np.abs(fraction - 0.5) > 1e-6) & (mantissas > 1 + 1e-9) & (mantissas < 10 - 1e-6)
+
+    error_strings = [_error_string(d, e) for d, e in zip(digits.astype(int).tolist(), exponents.astype(int).tolist())]
+    places = (-exponents).astype(int).tolist()
+
+    return [
+        str(round(value, place)) + "±" + err if is_fast else format_measurement(value, error)
+        for value, place, err, is_fast, error in zip(values, places, error_strings, fast.tolist(), errors.tolist())
+    ]
+
+def latex_many(data, wrap=True) -> list[str]:
+    """
+    Formats many values with uncertainty at once in LaTeX, giving the same text as calling latex on each of them
+
+    Parameters
+    ----------
+    data : MeasuredArray | Iterable[MeasuredData]
+        The values to format
+    wrap : bool
+        Should the values be wrapped in $$
+    """
+    template = "${} \\pm {}$" if wrap else "{} \\pm {}"
+
+    return [
+        template.format(*text.split("±")) if "±" in text else text
+        for text in format_many(data)
+    ]
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
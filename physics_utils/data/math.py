@@ -2,30 +2,47 @@
 Redefines some math functions to add support for MeasuredDatas
 """
 
+from .md_base import MeasuredDataBase
 from .measureddata import MeasuredData
+from .md_array import MeasuredArray
+from .md_lazy import LazyData
 import math
+import numpy as np
 
-def sin(x: float | MeasuredData) -> float | MeasuredData:
-    if isinstance(x, MeasuredData):
+# types which numpy's ufuncs propagate uncertainty through
+dispatched_types = (MeasuredDataBase, MeasuredArray, np.ndarray)
+
+def sin(x: float | MeasuredData | MeasuredArray | LazyData) -> float | MeasuredData | MeasuredArray | LazyData:
+    if isinstance(x, dispatched_types):
+        return np.sin(x)
+    if isinstance(x, LazyData):
         return x.sine()
     return math.sin(x)
 
-def cos(x: float | MeasuredData) -> float | MeasuredData:
-    if isinstance(x, MeasuredData):
+def cos(x: float | MeasuredData | MeasuredArray | LazyData) -> float | MeasuredData | MeasuredArray | LazyData:
+    if isinstance(x, dispatched_types):
+        return np.cos(x)
+    if isinstance(x, LazyData):
         return x.cosine()
     return math.cos(x)
 
-def tan(x: float | MeasuredData) -> float | MeasuredData:
-    if isinstance(x, MeasuredData):
+def tan(x: float | MeasuredData | MeasuredArray | LazyData) -> float | MeasuredData | MeasuredArray | LazyData:
+    if isinstance(x, dispatched_types):
+        return np.tan(x)
+    if isinstance(x, LazyData):
         return x.tangent()
     return math.tan(x)
 
-def asin(x: float | MeasuredData) -> float | MeasuredData:
-    if isinstance(x, MeasuredData):
+def asin(x: float | MeasuredData | MeasuredArray | LazyData) -> float | MeasuredData | MeasuredArray | LazyData:
+    if isinstance(x, dispatched_types):
+        return np.arcsin(x)
+    if isinstance(x, LazyData):
         return x.arcsin()
     return math.asin(x)
 
-def atan(x: float | MeasuredData) -> float | MeasuredData:
-    if isinstance(x, MeasuredData):
+def atan(x: float | MeasuredData | MeasuredArray | LazyData) -> float | MeasuredData | MeasuredArray | LazyData:
+    if isinstance(x, dispatched_types):
+        return np.arctan(x)
+    if isinstance(x, LazyData):
         return x.arctan()
-    return math.asin(x)
\ No newline at end of file
+    return math.atan(x)
@@ -0,0 +1,463 @@
+import numpy as np
+from typing import Iterable, Self
+
+from .formatting import format_many, latex_many
+from .md_base import MeasuredDataBase, PriorityOperand
+from .measureddata import MeasuredData
+
+def safe_div(x, y) -> np.ndarray:
+    """
+    Element-wise counterpart to md_base.safe_div, giving 0 wherever the divisor is 0
+    """
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    return np.divide(x, y, out=np.zeros(x.shape), where=y != 0)
+
+class MeasuredArray(PriorityOperand):
+    """
+    Represents many numerical measurements with uncertainty, stored as contiguous arrays
+
+    Attributes
+    ----------
+    value : np.ndarray
+        The actual values of the data
+    reading_error : np.ndarray
+        The errors from the instrument reading
+    standard_error : np.ndarray
+        The statistical standard errors
+
+    Notes
+    -----
+    Every operation applies the same propagation rules as MeasuredData, but on whole arrays at once. Scalar
+    MeasuredDatas and plain numbers (or arrays of numbers) can be used as operands, and are broadcast against the array.
+    Unlike MeasuredData, no LaTeX steps are kept for these calculations.
+    """
+    def __init__(self, measurements, reading_error, standard_error=0.0):
+        self.value = np.ascontiguousarray(measurements, dtype=float)
+        self.reading_error = np.ascontiguousarray(
+            np.broadcast_to(np.asarray(reading_error, dtype=float), self.value.shape)
+        )
+        self.standard_error = np.ascontiguousarray(
+            np.broadcast_to(np.asarray(standard_error, dtype=float), self.value.shape)
+        )
+
+    @classmethod
+    def _of(cls, value, reading_error, standard_error) -> Self:
+        # builds a result straight from already computed arrays, skipping the conversions done in __init__
+        result = cls.__new__(cls)
+        result.value = value
+        result.reading_error = reading_error
+        result.standard_error = standard_error
+        return result
+
+    @staticmethod
+    def _measured(other) -> Self | None:
+        """
+        Returns other as a MeasuredArray if it is a measured operand (with a scalar becoming a 0-d array), else None
+        """
+        if isinstance(other, MeasuredArray):
+            return other
+        if isinstance(other, MeasuredDataBase):
+            return MeasuredArray(other.value, other.reading_error, other.standard_error)
+        return None
+
+    def error(self) -> np.ndarray:
+        """
+        Returns the uncertainty on each point, which is taken to be the greatest error it has
+
+        Examples
+        --------
+        >>> MeasuredArray([100.2, 3], [2.4, 0.5], [10.12, 0.1]).error()
+        array([10.12,  0.5 ])
+        """
+        return np.maximum(np.abs(self.reading_error), np.abs(self.standard_error))
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __getitem__(self, index) -> MeasuredData | Self:
+        """
+        Returns a single point as a MeasuredData when indexed by an integer, or a MeasuredArray when sliced
+        """
+        value = self.value[index]
+
+        if np.ndim(value) == 0:
+            return MeasuredData(float(value), float(self.reading_error[index]), float(self.standard_error[index]))
+
+        return MeasuredArray._of(value, self.reading_error[index], self.standard_error[index])
+
+    def __iter__(self):
+        return iter(self.to_measured_datas())
+
+    def __add__(self, other) -> Self:
+        """
+        Support for addition with a MeasuredArray as the left operand
+
+        Examples
+        --------
+        >>> print(MeasuredArray([10.4, 1.0], 0.0, 0.5) + MeasuredData(3.0, 1.0, 0.2))
+        [13.0±1., 4.0±1.]
+        """
+        if (m := MeasuredArray._measured(other)) is not None:
+            return MeasuredArray._of(
+                self.value + m.value,
+                np.sqrt(self.reading_error ** 2 + m.reading_error ** 2),
+                np.sqrt(self.standard_error ** 2 + m.standard_error ** 2)
+            )
+
+        return MeasuredArray._of(self.value + other, self.reading_error, self.standard_error)
+
+    def __radd__(self, other) -> Self:
+        # addition is symmetric
+        return self.__add__(other)
+
+    def __sub__(self, other) -> Self:
+        if (m := MeasuredArray._measured(other)) is not None:
+            return MeasuredArray._of(
+                self.value - m.value,
+                np.sqrt(self.reading_error ** 2 + m.reading_error ** 2),
+                np.sqrt(self.standard_error ** 2 + m.standard_error ** 2)
+            )
+
+        return MeasuredArray._of(self.value - other, self.reading_error, self.standard_error)
+
+    def __rsub__(self, other) -> Self:
+        if (m := MeasuredArray._measured(other)) is not None:
+            return m.__sub__(self)
+
+        return MeasuredArray._of(other - self.value, self.reading_error, self.standard_error)
+
+    def __mul__(self, other) -> Self:
+        if (m := MeasuredArray._measured(other)) is not None:
+            value = self.value * m.value
+            error = lambda sx, sy: value * np.sqrt(safe_div(sx, self.value) ** 2 + safe_div(sy, m.value) ** 2)
+
+            return MeasuredArray._of(
+                value,
+                error(self.reading_error, m.reading_error),
+                error(self.standard_error, m.standard_error)
+            )
+
+        value = self.value * other
+        error = lambda s: value * safe_div(s, self.value)
+
+        return MeasuredArray._of(value, error(self.reading_error), error(self.standard_error))
+
+    def __rmul__(self, other) -> Self:
+        # multiplication is symmetric
+        return self.__mul__(other)
+
+    def __truediv__(self, other) -> Self:
+        if (m := MeasuredArray._measured(other)) is not None:
+            value = self.value / m.value
+            error = lambda sx, sy: value * np.sqrt((sx / self.value) ** 2 + (sy / m.value) ** 2)
+
+            return MeasuredArray._of(
+                value,
+                error(self.reading_error, m.reading_error),
+                error(self.standard_error, m.standard_error)
+            )
+
+        value = self.value / other
+        error = lambda s: value * safe_div(s, self.value)
+
+        return MeasuredArray._of(value, error(self.reading_error), error(self.standard_error))
+
+    def __rtruediv__(self, other) -> Self:
+        if (m := MeasuredArray._measured(other)) is not None:
+            return m.__truediv__(self)
+
+        value = other / self.value
+        error = lambda s: value * safe_div(s, self.value)
+
+        return MeasuredArray._of(value, error(self.reading_error), error(self.standard_error))
+
+    def __pow__(self, other) -> Self:
+        if (m := MeasuredArray._measured(other)) is not None:
+            x, y = self.value, m.value
+            error = lambda sx, sy: np.sqrt((y * x ** (y - 1)) ** 2 * sx ** 2 + (x ** y * np.log(y)) ** 2 * sy ** 2)
+
+            return MeasuredArray._of(
+                x ** y,
+                error(self.reading_error, m.reading_error),
+                error(self.standard_error, m.standard_error)
+            )
+
+        error = lambda s: np.abs(other * self.value ** (other - 1) * s)
+
+        return MeasuredArray._of(self.value ** other, error(self.reading_error), error(self.standard_error))
+
+    def __rpow__(self, other) -> Self:
+        # only defined between measured operands, as with MeasuredData
+        if (m := MeasuredArray._measured(other)) is not None:
+            return m.__pow__(self)
+
+        return NotImplemented
+
+    def sine(self) -> Self:
+        """
+        Takes the result of sin(x) on every point, with the points treated as radians
+        """
+        error = lambda s: np.abs(s * np.cos(self.value))
+
+        return MeasuredArray._of(np.sin(self.value), error(self.reading_error), error(self.standard_error))
+
+    def cosine(self) -> Self:
+        """
+        Takes the result of cos(x) on every point, with the points treated as radians
+        """
+        error = lambda s: np.abs(s * np.sin(self.value))
+
+        return MeasuredArray._of(np.cos(self.value), error(self.reading_error), error(self.standard_error))
+
+    def tangent(self) -> Self:
+        """
+        Takes the result of tan(x) on every point, with the points treated as radians
+        """
+        return self.sine() / self.cosine()
+
+    def arctan(self) -> Self:
+        """
+        Takes the result of arctan(x) on every point
+        """
+        error = lambda s: s / (1 + self.value ** 2)
+
+        return MeasuredArray._of(np.arctan(self.value), error(self.reading_error), error(self.standard_error))
+
+    def arcsin(self) -> Self:
+        """
+        Takes the result of arcsin(x) on every point
+        """
+        error = lambda s: s / np.sqrt(1 - self.value ** 2)
+
+        return MeasuredArray._of(np.arcsin(self.value), error(self.reading_error), error(self.standard_error))
+
+    def __neg__(self) -> Self:
+        return self.__mul__(-1)
+
+    def __abs__(self) -> Self:
+        return MeasuredArray._of(np.abs(self.value), self.reading_error, self.standard_error)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Lets NumPy's ufuncs (np.sin, np.sqrt, np.add, ...) work on MeasuredArrays, propagating uncertainty as the
+        methods of this class do. Mixed operations with ndarrays (e.g., ndarray + MeasuredArray) also go through here
+        """
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        return apply_ufunc(ufunc, inputs)
+
+    def __array_function__(self, func, types, args, kwargs):
+        """
+        Propagates uncertainty through np.sum, np.mean and np.concatenate, with other NumPy functions working as they
+        would on a sequence of MeasuredDatas
+        """
+        if func in array_functions:
+            return array_functions[func](*args, **kwargs)
+
+        return func(*_plain(args), **{key: _plain(value) for key, value in kwargs.items()})
+
+    def __str__(self) -> str:
+        return "[" + ", ".join(format_many(self)) + "]"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def latex(self, wrap=True) -> list[str]:
+        """
+        Converts every point into LaTeX, as MeasuredData.latex does, with the rounding of all of them worked out at
+        once
+        """
+        return latex_many(self, wrap)
+
+    def to_measured_datas(self) -> list[MeasuredData]:
+        """
+        Explodes this array into a list of MeasuredDatas, one per point
+        """
+        return [
+            MeasuredData(v, r, s)
+            for v, r, s in zip(self.value.tolist(), self.reading_error.tolist(), self.standard_error.tolist())
+        ]
+
+    @staticmethod
+    def from_measured_datas(measurements: Iterable[MeasuredDataBase]) -> Self:
+        """
+        Gathers a bunch of MeasuredDatas (e.g., from MeasuredData.from_set) into a single MeasuredArray
+
+        Examples
+        --------
+        >>> MeasuredArray.from_measured_datas([MeasuredData(1, 0.1), MeasuredData(2, 0.2, 0.3)]).standard_error
+        array([0. , 0.3])
+        """
+        measurements = list(measurements)
+
+        return MeasuredArray._of(
+            np.fromiter((x.value for x in measurements), dtype=float, count=len(measurements)),
+            np.fromiter((x.reading_error for x in measurements), dtype=float, count=len(measurements)),
+            np.fromiter((x.standard_error for x in measurements), dtype=float, count=len(measurements))
+        )
+
+    @staticmethod
+    def from_set(measurements: Iterable[float], reading_error: float, standard_error=0.0) -> Self:
+        """
+        Takes a bunch of measurements that all have the same error, and stores them as a MeasuredArray
+
+        Parameters
+        ----------
+        measurements : Iterable[float]
+            An iterable full of values to be stored
+        reading_error : float
+            The reading error that all the measurements share
+        standard_error : float
+            The standard error that all the measurements share
+
+        Returns
+        -------
+        MeasuredArray
+            A MeasuredArray holding every measurement, equivalent to the list given by MeasuredData.from_set
+        """
+        if not isinstance(measurements, np.ndarray):
+            measurements = np.fromiter(measurements, dtype=float)
+
+        return MeasuredArray(measurements, reading_error, standard_error)
+
+
+def _binary(name: str, reflected: str):
+    def apply(x, y):
+        result = getattr(x, name)(y) if isinstance(x, measured_operands) else NotImplemented
+
+        if result is NotImplemented and hasattr(y, reflected):
+            result = getattr(y, reflected)(x)
+
+        return result
+
+    return apply
+
+def _unary(name: str):
+    return lambda x: getattr(x, name)()
+
+def _comparison(ufunc):
+    # measurements are compared by their values, as MeasuredData.__eq__ and __gt__ do
+    return lambda x, y: ufunc(*(a.value if isinstance(a, measured_operands) else a for a in (x, y)))
+
+# the types (besides plain numbers and ndarrays) handled by the ufuncs below
+measured_operands = (MeasuredDataBase, MeasuredArray)
+
+# ufuncs which are given by an operator or method of both MeasuredData and MeasuredArray, so that scalars keep their
+# steps and arrays go through the array kernels
+ufuncs = {
+    np.add:      _binary("__add__", "__radd__"),
+    np.subtract: _binary("__sub__", "__rsub__"),
+    np.multiply: _binary("__mul__", "__rmul__"),
+    np.divide:   _binary("__truediv__", "__rtruediv__"),
+    np.power:    _binary("__pow__", "__rpow__"),
+    np.negative: _unary("__neg__"),
+    np.absolute: _unary("__abs__"),
+    np.sin:      _unary("sine"),
+    np.cos:      _unary("cosine"),
+    np.tan:      _unary("tangent"),
+    np.arcsin:   _unary("arcsin"),
+    np.arctan:   _unary("arctan"),
+    np.sqrt:     lambda x: x ** 0.5,
+    np.square:   lambda x: x ** 2,
+    **{ufunc: _comparison(ufunc) for ufunc in (np.less, np.less_equal, np.greater, np.greater_equal, np.equal,
+                                               np.not_equal)},
+}
+
+def apply_ufunc(ufunc, inputs: tuple):
+    """
+    Applies a ufunc to measured operands, returning NotImplemented for ufuncs (or operands) which aren't supported
+
+    Scalar MeasuredDatas mixed with arrays are treated as 0-d MeasuredArrays, so the result is a MeasuredArray.
+    """
+    if ufunc not in ufuncs or any(isinstance(x, PriorityOperand) and not isinstance(x, MeasuredArray) for x in inputs):
+        return NotImplemented
+
+    if any(np.ndim(x) > 0 for x in inputs if not isinstance(x, measured_operands)):
+        # the measured operands are broadcast up front, since their errors aren't broadcast against plain arrays
+        shape = np.broadcast_shapes(*(np.shape(x.value if isinstance(x, measured_operands) else x) for x in inputs))
+
+        inputs = tuple(
+            MeasuredArray._of(*(np.broadcast_to(a, shape) for a in (m.value, m.reading_error, m.standard_error)))
+            if (m := MeasuredArray._measured(x)) is not None else x
+            for x in inputs
+        )
+
+    # plain numbers are given to the operators as python numbers, as they would be without going through numpy
+    inputs = tuple(x.item() if isinstance(x, np.generic) or (isinstance(x, np.ndarray) and x.ndim == 0) else x
+                   for x in inputs)
+
+    return ufuncs[ufunc](*inputs)
+
+def _plain(x):
+    """
+    Replaces the MeasuredArrays in a function's arguments (or in the lists and tuples given to it) with object arrays of
+    MeasuredDatas, which NumPy's functions work on as they would on any sequence of MeasuredDatas
+    """
+    if isinstance(x, MeasuredArray):
+        return np.vectorize(MeasuredData, otypes=[object])(x.value, x.reading_error, x.standard_error)
+    if isinstance(x, (list, tuple)):
+        return type(x)(_plain(y) for y in x)
+
+    return x
+
+def _reduced(value, reading_error, standard_error) -> MeasuredData | MeasuredArray:
+    if np.ndim(value) == 0:
+        return MeasuredData(float(value), float(reading_error), float(standard_error))
+
+    return MeasuredArray._of(value, reading_error, standard_error)
+
+def _unsupported(name: str, kwargs: dict) -> None:
+    # arguments of numpy's functions which have no meaning for (or aren't worth supporting on) MeasuredArrays
+    if kwargs:
+        raise TypeError("np.{}() of a MeasuredArray doesn't support the argument(s) {}".format(
+            name, ", ".join(sorted(kwargs))
+        ))
+
+def _sum(a: MeasuredArray, axis=None, dtype=None, keepdims=False, **kwargs) -> MeasuredData | MeasuredArray:
+    _unsupported("sum", kwargs)
+    error = lambda s: np.sqrt(np.sum(s ** 2, axis=axis, dtype=dtype, keepdims=keepdims))
+
+    return _reduced(
+        np.sum(a.value, axis=axis, dtype=dtype, keepdims=keepdims), error(a.reading_error), error(a.standard_error)
+    )
+
+def _mean(a: MeasuredArray, axis=None, dtype=None, keepdims=False, **kwargs) -> MeasuredData | MeasuredArray:
+    _unsupported("mean", kwargs)
+    value = np.mean(a.value, axis=axis, dtype=dtype, keepdims=keepdims)
+
+    # the number of points averaged into each point of the result, which works for any axis (or tuple of axes)
+    count = a.value.size // max(np.size(value), 1)
+    error = lambda s: np.sqrt(np.sum(s ** 2, axis=axis, dtype=dtype, keepdims=keepdims)) / count
+
+    return _reduced(value, error(a.reading_error), error(a.standard_error))
+
+def _concatenate(arrays, axis=0, dtype=None, **kwargs) -> MeasuredArray:
+    _unsupported("concatenate", kwargs)
+
+    # scalars (measured or not) are treated as arrays of one point, rather than failing as 0-d arrays do
+    arrays = [MeasuredArray._measured(a) if isinstance(a, measured_operands) else MeasuredArray(a, 0.0)
+              for a in arrays]
+    join = lambda parts: np.concatenate([np.atleast_1d(part) for part in parts], axis=axis, dtype=dtype)
+
+    return MeasuredArray._of(
+        join([a.value for a in arrays]),
+        join([a.reading_error for a in arrays]),
+        join([a.standard_error for a in arrays])
+    )
+
+# numpy functions with their own uncertainty propagation for MeasuredArrays (or which would otherwise explode the array
+# into MeasuredDatas just to look at its shape)
+array_functions = {
+    np.sum: _sum,
+    np.mean: _mean,
+    np.concatenate: _concatenate,
+    np.shape: lambda a: a.value.shape,
+    np.ndim: lambda a: a.value.ndim,
+    np.size: lambda a, axis=None: np.size(a.value, axis),
+}
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -1,14 +1,27 @@
 
 import math
-import numpy as np
 from typing import Iterable, Self, Any
 
+from .formatting import format_measurement
+
 safe_div = lambda x, y: 0 if y == 0 else x / y
 
+class PriorityOperand:
+    """
+    Base for operand types that take priority over MeasuredDataBase in mixed binary operations
+
+    Scalar MeasuredDatas return NotImplemented when the other operand is one of these, so that the operation is handled
+    by the other operand's (reflected) method instead of treating it as a plain number
+    """
+    __slots__ = ()
+
 class MeasuredDataBase:
-    value = 0
-    reading_error = 0
-    standard_error = 0
+    __slots__ = ("value", "reading_error", "standard_error")
+
+    def __init__(self, measurement: float, reading_error: float, standard_error=0.0):
+        self.value = measurement
+        self.reading_error = reading_error
+        self.standard_error = standard_error
 
     def _new(self, measurement: float, reading_error: float, standard_error=0.0):
         return type(self)(measurement, reading_error, standard_error)
@@ -68,6 +81,9 @@ class MeasuredDataBase:
                 error(self.standard_error, other.standard_error)
             )
 
+        if isinstance(other, PriorityOperand):
+            return NotImplemented
+
         return self._new(self.value + other, self.reading_error, self.standard_error)
 
     def __radd__(self, other) -> Self:
@@ -89,6 +105,9 @@ class MeasuredDataBase:
                 error(self.standard_error, other.standard_error)
             )
 
+        if isinstance(other, PriorityOperand):
+            return NotImplemented
+
         return self._new(self.value - other, self.reading_error, self.standard_error)
 
     def __rsub__(self, other) -> Self:
@@ -103,6 +122,9 @@ class MeasuredDataBase:
                 error(other.standard_error, self.standard_error)
             )
 
+        if isinstance(other, PriorityOperand):
+            return NotImplemented
+
         return self._new(other - self.value, self.reading_error, self.standard_error)
 
     def __mul__(self, other) -> Self:
@@ -125,6 +147,9 @@ class MeasuredDataBase:
                 error(self.standard_error, other.standard_error)
             )
 
+        if isinstance(other, PriorityOperand):
+            return NotImplemented
+
         error = lambda s: (self.value * other) * safe_div(s, self.value)
 
         return self._new(self.value * other, error(self.reading_error), error(self.standard_error))
@@ -156,6 +181,9 @@ class MeasuredDataBase:
                 error(self.standard_error, other.standard_error)
             )
 
+        if isinstance(other, PriorityOperand):
+            return NotImplemented
+
         error = lambda s: (self.value / other) * safe_div(s, self.value)
 
         return self._new(self.value / other, error(self.reading_error), error(self.standard_error))
@@ -186,6 +214,9 @@ class MeasuredDataBase:
                 error(other.standard_error, self.standard_error)
             )
 
+        if isinstance(other, PriorityOperand):
+            return NotImplemented
+
         error = lambda s: (other / self.value) * safe_div(s, self.value)
 
         return self._new(other / self.value, error(self.reading_error), error(self.standard_error))
@@ -205,6 +236,9 @@ class MeasuredDataBase:
                 error(self.standard_error, other.standard_error)
             )
 
+        if isinstance(other, PriorityOperand):
+            return NotImplemented
+
         error = lambda s: abs(other * self.value ** (other - 1) * s)
 
         return self._new(
@@ -283,6 +317,19 @@ class MeasuredDataBase:
             self.standard_error
         )
 
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Lets NumPy's ufuncs (np.sin, np.sqrt, np.add, ...) be used on MeasuredDatas, giving the same result as the
+        matching method or operator. Used along with arrays, the result is a MeasuredArray
+        """
+        # imported here since md_array builds on this module
+        from .md_array import apply_ufunc
+
+        if method != "__call__" or kwargs:
+            return NotImplemented
+
+        return apply_ufunc(ufunc, inputs)
+
     def __eq__(self, other) -> bool:
         if isinstance(other, MeasuredDataBase):
             return self.value == other.value
@@ -310,23 +357,7 @@ class MeasuredDataBase:
         >>> str(MeasuredDataBase(1234.567, 543, 0))
         '1200.0±500.'
         """
-        if self.error() == 0:
-            return str(self.value)
-
-        err = np.format_float_positional(self.error(), precision=1, fractional=False)
-
-        decimal_num = 0
-        change = -1
-        for c in err[1:-1]:
-            decimal_num += change
-            if c == '.':
-                change = 1
-                decimal_num = 0
-
-        if err[-1] != '.':
-            decimal_num += change
-
-        return str(round(self.value, decimal_num)) + "±" + err
+        return format_measurement(self.value, self.error())
 
     def __repr__(self) -> str:
         return self.__str__()
@@ -345,8 +376,8 @@ class MeasuredDataBase:
         if wrap:
             return "${}$".format(formatted)
         return formatted
-    @staticmethod
-    def from_set(measurements: Iterable[float], reading_error: float, standard_error=0.0) -> list[Self]:
+    @classmethod
+    def from_set(cls, measurements: Iterable[float], reading_error: float, standard_error=0.0) -> list[Self]:
         """
         Takes a bunch of measurements that all have the same error, and converts them all into MeasuredDatas
 
@@ -365,4 +396,4 @@ class MeasuredDataBase:
             A list full of MeasuredDatas, with each one corresponding to an element from the measurements parameter,
             and the reading_error and standard_error attributes matching that which were passed as parameters
         """
-        return [MeasuredDataBase(x, reading_error, standard_error) for x in measurements]
+        return [cls(x, reading_error, standard_error) for x in measurements]
@@ -0,0 +1,171 @@
+import math
+from typing import Self
+import numpy as np
+
+from .md_base import MeasuredDataBase as md, PriorityOperand
+from .measureddata import MeasuredData
+
+def sensitivities_of(x: md) -> dict[int, tuple[float, md]]:
+    """
+    Returns the partial derivatives of x with respect to the measurements it was calculated from
+
+    The result maps the id() of each original measurement to a tuple of the derivative and the measurement itself.
+    Anything which doesn't carry its own derivatives is taken to be an original measurement, only depending on itself.
+    """
+    if isinstance(x, CorrelatedData) and x.sensitivities is not None:
+        return x.sensitivities
+    return {id(x): (1.0, x)}
+
+def _scalar(other) -> bool:
+    # arrays (and the other operands which take priority) handle operations with CorrelatedDatas themselves. numbers
+    # and measurements are checked for first, since they're by far the most common operands
+    if isinstance(other, (float, int, md)):
+        return True
+    return not isinstance(other, PriorityOperand) and np.ndim(other) == 0
+
+class CorrelatedData(MeasuredData):
+    """
+    A MeasuredData which keeps track of which original measurements it depends on, so that correlations between
+    operands are accounted for when propagating uncertainty
+
+    Attributes
+    ----------
+    sensitivities : dict[int, tuple[float, MeasuredData]] | None
+        The partial derivatives of this value with respect to every original measurement it was calculated from, keyed
+        by id() of the measurement. None for an original measurement, which only depends on itself
+
+    Notes
+    -----
+    Rather than assuming every operand is independent, the reading and standard errors of a result are taken from
+    the original measurements directly, as the square root of the sum of (derivative * error)^2 over each of them. This
+    means that, for example, x - x has no uncertainty, and x * x has twice the relative uncertainty of x. Only the
+    measurements actually involved in a calculation are kept, so the cost of each operation scales with the number of
+    inputs touched, rather than the size of the calculation so far.
+
+    Plain MeasuredDatas used as operands are treated as independent original measurements. The LaTeX steps of a
+    result still show the formulas for independent operands. Used along with arrays (or MeasuredArrays), the result
+    is a MeasuredArray, which treats the CorrelatedData as an independent measurement too.
+
+    Examples
+    --------
+    >>> x = CorrelatedData(5.0, 0.2)
+    >>> (x - x).reading_error
+    0.0
+    >>> print(x * x)
+    25.0±2.
+    """
+    __slots__ = ("sensitivities",)
+
+    def __init__(self, measurement: float, reading_error: float, standard_error=0.0):
+        super().__init__(measurement, reading_error, standard_error)
+        self.sensitivities = None
+
+    def _propagate(self, result, other, d_self: float, d_other: float = 0.0):
+        """
+        Gives result the chain of derivatives for an operation having the partial derivatives d_self and d_other with
+        respect to self and other, and recalculates its errors from them
+        """
+        if result is NotImplemented:
+            return result
+
+        # this replaces the errors calculated assuming independence
+        sensitivities = {k: (d * d_self, x) for k, (d, x) in sensitivities_of(self).items()}
+
+        if isinstance(other, md):
+            for k, (d, x) in sensitivities_of(other).items():
+                if k in sensitivities:
+                    sensitivities[k] = (sensitivities[k][0] + d * d_other, x)
+                else:
+                    sensitivities[k] = (d * d_other, x)
+
+        result.sensitivities = sensitivities
+        result.reading_error = math.sqrt(sum((d * x.reading_error) ** 2 for d, x in sensitivities.values()))
+        result.standard_error = math.sqrt(sum((d * x.standard_error) ** 2 for d, x in sensitivities.values()))
+
+        return result
+
+    def __add__(self, other) -> Self:
+        if not _scalar(other):
+            return NotImplemented
+
+        return self._propagate(super().__add__(other), other, 1.0, 1.0)
+
+    def __radd__(self, other) -> Self:
+        if not _scalar(other):
+            return NotImplemented
+
+        return self._propagate(super().__radd__(other), other, 1.0, 1.0)
+
+    def __sub__(self, other) -> Self:
+        if not _scalar(other):
+            return NotImplemented
+
+        return self._propagate(super().__sub__(other), other, 1.0, -1.0)
+
+    def __rsub__(self, other) -> Self:
+        if not _scalar(other):
+            return NotImplemented
+
+        return self._propagate(super().__rsub__(other), other, -1.0, 1.0)
+
+    def __mul__(self, other) -> Self:
+        if not _scalar(other):
+            return NotImplemented
+
+        y = float(other)
+        return self._propagate(super().__mul__(other), other, y, self.value)
+
+    def __rmul__(self, other) -> Self:
+        if not _scalar(other):
+            return NotImplemented
+
+        y = float(other)
+        return self._propagate(super().__rmul__(other), other, y, self.value)
+
+    def __truediv__(self, other) -> Self:
+        if not _scalar(other):
+            return NotImplemented
+
+        y = float(other)
+        return self._propagate(super().__truediv__(other), other, 1 / y, -self.value / y ** 2)
+
+    def __rtruediv__(self, other) -> Self:
+        if not _scalar(other):
+            return NotImplemented
+
+        y = float(other)
+        return self._propagate(super().__rtruediv__(other), other, -y / self.value ** 2, 1 / self.value)
+
+    def __pow__(self, other) -> Self:
+        if not _scalar(other):
+            return NotImplemented
+
+        x, y = self.value, float(other)
+        d_other = x ** y * math.log(x) if isinstance(other, md) and x > 0 else 0.0
+        return self._propagate(super().__pow__(other), other, y * x ** (y - 1), d_other)
+
+    def sine(self) -> Self:
+        return self._propagate(super().sine(), None, math.cos(self.value))
+
+    def cosine(self) -> Self:
+        return self._propagate(super().cosine(), None, -math.sin(self.value))
+
+    def tangent(self) -> Self:
+        return self._propagate(super().tangent(), None, 1 / math.cos(self.value) ** 2)
+
+    def arctan(self) -> Self:
+        return self._propagate(super().arctan(), None, 1 / (1 + self.value ** 2))
+
+    def arcsin(self) -> Self:
+        return self._propagate(super().arcsin(), None, 1 / math.sqrt(1 - self.value ** 2))
+
+    def __neg__(self) -> Self:
+        return self._propagate(super().__neg__(), None, -1.0)
+
+    def __abs__(self) -> Self:
+        return self._propagate(super().__abs__(), None, 1.0 if self.value >= 0 else -1.0)
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
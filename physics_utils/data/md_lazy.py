@@ -0,0 +1,202 @@
+import operator
+from typing import Any, Self
+
+from .md_base import PriorityOperand
+
+# how each kind of node is computed from its (already evaluated) operands
+operations = {
+    "add": operator.add, "sub": operator.sub, "mul": operator.mul, "truediv": operator.truediv, "pow": operator.pow,
+    "neg": operator.neg, "abs": operator.abs,
+    "sine": lambda x: x.sine(), "cosine": lambda x: x.cosine(), "tangent": lambda x: x.tangent(),
+    "arctan": lambda x: x.arctan(), "arcsin": lambda x: x.arcsin()
+}
+
+class LazyData(PriorityOperand):
+    """
+    A node in a lazily evaluated expression graph of measured values
+
+    Calculations done with a LazyData don't propagate anything right away, but instead build up a graph of the
+    operations done. Calling evaluate() then computes the graph in a single pass, where identical subexpressions are
+    only computed once, no matter how many times they were built. Each operation is still done by the values at the
+    leaves (e.g., MeasuredData.sine), so results have the same steps as if they'd been calculated right away, and the
+    only work saved is that of repeated subexpressions.
+
+    Attributes
+    ----------
+    op : str
+        The operation this node represents, or "leaf" for a wrapped value
+    operands : tuple
+        The operands of the operation, being other LazyDatas or constants. For leaves, this holds the wrapped value
+    """
+    __slots__ = ("op", "operands")
+
+    def __init__(self, op: str, operands: tuple):
+        self.op = op
+        self.operands = operands
+
+    def __add__(self, other) -> Self:
+        return LazyData("add", (self, other))
+
+    def __radd__(self, other) -> Self:
+        return LazyData("add", (other, self))
+
+    def __sub__(self, other) -> Self:
+        return LazyData("sub", (self, other))
+
+    def __rsub__(self, other) -> Self:
+        return LazyData("sub", (other, self))
+
+    def __mul__(self, other) -> Self:
+        return LazyData("mul", (self, other))
+
+    def __rmul__(self, other) -> Self:
+        return LazyData("mul", (other, self))
+
+    def __truediv__(self, other) -> Self:
+        return LazyData("truediv", (self, other))
+
+    def __rtruediv__(self, other) -> Self:
+        return LazyData("truediv", (other, self))
+
+    def __pow__(self, other) -> Self:
+        return LazyData("pow", (self, other))
+
+    def __rpow__(self, other) -> Self:
+        return LazyData("pow", (other, self))
+
+    def __neg__(self) -> Self:
+        return LazyData("neg", (self,))
+
+    def __abs__(self) -> Self:
+        return LazyData("abs", (self,))
+
+    def sine(self) -> Self:
+        return LazyData("sine", (self,))
+
+    def cosine(self) -> Self:
+        return LazyData("cosine", (self,))
+
+    def tangent(self) -> Self:
+        return LazyData("tangent", (self,))
+
+    def arctan(self) -> Self:
+        return LazyData("arctan", (self,))
+
+    def arcsin(self) -> Self:
+        return LazyData("arcsin", (self,))
+
+    def __repr__(self) -> str:
+        if self.op == "leaf":
+            return "LazyData({!r})".format(self.operands[0])
+        return "LazyData({}, {} operands)".format(self.op, len(self.operands))
+
+    def evaluate(self):
+        """
+        Computes the value of this node, returning whatever type its leaves evaluate to (e.g., a MeasuredData or a
+        MeasuredArray)
+        """
+        return evaluate(self)[0]
+
+def lazy(*values) -> LazyData | tuple[LazyData, ...]:
+    """
+    Wraps values (MeasuredDatas, MeasuredArrays or plain numbers) in LazyDatas, so that calculations done with them
+    are recorded into an expression graph instead of being computed right away
+
+    Examples
+    --------
+    >>> from physics_utils import MeasuredData
+    >>> x = lazy(MeasuredData(0.5, 0.01))
+    >>> print((x.sine() * x.sine() + x.cosine() * x.cosine()).evaluate())
+    1.0±0.008
+
+    Returns
+    -------
+    LazyData | tuple[LazyData, ...]
+        A single LazyData if a single value was given, else a tuple of them
+    """
+    wrapped = tuple(LazyData("leaf", (v,)) for v in values)
+
+    if len(wrapped) == 1:
+        return wrapped[0]
+    return wrapped
+
+def _constant_key(value) -> tuple:
+    # plain numbers are merged by value (and type, so that 2 and 2.0 stay apart), anything else by identity
+    try:
+        return "const", type(value), value, hash(value)
+    except TypeError:
+        return "const", id(value)
+
+def evaluate(*nodes: LazyData) -> list[Any]:
+    """
+    Evaluates one or more LazyDatas in a single pass over their combined graph
+
+    Every node is reduced to a key made of its operation and the keys of its operands, and nodes sharing a key are
+    only computed once. This merges identical subexpressions even when they were built separately (e.g., two calls of
+    x.sine()), and lets several results share the work they have in common.
+
+    Parameters
+    ----------
+    nodes : LazyData
+        The nodes to evaluate
+
+    Returns
+    -------
+    list
+        The value of each node, in the order they were given
+    """
+    # maps the key of every distinct subexpression (and constant) to a small integer, so that the keys of parent nodes
+    # stay flat no matter how deep the graph goes
+    key_ids = {}
+    # the key id given to every node reached, by id() of the node
+    node_keys = {}
+    # the computed value for each key id
+    results = {}
+
+    def operand_key(operand) -> int:
+        if isinstance(operand, LazyData):
+            return node_keys[id(operand)]
+
+        return key_ids.setdefault(_constant_key(operand), len(key_ids))
+
+    def operand_value(operand):
+        if isinstance(operand, LazyData):
+            return results[node_keys[id(operand)]]
+        return operand
+
+    # iterative post-order walk, so that long chains of operations don't hit the recursion limit
+    stack = [(node, False) for node in reversed(nodes)]
+
+    while stack:
+        node, expanded = stack.pop()
+
+        if id(node) in node_keys:
+            continue
+
+        if node.op == "leaf":
+            key = ("leaf", id(node.operands[0]))
+        elif not expanded:
+            stack.append((node, True))
+            stack.extend(
+                (x, False) for x in reversed(node.operands) if isinstance(x, LazyData) and id(x) not in node_keys
+            )
+            continue
+        else:
+            key = (node.op,) + tuple(operand_key(x) for x in node.operands)
+
+        if key not in key_ids:
+            key_ids[key] = len(key_ids)
+
+            if node.op == "leaf":
+                results[key_ids[key]] = node.operands[0]
+            else:
+                results[key_ids[key]] = operations[node.op](*(operand_value(x) for x in node.operands))
+
+        # if the key was already there, an identical subexpression has been computed, and this node just shares it
+        node_keys[id(node)] = key_ids[key]
+
+    return [results[node_keys[id(node)]] for node in nodes]
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
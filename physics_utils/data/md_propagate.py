@@ -0,0 +1,176 @@
+"""
+Propagation of uncertainty through arbitrary functions, using numerically estimated derivatives
+"""
+from typing import Callable
+import weakref
+import numpy as np
+
+from .md_base import MeasuredDataBase
+from .measureddata import MeasuredData
+from .md_array import MeasuredArray
+
+__all__ = ["propagate"]
+
+# the step used by the complex step method, which has no cancellation error so it can be tiny
+COMPLEX_STEP = 1e-20
+# the relative step used by central differences, balancing truncation error against rounding error
+CENTRAL_STEP = np.finfo(float).eps ** (1 / 3)
+
+# the method found to work for each function, so that it's only worked out on the first call. Functions which can't be
+# weakly referenced (e.g., ufuncs) are held normally, since there's only ever a fixed number of them
+_methods = weakref.WeakKeyDictionary()
+_fixed_methods = {}
+
+def _cached_method(fn: Callable) -> str | None:
+    try:
+        return _methods.get(fn)
+    except TypeError:
+        return _fixed_methods.get(fn)
+
+def _cache_method(fn: Callable, method: str) -> None:
+    try:
+        _methods[fn] = method
+    except TypeError:
+        _fixed_methods[fn] = method
+
+def _complex_derivative(fn: Callable, values: list[np.ndarray], i: int) -> np.ndarray | None:
+    """
+    Estimates the derivative of fn by its i-th argument using the complex step method, or returns None if fn can't take
+    complex arguments
+    """
+    args = list(values)
+    args[i] = values[i] + COMPLEX_STEP * 1j
+
+    try:
+        with np.errstate(all="ignore"):
+            result = np.asarray(fn(*args))
+    except (TypeError, ValueError):
+        return None
+
+    # functions which quietly drop the imaginary part (e.g., by converting to float) can't be used this way
+    if not np.iscomplexobj(result):
+        return None
+
+    return result.imag / COMPLEX_STEP
+
+def _central_derivative(fn: Callable, values: list[np.ndarray], i: int) -> np.ndarray:
+    """
+    Estimates the derivative of fn by its i-th argument using central differences
+    """
+    x = values[i]
+    # rounded so that the step is exactly representable, which removes one source of error
+    step = (x + CENTRAL_STEP * np.maximum(np.abs(x), 1.0)) - x
+
+    args = list(values)
+
+    with np.errstate(all="ignore"):
+        args[i] = x + step
+        above = np.asarray(fn(*args), dtype=float)
+        args[i] = x - step
+        below = np.asarray(fn(*args), dtype=float)
+
+    return (above - below) / (2 * step)
+
+def _agree(complex_derivative: np.ndarray, central_derivative: np.ndarray) -> bool:
+    """
+    Checks whether a derivative from the complex step method matches central differences to within the error of
+    central differences
+    """
+    scale = np.max(np.abs(central_derivative), initial=1.0, where=np.isfinite(central_derivative))
+
+    return np.allclose(complex_derivative, central_derivative, rtol=1e-6, atol=1e-6 * scale, equal_nan=True)
+
+def propagate(fn: Callable, *measured, method: str | None = None) -> MeasuredData | MeasuredArray:
+    """
+    Applies a function to measurements, propagating their uncertainty through it using its derivatives
+
+    The function is called on whole arrays of values at once, so it should work with NumPy arrays (e.g., np.exp, or
+    scipy.special.jv.) Its derivatives are estimated numerically, using the complex step method where the function
+    accepts complex numbers (which gives derivatives accurate to machine precision), or central differences otherwise.
+    Since the complex step method gives wrong derivatives for functions which take complex numbers but aren't complex
+    differentiable (e.g., ones using np.abs), the first call on a function checks it against central differences, and
+    only keeps using it if they agree. Which method is used is then remembered for each function.
+
+    The errors of the arguments are taken to be independent, so each error of the result is the sum in quadrature of
+    each argument's error scaled by the derivative by that argument.
+
+    Parameters
+    ----------
+    fn : Callable
+        The function to apply, taking as many arguments as are given
+    *measured : MeasuredData | MeasuredArray | float | np.ndarray
+        The arguments, which are broadcast against each other. Plain numbers and arrays are taken to be exact
+    method : str | None
+        Either "complex" or "central" to pick how derivatives are estimated, or None to pick automatically
+
+    Returns
+    -------
+    MeasuredData | MeasuredArray
+        The result, as a MeasuredData if every argument is a single value, or a MeasuredArray otherwise
+
+    Examples
+    --------
+    >>> print(propagate(np.exp, MeasuredData(1.0, 0.1)))
+    2.7±0.3
+    >>> print(propagate(np.hypot, MeasuredArray([3.0, 5.0], 0.1), 4.0))
+    [5.0±0.06, 6.4±0.08]
+    """
+    if method not in (None, "complex", "central"):
+        raise ValueError("Unknown method \"{}\", expected \"complex\" or \"central\"".format(method))
+
+    is_measured = [isinstance(x, (MeasuredDataBase, MeasuredArray)) for x in measured]
+
+    values = np.broadcast_arrays(*(
+        np.asarray(x.value if m else x, dtype=float) for x, m in zip(measured, is_measured)
+    ))
+    shape = values[0].shape if values else ()
+
+    with np.errstate(all="ignore"):
+        result = np.asarray(fn(*values), dtype=float)
+
+    reading_error = np.zeros(np.broadcast_shapes(result.shape, shape))
+    standard_error = np.zeros_like(reading_error)
+
+    choice = method or _cached_method(fn)
+    # whether the complex step method still has to be checked against central differences
+    checking = choice is None
+
+    for i, x in enumerate(measured):
+        # exact arguments (and measurements without any error) don't add to the error
+        if not is_measured[i] or not (np.any(x.reading_error) or np.any(x.standard_error)):
+            continue
+
+        derivative = None
+
+        if choice != "central":
+            derivative = _complex_derivative(fn, values, i)
+
+            if derivative is None and method == "complex":
+                raise ValueError("Cannot use the complex step method, since the function doesn't take complex numbers")
+
+        if checking:
+            central = _central_derivative(fn, values, i)
+
+            if derivative is None or not _agree(derivative, central):
+                derivative, choice = central, "central"
+            else:
+                choice = "complex"
+        elif derivative is None:
+            derivative = _central_derivative(fn, values, i)
+
+        reading_error += (derivative * x.reading_error) ** 2
+        standard_error += (derivative * x.standard_error) ** 2
+
+    if checking and choice is not None:
+        _cache_method(fn, choice)
+
+    reading_error, standard_error = np.sqrt(reading_error), np.sqrt(standard_error)
+
+    if reading_error.ndim == 0:
+        return MeasuredData(float(result), float(reading_error), float(standard_error))
+
+    return MeasuredArray._of(np.broadcast_to(result, reading_error.shape).copy(), reading_error, standard_error)
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+from typing import NamedTuple
 from .md_base import MeasuredDataBase as md
 
 class VariableLabel:
@@ -11,206 +13,219 @@ var_letters = ['x', 'y', 'z', 'w', 'a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i',
 self_mapping_var_letters = {x: x for x in var_letters}
 self_mapping_var_letters.update({"s_" + x: "s_" + x for x in var_letters})
 
+# whether calculations on MeasuredDatas keep their LaTeX steps
+_tracking = True
+# the StepTape steps are currently being recorded onto (see md_tape.recording), or None to keep them on the results
+_tape = None
+
+def tracking_steps() -> bool:
+    """
+    Returns whether calculations on MeasuredDatas currently keep their LaTeX steps
+    """
+    return _tracking
+
+def track_steps(enabled: bool) -> None:
+    """
+    Globally turns the keeping of LaTeX steps for calculations on MeasuredDatas on or off
+
+    With steps turned off, results are only given their value and uncertainty, skipping all the bookkeeping needed by
+    the all_steps_* methods. Any value calculated while steps are off is treated as a plain measurement by them.
+    """
+    global _tracking
+    _tracking = enabled
+
+@contextmanager
+def no_steps():
+    """
+    Turns off the keeping of LaTeX steps for the calculations done inside a with block
+
+    Examples
+    --------
+    >>> from physics_utils import MeasuredData
+    >>> with no_steps():
+    ...     result = MeasuredData(2, 0.5) * MeasuredData(3, 0.4)
+    >>> result.has_steps
+    False
+    """
+    global _tracking
+
+    previous = _tracking
+    _tracking = False
+
+    try:
+        yield
+    finally:
+        _tracking = previous
+
+class Step(NamedTuple):
+    """
+    The LaTeX templates describing an operation done on MeasuredDatas
+    """
+    value: str
+    uncertainty: str
+    # these are for deciding if parentheses should put around these equations when forming composites
+    value_wrapped: bool
+    uncertainty_wrapped: bool
+
+# operations taking two operands have two forms, depending on if the other operand is a MeasuredData or a plain number
+ADD        = Step(r"@x@+@y@", r"\sqrt{@s_x@^2+@s_y@^2}", True, False)
+ADD_PLAIN  = Step(r"@x@+@y@", r"@s_x@", True, False)
+RADD       = Step(r"@y@+@x@", r"\sqrt{@s_y@^2+@s_x@^2}", True, False)
+RADD_PLAIN = Step(r"@y@+@x@", r"@s_x@", True, False)
+SUB        = Step(r"@x@-@y@", r"\sqrt{@s_x@^2+@s_y@^2}", False, False)
+SUB_PLAIN  = Step(r"@x@-@y@", r"@s_x@", False, False)
+MUL        = Step(r"@x@\cdot@y@", r"@x@\cdot@y@\sqrt{\frac{@s_x@}{@x@}^2+\frac{@s_y@}{@y@}^2}", False, True)
+MUL_PLAIN  = Step(r"@x@\cdot@y@", r"@s_x@\cdot@y@", False, True)
+RMUL       = Step(r"@y@\cdot@x@", r"@x@\cdot@y@\sqrt{\frac{@s_y@}{@y@}^2+\frac{@s_x@}{@x@}^2}", False, True)
+RMUL_PLAIN = Step(r"@y@\cdot@x@", r"@s_x@\cdot@y@", False, True)
+DIV        = Step(r"\frac{@x@}{@y@}", r"@x@\cdot@y@\sqrt{\frac{@s_x@}{@x@}^2+\frac{@s_y@}{@y@}^2}", True, True)
+DIV_PLAIN  = Step(r"\frac{@x@}{@y@}", r"\frac{@s_x@}{@y@}", True, True)
+POW        = Step(r"@x@^{@y@}", r"\left|@y@\cdot@s_x@\cdot@x@^{@y@ - 1}\right|", False, False)
+SINE       = Step(r"\sin @x@", r"\left|@s_x@ \cos @x@\right|", False, False)
+COSINE     = Step(r"\cos @x@", r"\left|@s_x@ \sin @x@\right|", False, False)
+TANGENT    = Step(r"\tan @x@", r"\left|@s_x@ \sec @x@^2\right|", False, False)
+ARCTAN     = Step(r"\arctan @x@", r"\frac{@s_x@}{1+@x@^2}", False, False)
+ARCSIN     = Step(r"\arcsin @x@", r"\frac{@s_x@}{\sqrt{1-@x@^2}}", False, False)
+NEG        = Step(r"-@x@", r"@s_x@", False, False)
+ABS        = Step(r"\left|@x@\right|", r"@s_x@", False, False)
+
 class StepsExtension(md):
     """
     The (latex-extended) MeasuredData class creates a data point which automatically propagates uncertainty with
     every calculation done with, and keeps a log of every value and uncertainty calculation, allowing for generation
     of LaTeX equations demonstrating the evaluation of the object's state.
     """
-    value_step = uncertainty_step = step_variables = None
-    values_wrapped = uncertainty_wrapped = has_steps = False
-    label = None
-
-    def _new(self, measurement: float, reading_error: float, standard_error=0.0,
-             value_step=None, uncertainty_step=None, step_variables=None,
-             value_wrapped=False, uncertainty_wrapped=False):
-        result = super()._new(measurement, reading_error, standard_error)
-
-        result.value_step = value_step
-        result.uncertainty_step = uncertainty_step
-        result.has_steps = value_step and uncertainty_step
-        result.step_variables = step_variables
-        # these are for deciding if parentheses should put around these equations when forming composites
-        result.value_wrapped = value_wrapped
-        result.uncertainty_wrapped = uncertainty_wrapped
+    # the templates of a step are shared between every result of the same operation, so each data point only holds
+    # a reference to them and to its operands. results recorded onto a StepTape instead hold the tape and their index
+    # on it, and are weakly referenced by the tape
+    __slots__ = ("step", "step_variables", "label", "tape", "tape_index", "__weakref__")
 
-        return result
+    def __init__(self, measurement: float, reading_error: float, standard_error=0.0):
+        super().__init__(measurement, reading_error, standard_error)
+
+        self.step = self.step_variables = self.label = self.tape = None
+
+    @property
+    def has_steps(self) -> bool:
+        return self.step is not None
+
+    def _operands(self) -> tuple:
+        """
+        Returns the operands of the step done to get this MeasuredData, rebuilding them from its tape if it has one
+        """
+        if self.tape is None:
+            return self.step_variables
+        return self.tape.materialize(self.tape_index).step_variables
+
+    @property
+    def value_step(self) -> str | None:
+        return None if self.step is None else self.step.value
+
+    @property
+    def uncertainty_step(self) -> str | None:
+        return None if self.step is None else self.step.uncertainty
+
+    @property
+    def value_wrapped(self) -> bool:
+        return self.step is not None and self.step.value_wrapped
+
+    @property
+    def uncertainty_wrapped(self) -> bool:
+        return self.step is not None and self.step.uncertainty_wrapped
 
-    # for the most part, just overriding methods on the physics_tools MeasuredData to add LaTeX templates
+    # for the most part, just overriding methods on the physics_tools MeasuredData to add LaTeX templates. results
+    # are only given their steps while steps are being tracked, and are otherwise returned as they come
 
     def __add__(self, other):
-        return self._new(
-            (result := super().__add__(other)).value,
-            result.reading_error,
-            result.standard_error,
-            r"@x@+@y@",
-            r"\sqrt{@s_x@^2+@s_y@^2}" if isinstance(other, md) else r"@s_x@",
-            [self, other],
-            True,
-            False
-        )
+        result = super().__add__(other)
+
+        if _tracking and result is not NotImplemented:
+            result.step = ADD if isinstance(other, md) else ADD_PLAIN
+            result.step_variables = (self, other) if _tape is None else _tape.record(result, self, other)
+
+        return result
 
     def __radd__(self, other):
-        return self._new(
-            (result := super().__radd__(other)).value,
-            result.reading_error,
-            result.standard_error,
-            r"@y@+@x@",
-            r"\sqrt{@s_y@^2+@s_x@^2}" if isinstance(other, md) else r"@s_x@",
-            [self, other],
-            True,
-            False
-        )
+        result = super().__radd__(other)
+
+        if _tracking and result is not NotImplemented:
+            result.step = RADD if isinstance(other, md) else RADD_PLAIN
+            result.step_variables = (self, other) if _tape is None else _tape.record(result, self, other)
+
+        return result
 
     def __sub__(self, other):
-        return self._new(
-            (result := super().__sub__(other)).value,
-            result.reading_error,
-            result.standard_error,
-            r"@x@-@y@",
-            r"\sqrt{@s_x@^2+@s_y@^2}"  if isinstance(other, md) else r"@s_x@",
-            [self, other],
-            False,
-            False
-        )
+        result = super().__sub__(other)
+
+        if _tracking and result is not NotImplemented:
+            result.step = SUB if isinstance(other, md) else SUB_PLAIN
+            result.step_variables = (self, other) if _tape is None else _tape.record(result, self, other)
+
+        return result
 
     def __mul__(self, other):
-        return self._new(
-            (result := super().__mul__(other)).value,
-            result.reading_error,
-            result.standard_error,
-            r"@x@\cdot@y@",
-            r"@x@\cdot@y@\sqrt{\frac{@s_x@}{@x@}^2+\frac{@s_y@}{@y@}^2}" if isinstance(other, md) else
-            r"@s_x@\cdot@y@",
-            [self, other],
-            False,
-            True
-        )
+        result = super().__mul__(other)
+
+        if _tracking and result is not NotImplemented:
+            result.step = MUL if isinstance(other, md) else MUL_PLAIN
+            result.step_variables = (self, other) if _tape is None else _tape.record(result, self, other)
+
+        return result
 
     def __rmul__(self, other):
-        return self._new(
-            (result := super().__rmul__(other)).value,
-            result.reading_error,
-            result.standard_error,
-            r"@y@\cdot@x@",
-            r"@x@\cdot@y@\sqrt{\frac{@s_y@}{@y@}^2+\frac{@s_x@}{@x@}^2}" if isinstance(other, md) else
-            r"@s_x@\cdot@y@",
-            [self, other],
-            False,
-            True
-        )
+        result = super().__rmul__(other)
+
+        if _tracking and result is not NotImplemented:
+            result.step = RMUL if isinstance(other, md) else RMUL_PLAIN
+            result.step_variables = (self, other) if _tape is None else _tape.record(result, self, other)
+
+        return result
 
     def __truediv__(self, other):
-        return self._new(
-            (result := super().__truediv__(other)).value,
-            result.reading_error,
-            result.standard_error,
-            r"\frac{@x@}{@y@}",
-            r"@x@\cdot@y@\sqrt{\frac{@s_x@}{@x@}^2+\frac{@s_y@}{@y@}^2}" if isinstance(other, md) else
-            r"\frac{@s_x@}{@y@}",
-            [self, other],
-            True,
-            True
-        )
+        result = super().__truediv__(other)
+
+        if _tracking and result is not NotImplemented:
+            result.step = DIV if isinstance(other, md) else DIV_PLAIN
+            result.step_variables = (self, other) if _tape is None else _tape.record(result, self, other)
+
+        return result
 
     def __pow__(self, other: int):
-        return self._new(
-            (result := super().__pow__(other)).value, # abs(other * self.value ** (other - 1) * s)
-            result.reading_error,
-            result.standard_error,
-            r"@x@^{@y@}",
-            r"\left|@y@\cdot@s_x@\cdot@x@^{@y@ - 1}\right|",
-            [self, other],
-            False,
-            False
-
-        )
+        result = super().__pow__(other)
+
+        if _tracking and result is not NotImplemented:
+            result.step = POW
+            result.step_variables = (self, other) if _tape is None else _tape.record(result, self, other)
+
+        return result
 
     def sine(self):
-        return self._new(
-            (result := super().sine()).value,  # abs(s * math.cos(self.value))
-            result.reading_error,
-            result.standard_error,
-            r"\sin @x@",
-            r"\left|@s_x@ \cos @x@\right|",
-            [self],
-            False,
-            False
-        )
+        return self._unary_step(super().sine(), SINE)
 
     def cosine(self):
-        return self._new(
-            (result := super().cosine()).value,
-            result.reading_error,
-            result.standard_error,
-            r"\cos @x@",
-            r"\left|@s_x@ \sin @x@\right|",
-            [self],
-            False,
-            False
-        )
+        return self._unary_step(super().cosine(), COSINE)
 
     def tangent(self):
-        return self._new(
-            (result := super().tangent()).value,
-            result.reading_error,
-            result.standard_error,
-            r"\tan @x@",
-            r"\left|@s_x@ \sec @x@^2\right|",
-            [self],
-            False,
-            False
-        )
+        return self._unary_step(super().tangent(), TANGENT)
 
     def arctan(self):
-        # s / (1 + self.value ** 2)
-        return self._new(
-            (result := super().arctan()).value,
-            result.reading_error,
-            result.standard_error,
-            r"\arctan @x@",
-            r"\frac{@s_x@}{1+@x@^2}",
-            [self],
-            False,
-            False
-        )
+        return self._unary_step(super().arctan(), ARCTAN)
 
     def arcsin(self):
-        # s / math.sqrt(1 - self.value ** 2)
-        return self._new(
-            (result := super().arcsin()).value,
-            result.reading_error,
-            result.standard_error,
-            r"\arcsin @x@",
-            r"\frac{@s_x@}{\sqrt{1-@x@^2}}",
-            [self],
-            False,
-            False
-        )
+        return self._unary_step(super().arcsin(), ARCSIN)
 
     def __neg__(self):
-        return self._new(
-            (result := super().__neg__()).value,
-            result.reading_error,
-            result.standard_error,
-            r"-@x@",
-            r"@s_x@",
-            [self],
-            False,
-            False
-        )
+        return self._unary_step(super().__neg__(), NEG)
 
     def __abs__(self):
-        return self._new(
-            (result := super().__abs__()).value,
-            result.reading_error,
-            result.standard_error,
-            r"\left|@x@\right|",
-            r"@s_x@",
-            [self],
-            False,
-            False
-        )
+        return self._unary_step(super().__abs__(), ABS)
+
+    def _unary_step(self, result, step: Step):
+        if _tracking:
+            result.step = step
+            result.step_variables = (self,) if _tape is None else _tape.record(result, self)
+
+        return result
 
     # from here on out, we have some latex_extension unique methods for MeasuredData
 
@@ -240,7 +255,13 @@ class StepsExtension(md):
         if plug_in_vars:
             md_p = lambda x: isinstance(x, StepsExtension) # measured data predicate (i.e., is measured data)
             md_s = lambda x: str(x).split("±") if "±" in str(x) else (str(x), "0") # measured data split
-            en_v = lambda: enumerate(self.step_variables) # enumerate (step) variables
+            # only the operands themselves are needed here, not how they were calculated
+            if self.tape is None:
+                variables = self.step_variables
+            else:
+                variables = self.tape.materialize(self.tape_index, 1).step_variables
+
+            en_v = lambda: enumerate(variables) # enumerate (step) variables
 
             if trunc_nums:
                 norm_vars = {var_letters[i]: md_s(v)[0] for i, v in en_v() if md_p(v)}
@@ -261,6 +282,9 @@ class StepsExtension(md):
         """
         Returns the steps to calculate this MeasuredData as lists of steps written in LaTeX
 
+        A MeasuredData used in several places of the calculation only has its step given once, before any of the steps
+        using it.
+
         Parameters
         ----------
         self : MeasuredData
@@ -277,25 +301,15 @@ class StepsExtension(md):
             element being a list of steps for calculating the uncertainty, and the third element a list containing
             the value of the MeasuredData object at each of these steps.
         """
-        value_steps       = []
-        uncertainty_steps = []
-        data_points       = []
-
-        # recursively add steps of any previously calculated MeasuredDatas to step lists
-        def apnd_step(dp: StepsExtension):
-            value_steps.append(dp.recent_step(True, plug_in_vars, trunc_nums))
-            uncertainty_steps.append(dp.recent_step(False, plug_in_vars, trunc_nums))
-
-            data_points.append(dp)
+        # every calculated MeasuredData this was calculated from, each once, and after everything it depends on. the
+        # operands of each are walked right to left so that, for a tree of calculations, this is exactly the reverse of
+        # the order they're first reached in when going from this MeasuredData back to the measurements
+        data_points = [dp for dp, _ in walk_steps(self, reverse=True) if dp.has_steps or dp is self]
 
-            for sdp in dp.step_variables:
-                if isinstance(sdp, StepsExtension) and sdp.has_steps:
-                    apnd_step(sdp)
+        value_steps       = [dp.recent_step(True, plug_in_vars, trunc_nums) for dp in data_points]
+        uncertainty_steps = [dp.recent_step(False, plug_in_vars, trunc_nums) for dp in data_points]
 
-        apnd_step(self)
-
-        # reverse step lists so that earliest steps are first
-        return value_steps[::-1], uncertainty_steps[::-1], data_points
+        return value_steps, uncertainty_steps, data_points[::-1]
 
     def all_steps_composite(self, plug_in_vars=True, trunc_nums=True) -> tuple[str, str]:
         """
@@ -317,66 +331,142 @@ class StepsExtension(md):
             being an equation to calculate the uncertainty.
         """
         seen_variables = {}
+        # the value and uncertainty equations of every MeasuredData reached, by id(), so that one which was used in
+        # several places is only expanded once
+        equations = {}
 
-        def expand_eqs(dp: StepsExtension) -> tuple[object, object]:
-            nonlocal seen_variables
-
-            md_p = lambda x: isinstance(x, StepsExtension)  # measured data predicate (i.e., is measured data)
-            md_s = lambda x: str(x).split("±") if "±" in str(x) else (str(x), "0")   # measured data split
-            en_v = lambda: enumerate(dp.step_variables)  # enumerate (step) variables
+        md_p = lambda x: isinstance(x, StepsExtension)  # measured data predicate (i.e., is measured data)
+        md_s = lambda x: str(x).split("±") if "±" in str(x) else (str(x), "0")   # measured data split
 
+        # operands are always expanded before the calculations using them, and measurements are reached in the same
+        # order as they appear from left to right in the equations, which is the order they're given letters in
+        for dp, operands in walk_steps(self):
             if not dp.has_steps:
                 if plug_in_vars:
                     if trunc_nums:
                         val, err = md_s(dp)
-                        return float(val), float(err)
+                        equations[id(dp)] = float(val), float(err)
                     else:
-                        return dp.value, dp.error()
+                        equations[id(dp)] = dp.value, dp.error()
                 else:
                     if id(dp) not in seen_variables:
                         seen_variables[id(dp)] = var_letters[len(seen_variables)] if dp.label is None else dp.label
 
-                    return (VariableLabel(" {} ".format(seen_variables[id(dp)])),
-                            VariableLabel(" s_{} ".format(seen_variables[id(dp)])))
+                    equations[id(dp)] = (VariableLabel(" {} ".format(seen_variables[id(dp)])),
+                                         VariableLabel(" s_{} ".format(seen_variables[id(dp)])))
+                continue
+
+            en_v = lambda: enumerate(operands)  # enumerate (step) variables
 
-            norm_vars = {var_letters[i]: expand_eqs(v)[0] for i, v in en_v() if md_p(v)}
+            norm_vars = {var_letters[i]: equations[id(v)][0] for i, v in en_v() if md_p(v)}
             norm_vars.update({var_letters[i]: v for i, v in en_v() if not md_p(v)})
-            err_vars = {"s_" + var_letters[i]: expand_eqs(v)[1] for i, v in en_v() if md_p(v)}
+            err_vars = {"s_" + var_letters[i]: equations[id(v)][1] for i, v in en_v() if md_p(v)}
 
             vals = norm_vars
             vals.update(err_vars)
 
-            return (at_format(dp.value_step, vals, dp.value_wrapped),
-                    at_format(dp.uncertainty_step, vals, dp.uncertainty_wrapped))
+            # the equations of the operands are nested as they are, and only joined into text at the very end
+            equations[id(dp)] = (_render(dp.value_step, vals, dp.value_wrapped),
+                                 _render(dp.uncertainty_step, vals, dp.uncertainty_wrapped))
 
-        value_eq, error_eq = expand_eqs(self)
-        return value_eq, error_eq
+        value_eq, error_eq = equations[id(self)]
+        return str(value_eq), str(error_eq)
 
-def at_format(s: str, vals: dict[str, md | float | str], abhor_parentheses=False):
+def walk_steps(root: StepsExtension, reverse=False) -> list[tuple[StepsExtension, tuple]]:
     """
-    Formats a string, replacing variables wrapped in @'s with values from a dict
+    Returns root and every MeasuredData it was calculated from, with each appearing once, and only after all of the
+    MeasuredDatas it was calculated from
+
+    The calculations are walked depth first without recursion, so there's no limit on how long a chain of them can be,
+    and a MeasuredData used in several places is only walked through once. Each MeasuredData is paired with the operands
+    of its step, which for results recorded onto a StepTape are rebuilt from the tape.
+
+    Parameters
+    ----------
+    root : StepsExtension
+        The MeasuredData to start from
+    reverse : bool
+        If true, the operands of each calculation are walked from right to left rather than from left to right
+    """
+    order    = []
+    done     = set()
+    operands = {}
+    stack    = [(root, False)]
 
-    Needed, since the built-in formatting methods do not play well with LaTeX (would either require an obscene number
-    of backslashes, or don't work with certain important characters.)
+    while stack:
+        dp, expanded = stack.pop()
 
-    >>> at_format("@hi@", {"hi": 7})
-    '7'
-    >>> at_format("The value is @x@", {"x": MeasuredData(0.77, 0.5)})
-    'The value is 0.8 \\\\pm 0.5'
-    """
-    assert s.count("@") & 1 == 0
+        if id(dp) in done:
+            continue
+
+        if expanded or not dp.has_steps:
+            done.add(id(dp))
+            order.append((dp, operands.get(id(dp), ())))
+            continue
+
+        stack.append((dp, True))
+
+        operands[id(dp)] = dp._operands()
+        measured = [v for v in operands[id(dp)] if isinstance(v, StepsExtension) and id(v) not in done]
+        stack.extend((v, False) for v in (measured if reverse else reversed(measured)))
 
-    formatted = ""
+    return order
 
-    while (x := s.find("@")) != -1:
-        formatted += s[:x]
+# the parsed form of every template given to at_format so far, keyed by the template itself
+_templates = {}
 
-        s = s[x+1:]
-        x = s.find("@")
+def _compile_template(s: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Splits a template into the text between its variables, and the names of its variables
+
+    There is always one more piece of text than there are variables, since the text before the first variable and after
+    the last one are both included (even if they're empty.)
+    """
+    if s not in _templates:
+        parts = s.split("@")
 
-        if x == -1:
+        if len(parts) % 2 == 0:
             raise ValueError("Expected another @ symbol!")
-        if (v := s[:x]) not in vals:
+
+        _templates[s] = tuple(parts[::2]), tuple(parts[1::2])
+
+    return _templates[s]
+
+class _Equation(list):
+    """
+    An equation built up by at_format, made of strings and of other _Equations
+
+    Equations containing others hold onto them rather than copying their text, so that nesting equations inside one
+    another (as all_steps_composite does) doesn't take time proportional to the size of everything nested so far. They
+    are only joined into a single string once, at the end.
+    """
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        pieces = []
+        stack = [iter(self)]
+
+        while stack:
+            for piece in stack[-1]:
+                if isinstance(piece, _Equation):
+                    stack.append(iter(piece))
+                    break
+
+                pieces.append(piece)
+            else:
+                stack.pop()
+
+        return "".join(pieces)
+
+def _render(s: str, vals: dict[str, md | float | str], abhor_parentheses=False) -> _Equation:
+    """
+    Formats a string as at_format does, without joining the result into a single string
+    """
+    text, names = _compile_template(s)
+    equation = _Equation((text[0],))
+
+    for v, after in zip(names, text[1:]):
+        if v not in vals:
             raise ValueError(v + " is not in vals")
 
         val = vals[v]
@@ -384,19 +474,36 @@ def at_format(s: str, vals: dict[str, md | float | str], abhor_parentheses=False
         # being a string indicates it's a compound equation
         # (or could be a compound equation). Thus, we wrap
         # in parentheses for safety
-        if isinstance(val, str) and not abhor_parentheses: formatted += r"\left("
-
+        if isinstance(val, (str, _Equation)):
+            if abhor_parentheses:
+                equation.append(val)
+            else:
+                equation += (r"\left(", val, r"\right)")
         # for measured datas, make sure outputting in latex rep
-        if isinstance(val, md):
-            formatted += val.latex().replace("$", "")
+        elif isinstance(val, md):
+            equation.append(val.latex().replace("$", ""))
         else:
-            formatted += str(val)
+            equation.append(str(val))
+
+        equation.append(after)
+
+    return equation
 
-        if isinstance(val, str) and not abhor_parentheses: formatted += r"\right)"
+def at_format(s: str, vals: dict[str, md | float | str], abhor_parentheses=False):
+    """
+    Formats a string, replacing variables wrapped in @'s with values from a dict
 
-        s = s[x+1:]
+    Needed, since the built-in formatting methods do not play well with LaTeX (would either require an obscene number
+    of backslashes, or don't work with certain important characters.) Each template is only parsed the first time it's
+    used.
 
-    return formatted + s
+    >>> at_format("@hi@", {"hi": 7})
+    '7'
+    >>> from physics_utils import MeasuredData
+    >>> at_format("The value is @x@", {"x": MeasuredData(0.77, 0.5)})
+    'The value is 0.8 \\\\pm 0.5'
+    """
+    return str(_render(s, vals, abhor_parentheses))
 
 if __name__ == "__main__":
     import doctest
@@ -0,0 +1,388 @@
+"""
+Compact recording of the steps of calculations, for keeping the memory used by long running calculations bounded
+"""
+from array import array
+from contextlib import contextmanager
+import heapq
+import weakref
+
+from . import md_steps
+from .md_base import MeasuredDataBase as md
+from .md_steps import StepsExtension, walk_steps, ADD, ADD_PLAIN, RADD, RADD_PLAIN, SUB, SUB_PLAIN, MUL, MUL_PLAIN, RMUL, \
+    RMUL_PLAIN, DIV, DIV_PLAIN, POW, SINE, COSINE, TANGENT, ARCTAN, ARCSIN, NEG, ABS
+
+__all__ = ["StepTape", "recording"]
+
+# rows of a tape which aren't the result of a step hold either a measurement or a plain number
+LEAF, CONSTANT = 0, 1
+
+# the op code of each step is its index here
+steps = (None, None, ADD, ADD_PLAIN, RADD, RADD_PLAIN, SUB, SUB_PLAIN, MUL, MUL_PLAIN, RMUL, RMUL_PLAIN, DIV, DIV_PLAIN,
+         POW, SINE, COSINE, TANGENT, ARCTAN, ARCSIN, NEG, ABS)
+# looked up by id() since it's much faster than hashing the templates
+op_codes = {id(step): code for code, step in enumerate(steps) if step is not None}
+
+class StepTape:
+    """
+    Holds the steps of calculations on MeasuredDatas in flat arrays, rather than as references between the results
+
+    Every result recorded onto a tape only holds the tape and its row on it, so keeping a result alive doesn't keep
+    every MeasuredData it was calculated from alive with it. Each row holds an op code, the rows of its operands, and
+    the value and errors of the result. Measurements and plain numbers used as operands get rows of their own, and
+    results recorded onto another tape are copied onto this one along with their history, so measurements only ever
+    belong to the tapes of the results calculated from them, rather than being changed by recording.
+
+    Rows which can't be reached from a result that's still alive are dropped every so often, with how far back the
+    history of a live result is kept depending on the retention policy of the tape:
+
+    - by default, everything a live result was calculated from is kept
+    - with levels given, only that many steps of the history of a live result are kept, with the values further back
+      being kept as plain measurements
+    - with labels, a labelled result (e.g., a variable assigned to in a script) is recorded as a plain measurement when
+      used as an operand, so the history of each labelled value starts over
+
+    Tapes are made by the recording context manager.
+
+    Attributes
+    ----------
+    levels : int | None
+        The number of steps of history kept for each live result, or None to keep all of them
+    labels : bool
+        Whether labelled results are recorded as plain measurements when used as operands
+    """
+    # the size the tape has to reach before it's first compacted
+    min_compaction = 1024
+
+    def __init__(self, levels: int | None = None, labels=False):
+        if levels is not None and levels < 1:
+            raise ValueError("At least one level of steps must be kept")
+
+        self.levels = levels
+        self.labels = labels
+
+        self.ops    = array("B")
+        self.left   = array("i")
+        self.right  = array("i")
+        self.values = array("d")
+        self.reading_errors  = array("d")
+        self.standard_errors = array("d")
+
+        # for the row of a result, a weak reference to it (or None once it's gone), and for the row of a leaf or
+        # constant, the object it holds
+        self._refs = []
+        # the exact value of results whose value isn't a float, by row
+        self._exact_values = {}
+        # the row of every measurement held by a leaf, by id()
+        self._leaf_rows = {}
+        # the row of every result copied into a leaf, by id(), along with a weak reference to the result
+        self._copied_rows = {}
+
+        self._compact_at = self.min_compaction
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes taken up by the arrays of the tape (not counting the objects held by its leaves)
+        """
+        return sum(
+            len(a) * a.itemsize
+            for a in (self.ops, self.left, self.right, self.values, self.reading_errors, self.standard_errors)
+        )
+
+    def _append(self, op: int, left: int, right: int, value: float, reading_error: float, standard_error: float,
+                ref) -> int:
+        self.ops.append(op)
+        self.left.append(left)
+        self.right.append(right)
+        self.values.append(value)
+        self.reading_errors.append(reading_error)
+        self.standard_errors.append(standard_error)
+        self._refs.append(ref)
+
+        return len(self._refs) - 1
+
+    def _leaf(self, x: md) -> int:
+        if isinstance(x, StepsExtension) and x.has_steps and x.tape is not None:
+            # results kept track of elsewhere (or labelled results, when those start a new history) are copied, so
+            # that holding them doesn't keep their history alive
+            if id(x) in self._copied_rows:
+                ref, row = self._copied_rows[id(x)]
+
+                if ref() is x:
+                    return row
+
+            if x.tape is not self and not (self.labels and x.label is not None):
+                row = self._history(x)
+            else:
+                copy = StepsExtension(x.value, x.reading_error, x.standard_error)
+                copy.label = x.label
+
+                row = self._append(LEAF, -1, -1, _float(x.value), x.reading_error, x.standard_error, copy)
+
+            self._copied_rows[id(x)] = weakref.ref(x), row
+
+            return row
+
+        # measurements are found again by id() when used as an operand more than once, rather than being marked as
+        # being on the tape, which would change them for any other tape they're used on. the row holds the
+        # measurement, so its id() can't be reused while the row is still around
+        if id(x) not in self._leaf_rows:
+            self._leaf_rows[id(x)] = self._append(LEAF, -1, -1, _float(x.value), x.reading_error, x.standard_error, x)
+
+        return self._leaf_rows[id(x)]
+
+    def _history(self, x: StepsExtension) -> int:
+        """
+        Copies a result recorded onto another tape onto this one, along with as much of its history as this tape keeps,
+        and returns the row of the copy
+        """
+        rows = {}
+
+        def row_of(operand) -> int:
+            return rows[id(operand)] if id(operand) in rows else self._operand(operand)
+
+        for dp, operands in walk_steps(x.tape.materialize(x.tape_index, self.levels)):
+            if not dp.has_steps:
+                rows[id(dp)] = self._operand(dp)
+                continue
+
+            # rebuilt results don't belong to anything, so they're only kept while results on this tape use them
+            row = rows[id(dp)] = self._append(
+                op_codes[id(dp.step)], row_of(operands[0]), row_of(operands[1]) if len(operands) > 1 else -1,
+                _float(dp.value), dp.reading_error, dp.standard_error, None
+            )
+
+            if type(dp.value) is not float:
+                self._exact_values[row] = dp.value
+
+        # the result itself comes last, after everything it was calculated from
+        return row
+
+    def _operand(self, x) -> int:
+        if isinstance(x, StepsExtension) and x.tape is self and not (self.labels and x.label is not None):
+            return x.tape_index
+
+        if isinstance(x, md):
+            return self._leaf(x)
+
+        return self._append(CONSTANT, -1, -1, _float(x), 0.0, 0.0, x)
+
+    def record(self, result: StepsExtension, *operands) -> None:
+        """
+        Records the step done to get result, which has already been given its step, onto the tape
+
+        Returns None, so that it can stand in for the operands which would otherwise be given to result.
+        """
+        left  = self._operand(operands[0])
+        right = self._operand(operands[1]) if len(operands) > 1 else -1
+
+        value = result.value
+
+        result.tape = self
+        result.tape_index = row = self._append(
+            op_codes[id(result.step)], left, right, _float(value), result.reading_error, result.standard_error,
+            weakref.ref(result)
+        )
+
+        if type(value) is not float:
+            self._exact_values[row] = value
+
+        if row + 1 >= self._compact_at:
+            self.compact()
+
+    def _copy(self, row: int) -> StepsExtension:
+        value = self._exact_values.get(row, self.values[row])
+        return StepsExtension(value, self.reading_errors[row], self.standard_errors[row])
+
+    def _depths(self, roots: list[int], limit: int) -> dict[int, int]:
+        """
+        Returns the fewest steps it takes to get from any of roots to each row reachable from them, stopping at rows
+        limit steps away
+        """
+        depths = dict.fromkeys(roots, 0)
+
+        # the operands of a row always come before it, so going through rows from the last one back means each row is
+        # only reached after everything using it
+        queue = [-row for row in roots]
+        heapq.heapify(queue)
+
+        while queue:
+            row = -heapq.heappop(queue)
+            depth = depths[row] + 1
+
+            if self.ops[row] <= CONSTANT or depth > limit:
+                continue
+
+            for operand in (self.left[row], self.right[row]):
+                if operand < 0:
+                    continue
+
+                if operand not in depths:
+                    heapq.heappush(queue, -operand)
+                    depths[operand] = depth
+                elif depths[operand] > depth:
+                    depths[operand] = depth
+
+        return depths
+
+    def compact(self) -> None:
+        """
+        Drops every row that isn't needed by a result still alive (under the retention policy of the tape)
+        """
+        rows = len(self.ops)
+        limit = rows if self.levels is None else self.levels
+        unreached = rows + 1
+
+        # the fewest steps from a live result to each row, found in a single pass from the last row back since the
+        # operands of a row always come before it
+        depths = array("i", [unreached]) * rows
+
+        for row, ref in enumerate(self._refs):
+            if self.ops[row] > CONSTANT and ref is not None and ref() is not None:
+                depths[row] = 0
+
+        for row in range(rows - 1, -1, -1):
+            depth = depths[row] + 1
+
+            if depth > limit or self.ops[row] <= CONSTANT:
+                continue
+
+            for operand in (self.left[row], self.right[row]):
+                if operand >= 0 and depths[operand] > depth:
+                    depths[operand] = depth
+
+        old_refs, old_exact_values = self._refs, self._exact_values
+        old_ops, old_left, old_right = self.ops, self.left, self.right
+        old_values, old_reading_errors, old_standard_errors = self.values, self.reading_errors, self.standard_errors
+
+        self.ops, self.left, self.right = array("B"), array("i"), array("i")
+        self.values, self.reading_errors, self.standard_errors = array("d"), array("d"), array("d")
+        self._refs, self._exact_values = [], {}
+
+        new_rows = array("i", [-1]) * rows
+
+        for row in range(rows):
+            ref = old_refs[row]
+            op = old_ops[row]
+
+            if depths[row] == unreached:
+                continue
+
+            value = old_values[row]
+            left = right = -1
+
+            if op > CONSTANT and depths[row] >= limit:
+                # results at the edge of the history kept are turned into plain measurements
+                op = LEAF
+                ref = StepsExtension(old_exact_values.get(row, value), old_reading_errors[row], old_standard_errors[row])
+            elif op > CONSTANT:
+                left = new_rows[old_left[row]]
+                right = -1 if old_right[row] < 0 else new_rows[old_right[row]]
+
+                if ref is not None and ref() is None:
+                    ref = None
+
+            new_row = new_rows[row] = self._append(
+                op, left, right, value, old_reading_errors[row], old_standard_errors[row], ref
+            )
+
+            if op > CONSTANT and row in old_exact_values:
+                self._exact_values[new_row] = old_exact_values[row]
+
+            owner = ref() if op > CONSTANT and ref is not None else None
+
+            if owner is not None and owner.tape is self:
+                owner.tape_index = new_row
+
+        self._leaf_rows = {key: new_rows[row] for key, row in self._leaf_rows.items() if new_rows[row] >= 0}
+        self._copied_rows = {
+            key: (ref, new_rows[row]) for key, (ref, row) in self._copied_rows.items()
+            if new_rows[row] >= 0 and ref() is not None
+        }
+
+        self._compact_at = max(self.min_compaction, 2 * len(self.ops))
+
+    def materialize(self, row: int, levels: int | None = None) -> StepsExtension:
+        """
+        Rebuilds the result on the given row, along with the history kept for it, as MeasuredDatas holding their
+        operands as usual
+
+        Parameters
+        ----------
+        row : int
+            The row of the result
+        levels : int | None
+            The number of steps of history to rebuild, with values further back being given as plain measurements.
+            Defaults to the number of levels kept by the tape
+        """
+        if levels is None:
+            levels = len(self.ops) if self.levels is None else self.levels
+
+        depths = self._depths([row], levels)
+        built = {}
+
+        for r in sorted(depths):
+            op = self.ops[r]
+
+            if op <= CONSTANT:
+                built[r] = self._refs[r]
+            elif depths[r] >= levels:
+                built[r] = self._copy(r)
+            else:
+                dp = built[r] = self._copy(r)
+                dp.step = steps[op]
+
+                if self.right[r] < 0:
+                    dp.step_variables = (built[self.left[r]],)
+                else:
+                    dp.step_variables = (built[self.left[r]], built[self.right[r]])
+
+        return built[row]
+
+def _float(value) -> float:
+    # the arrays of a tape only hold floats, with anything else being kept as an object alongside them
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+@contextmanager
+def recording(levels: int | None = None, labels=False):
+    """
+    Records the steps of the calculations done inside a with block onto a StepTape, rather than onto their results
+
+    The all_steps_* methods of results work as usual, for as much of their history as was kept.
+
+    Parameters
+    ----------
+    levels : int | None
+        The number of steps of history to keep for each result, or None to keep all of it
+    labels : bool
+        Whether labelled results start a new history when used as operands
+
+    Examples
+    --------
+    >>> from physics_utils import MeasuredData
+    >>> with recording(levels=2) as tape:
+    ...     total = MeasuredData(0, 0.1)
+    ...     for _ in range(10000):
+    ...         total = total + MeasuredData(1, 0.1)
+    >>> total.all_steps_composite(False)[0]
+    ' x + y + z '
+    """
+    tape = StepTape(levels, labels)
+
+    previous = md_steps._tape
+    md_steps._tape = tape
+
+    try:
+        yield tape
+    finally:
+        md_steps._tape = previous
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,203 @@
+"""
+Loading of measured columns from CSV files, with a binary cache so that repeated loads skip parsing
+"""
+import hashlib
+import json
+import os
+import numpy as np
+
+from .md_array import MeasuredArray
+
+__all__ = ["load_measured_csv"]
+
+# the number of rows read to work out which columns are numeric, when no columns are given
+SAMPLE_ROWS = 100
+
+# bumped whenever the layout of the cache changes, so that old caches are parsed again
+CACHE_VERSION = 2
+
+def _cache_paths(file_name: str, used: list[str]) -> tuple[str, str]:
+    # each set of columns gets a cache of its own, so loading different columns of a file doesn't replace the cache of
+    # the others
+    key = hashlib.sha1(json.dumps(used).encode()).hexdigest()[:12]
+    return "{}.{}.cache.npy".format(file_name, key), "{}.{}.cache.json".format(file_name, key)
+
+def _column_specs(header: list[str], numeric: list[str], columns, error_suffix: str,
+                  standard_suffix: str) -> list[tuple]:
+    """
+    Works out which CSV columns hold the value, reading error and standard error of each measured column, with only
+    the numeric columns being loaded when no columns are given
+
+    Returns a list of (name, value column, reading error column, standard error column), with the error columns being
+    None where there isn't one
+    """
+    if isinstance(columns, dict):
+        specs = []
+
+        for name, spec in columns.items():
+            if isinstance(spec, str):
+                spec = (spec,)
+
+            spec = tuple(spec) + (None,) * (3 - len(spec))
+            specs.append((name,) + spec)
+    else:
+        is_error = lambda c: (error_suffix and c.endswith(error_suffix)) or \
+                             (standard_suffix and c.endswith(standard_suffix))
+
+        names = [c for c in numeric if not is_error(c)] if columns is None else list(columns)
+
+        specs = [
+            (
+                name, name,
+                name + error_suffix if error_suffix and name + error_suffix in header else None,
+                name + standard_suffix if standard_suffix and name + standard_suffix in header else None
+            )
+            for name in names
+        ]
+
+    for spec in specs:
+        for column in spec[1:]:
+            if column is not None and column not in header:
+                raise ValueError("Column \"{}\" is not in the file".format(column))
+
+    return specs
+
+def _parse(file_name: str, used: list[str], chunk_size: int) -> np.ndarray:
+    """
+    Reads the given columns of a CSV file into a 2D array, with each row of the array holding one column
+    """
+    import pandas as pd
+
+    chunks = []
+
+    for chunk in pd.read_csv(file_name, usecols=used, chunksize=chunk_size):
+        for column in used:
+            if not pd.api.types.is_numeric_dtype(chunk[column]):
+                raise ValueError("Column \"{}\" holds values which aren't numbers".format(column))
+
+        chunks.append(chunk[used].to_numpy(dtype=float).T)
+
+    if len(chunks) == 0:
+        return np.empty((len(used), 0))
+
+    return np.ascontiguousarray(np.concatenate(chunks, axis=1))
+
+def _load_cache(file_name: str, used: list[str]) -> np.ndarray | None:
+    data_path, info_path = _cache_paths(file_name, used)
+
+    try:
+        with open(info_path) as f:
+            info = json.load(f)
+
+        source = os.stat(file_name)
+
+        if info != {"version": CACHE_VERSION, "size": source.st_size, "mtime_ns": source.st_mtime_ns, "columns": used}:
+            return None
+
+        # copy on write, so that the arrays can be changed without touching the cache
+        return np.load(data_path, mmap_mode="c")
+    except (OSError, ValueError):
+        return None
+
+def _save_cache(file_name: str, used: list[str], data: np.ndarray) -> None:
+    data_path, info_path = _cache_paths(file_name, used)
+    source = os.stat(file_name)
+
+    try:
+        # written to temporary files first, so that an interrupted write never leaves a broken cache behind
+        with open(data_path + ".tmp", "wb") as f:
+            np.save(f, data)
+        os.replace(data_path + ".tmp", data_path)
+
+        with open(info_path + ".tmp", "w") as f:
+            json.dump({"version": CACHE_VERSION, "size": source.st_size, "mtime_ns": source.st_mtime_ns,
+                       "columns": used}, f)
+        os.replace(info_path + ".tmp", info_path)
+    except OSError:
+        # not being able to cache (e.g., in a read-only directory) only makes the next load slower
+        pass
+
+def load_measured_csv(file_name: str, columns: list[str] | dict | None = None, error_suffix="_err",
+                      standard_suffix="_std", reading_error=0.0, cache=True,
+                      chunk_size=100_000) -> dict[str, MeasuredArray]:
+    """
+    Loads columns of measurements from a CSV file, pairing each column of values with its columns of errors
+
+    By default, every column whose name ends in error_suffix (or standard_suffix) is taken to be the reading error (or
+    standard error) of the column with the same name without the suffix, e.g., "length_err" holds the errors of
+    "length". Columns can also be paired up by name, by giving columns as a dict.
+
+    The file is parsed in chunks of chunk_size rows, so huge files never need more than a chunk of text in memory at
+    once. Unless cache is False, the parsed numbers are then saved into a .npy file next to the CSV (along with a small
+    .json file describing it), which later loads of the same columns read directly, as long as the CSV hasn't changed.
+    Each set of columns loaded is cached separately. These reads are memory mapped, so only the parts of the data
+    actually used are read from disk.
+
+    Parameters
+    ----------
+    file_name : str
+        The path of the CSV file
+    columns : list[str] | dict | None
+        Which columns to load. None loads every numeric column which isn't an error column (leaving out text, such as
+        labels or dates), and a list loads the given columns (with errors found by suffix.) Loading a column which
+        isn't numeric raises a ValueError naming it. A dict maps names to either the column of values or a tuple of the columns of
+        values, reading errors, and standard errors (where either error column may be None)
+    error_suffix : str
+        The suffix of columns holding reading errors
+    standard_suffix : str
+        The suffix of columns holding standard errors
+    reading_error : float
+        The reading error of columns without a column of reading errors
+    cache : bool
+        Whether to read from and write to the binary cache
+    chunk_size : int
+        The number of rows parsed at once
+
+    Returns
+    -------
+    dict[str, MeasuredArray]
+        The loaded columns by name, in the order they were given (or appear in the file)
+
+    Examples
+    --------
+    For a file starting with the header `time,time_err,distance,distance_err,distance_std`,
+
+    >>> data = load_measured_csv("run.csv")  # doctest: +SKIP
+    >>> speeds = data["distance"] / data["time"]  # doctest: +SKIP
+    """
+    # imported here rather than with the module, so that importing physics_utils doesn't have to import pandas
+    import pandas as pd
+
+    # the first rows are enough to tell which columns hold numbers, rather than text like labels or dates
+    sample = pd.read_csv(file_name, nrows=SAMPLE_ROWS)
+    header = list(sample.columns)
+    numeric = [c for c in header if pd.api.types.is_numeric_dtype(sample[c])]
+
+    specs = _column_specs(header, numeric, columns, error_suffix, standard_suffix)
+
+    # every CSV column needed, in the order they appear in the file
+    needed = {column for spec in specs for column in spec[1:] if column is not None}
+    used = [c for c in header if c in needed]
+
+    data = _load_cache(file_name, used) if cache else None
+
+    if data is None:
+        data = _parse(file_name, used, chunk_size)
+
+        if cache:
+            _save_cache(file_name, used, data)
+
+    rows = {column: i for i, column in enumerate(used)}
+
+    return {
+        name: MeasuredArray(
+            data[rows[value]],
+            reading_error if reading is None else data[rows[reading]],
+            0.0 if standard is None else data[rows[standard]]
+        )
+        for name, value, reading, standard in specs
+    }
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -17,10 +17,15 @@ class MeasuredData(StepsExtension):
     -----
     This class automatically propagates uncertainty through calculations
     """
+    __slots__ = ()
+
     def __init__(self, measurement: float, reading_error: float, standard_error=0.0):
+        # every slot is assigned here rather than through the parent constructors, since this runs for the result of
+        # every calculation
         self.value = measurement
         self.reading_error = reading_error
         self.standard_error = standard_error
+        self.step = self.step_variables = self.label = self.tape = None
 
 
 
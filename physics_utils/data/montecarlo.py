@@ -0,0 +1,139 @@
+"""
+Monte Carlo propagation of uncertainty, for functions where the first order formulas used by MeasuredData break down
+"""
+from itertools import repeat
+from typing import Callable
+import numpy as np
+
+from .md_base import MeasuredDataBase
+from .measureddata import MeasuredData
+from .streaming import RunningStats
+
+__all__ = ["monte_carlo"]
+
+def _run_chunk(fn: Callable, values: list, reading: list, standard: list, size: int,
+               seed: np.random.SeedSequence) -> tuple:
+    """
+    Evaluates fn over one block of samples, returning the statistics of its finite outputs when only the reading errors
+    vary, when only the standard errors vary, and when both do
+    """
+    rng = np.random.default_rng(seed)
+
+    # inputs without a given kind of error are left at their value
+    reading_offsets  = [r * rng.standard_normal(size) if r else 0.0 for r in reading]
+    standard_offsets = [s * rng.standard_normal(size) if s else 0.0 for s in standard]
+
+    has_reading, has_standard = any(reading), any(standard)
+
+    def run(offsets: list) -> np.ndarray:
+        with np.errstate(all="ignore"):
+            return np.broadcast_to(np.asarray(fn(*(v + o for v, o in zip(values, offsets))), dtype=float), (size,))
+
+    reading_samples  = run(reading_offsets) if has_reading else None
+    standard_samples = run(standard_offsets) if has_standard else None
+
+    if has_reading and has_standard:
+        both_samples = run([r + s for r, s in zip(reading_offsets, standard_offsets)])
+    elif has_reading:
+        both_samples = reading_samples
+    elif has_standard:
+        both_samples = standard_samples
+    else:
+        both_samples = run([0.0] * len(values))
+
+    finite = lambda samples: RunningStats(samples[np.isfinite(samples)] if samples is not None else ())
+
+    return finite(reading_samples), finite(standard_samples), finite(both_samples)
+
+def monte_carlo(fn: Callable, *inputs, n=100_000, chunk_size=50_000, processes: int | None = None,
+                seed: int | None = None) -> MeasuredData:
+    """
+    Propagates uncertainty through fn by evaluating it on randomly sampled inputs
+
+    Each MeasuredData input is sampled from a normal distribution centered on its value, and fn is called with whole
+    NumPy arrays of these samples at once, so it should be written using NumPy operations (e.g., np.sin rather than
+    math.sin). As with MeasuredData, the reading and standard errors are propagated separately: the reading error of
+    the result is the spread of fn when only the reading errors of the inputs vary, and likewise for the standard error.
+    The value of the result is the mean of fn when both vary together.
+
+    Samples are generated and evaluated in chunks of chunk_size, so memory use stays bounded no matter how large n is.
+    Outputs which aren't finite (e.g., from samples falling outside the domain of fn) are discarded.
+
+    Parameters
+    ----------
+    fn : Callable
+        The function to evaluate, taking as many arguments as there are inputs
+    inputs
+        The arguments for fn. MeasuredDatas are sampled, while anything else is passed as is
+    n : int
+        The number of samples to draw
+    chunk_size : int
+        The number of samples to evaluate at once
+    processes : int | None
+        If given, chunks are spread over a pool of this many processes. fn must then be picklable (i.e., defined at the
+        top level of a module)
+    seed : int | None
+        Seed for the random number generator. Each chunk gets its own stream spawned from the seed, so a seeded run
+        gives the same result regardless of how many processes are used
+
+    Returns
+    -------
+    MeasuredData
+        The mean of fn, with the spreads in its output as reading and standard errors
+
+    Examples
+    --------
+    >>> result = monte_carlo(np.arcsin, MeasuredData(0.5, 0.01), seed=1)
+    >>> round(result.value, 3), round(result.reading_error, 3)
+    (0.524, 0.012)
+    """
+    if n <= 0:
+        raise ValueError("Number of samples must be positive")
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+
+    values, reading, standard = [], [], []
+
+    for x in inputs:
+        if isinstance(x, MeasuredDataBase):
+            values.append(float(x.value))
+            reading.append(float(x.reading_error))
+            standard.append(float(x.standard_error))
+        else:
+            values.append(x)
+            reading.append(0.0)
+            standard.append(0.0)
+
+    sizes = [chunk_size] * (n // chunk_size) + ([n % chunk_size] if n % chunk_size else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    args = (repeat(fn), repeat(values), repeat(reading), repeat(standard), sizes, seeds)
+
+    reading_stats, standard_stats, both_stats = RunningStats(), RunningStats(), RunningStats()
+
+    def gather(results) -> None:
+        # chunks are always merged in the same order, so the result doesn't depend on which finished first
+        for r, s, b in results:
+            reading_stats.merge(r)
+            standard_stats.merge(s)
+            both_stats.merge(b)
+
+    if processes is None:
+        gather(map(_run_chunk, *args))
+    else:
+        # only imported when it's used, since it's slow to import
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            gather(executor.map(_run_chunk, *args))
+
+    if both_stats.count == 0:
+        raise RuntimeError("Function gave no finite outputs")
+
+    std = lambda stats: stats.std(ddof=1) if stats.count > 1 else 0.0
+
+    return MeasuredData(both_stats.mean, std(reading_stats), std(standard_stats))
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,148 @@
+"""
+One pass statistics, for averaging readings as they arrive without keeping them all around
+"""
+from itertools import islice
+from typing import Iterable, Self
+import math
+import numpy as np
+
+from .measureddata import MeasuredData
+from .md_array import MeasuredArray
+
+__all__ = ["RunningStats"]
+
+class RunningStats:
+    """
+    Keeps a running count, mean and variance of a stream of values, using O(1) memory
+
+    Single values are added using Welford's algorithm, while arrays (and long iterables, which are read in chunks) are
+    reduced with NumPy and then merged in. Two RunningStats can also be merged, so a set of readings can be split up
+    between processes and combined afterwards (Chan et al.'s parallel form of Welford's algorithm).
+
+    Attributes
+    ----------
+    count : int
+        The number of values seen
+    mean : float
+        The mean of the values seen
+    m2 : float
+        The sum of squared differences of the values from their mean
+
+    Examples
+    --------
+    >>> stats = RunningStats()
+    >>> stats.add(2.0)
+    >>> stats.extend([4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0])
+    >>> stats.count, stats.mean, stats.std()
+    (8, 5.0, 2.0)
+    """
+    __slots__ = ("count", "mean", "m2")
+
+    # the number of values read from an iterable at once
+    chunk_size = 65536
+
+    def __init__(self, values: Iterable[float] | None = None):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+        if values is not None:
+            self.extend(values)
+
+    def add(self, value: float) -> None:
+        """
+        Adds a single value
+        """
+        value = float(value)
+
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def extend(self, values: Iterable[float]) -> None:
+        """
+        Adds every value in an array or iterable (e.g., a list, a generator, or a MeasuredArray)
+
+        Anything which isn't an array is converted using float(), so iterables of MeasuredDatas can be given too.
+        """
+        # measured arrays are summarized by their values
+        if isinstance(values, MeasuredArray):
+            values = values.value
+
+        if isinstance(values, np.ndarray):
+            self._extend_array(values.astype(float, copy=False).ravel())
+            return
+
+        iterator = iter(values)
+
+        while len(chunk := np.fromiter(islice(iterator, self.chunk_size), dtype=float)) > 0:
+            self._extend_array(chunk)
+
+    def _extend_array(self, values: np.ndarray) -> None:
+        if len(values) == 0:
+            return
+
+        mean = float(values.mean())
+        self.merge(RunningStats._of(len(values), mean, float(((values - mean) ** 2).sum())))
+
+    @staticmethod
+    def _of(count: int, mean: float, m2: float) -> "RunningStats":
+        stats = RunningStats()
+        stats.count, stats.mean, stats.m2 = count, mean, m2
+        return stats
+
+    def merge(self, other: Self) -> None:
+        """
+        Adds every value seen by another RunningStats
+        """
+        if other.count == 0:
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / count
+        self.count = count
+
+    def __add__(self, other: Self) -> Self:
+        merged = RunningStats._of(self.count, self.mean, self.m2)
+        merged.merge(other)
+        return merged
+
+    def variance(self, ddof=0) -> float:
+        """
+        Returns the variance of the values seen, as np.var would with the given delta degrees of freedom
+        """
+        if self.count - ddof <= 0:
+            return math.nan
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof=0) -> float:
+        """
+        Returns the standard deviation of the values seen, as np.std would with the given delta degrees of freedom
+        """
+        return math.sqrt(self.variance(ddof))
+
+    def average(self, reading_error=0.0) -> MeasuredData:
+        """
+        Returns the mean of the values seen as a MeasuredData, with the standard deviation as its standard error, as
+        avg_from_set does
+
+        Parameters
+        ----------
+        reading_error : float
+            The reading error shared by all the values
+        """
+        if self.count == 0:
+            raise ValueError("Cannot average an empty set of measurements")
+
+        return MeasuredData(self.mean, reading_error, self.std())
+
+    def __repr__(self) -> str:
+        return "RunningStats(count={}, mean={}, std={})".format(self.count, self.mean, self.std())
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -1,29 +1,107 @@
+from typing import Iterable
 from .measureddata import MeasuredData
-import pandas as pd
+from .md_array import MeasuredArray
+from .streaming import RunningStats
 import numpy as np
-from numpy import std
 
 # from here on out we have some utility functions
 def csv_to_numpy(file_name: str, rotate=False) -> np.ndarray:
+    # pandas is only imported when it's needed, since importing it takes longer than the rest of the package
+    import pandas as pd
+
     if rotate:
         return pd.read_csv(file_name).T.to_numpy()
     return pd.read_csv(file_name).to_numpy()
 
 
-def remove_nan(data_points: np.ndarray) -> list:
-    return [x for x in data_points if not np.isnan(x)]
+def nan_mask(data_points: np.ndarray | MeasuredArray) -> np.ndarray:
+    """
+    Returns a boolean array which is True wherever a point is missing (NaN)
 
+    For a MeasuredArray, a point is missing if its value or either of its errors is NaN.
+    """
+    if isinstance(data_points, MeasuredArray):
+        return np.isnan(data_points.value) | np.isnan(data_points.reading_error) | \
+            np.isnan(data_points.standard_error)
 
-def remove_nan_2d(data_points: np.ndarray) -> list:
-    return [remove_nan(x) for x in data_points]
+    return np.isnan(np.asarray(data_points, dtype=float))
 
-def avg_from_set(measurements: list[float], reading_error: float) -> MeasuredData:
+
+def remove_nan(data_points: np.ndarray | MeasuredArray) -> np.ndarray | MeasuredArray:
+    """
+    Returns the points which aren't missing (NaN), as an array of the same kind
+
+    Parameters
+    ----------
+    data_points : np.ndarray | MeasuredArray
+        The points, in one dimension
+
+    Returns
+    -------
+    np.ndarray | MeasuredArray
+        The points which aren't missing, in the same order
+
+    Examples
+    --------
+    >>> remove_nan(np.array([1.0, np.nan, 3.0]))
+    array([1., 3.])
+    """
+    if not isinstance(data_points, MeasuredArray):
+        data_points = np.asarray(data_points, dtype=float)
+
+    return data_points[~nan_mask(data_points)]
+
+
+def remove_nan_2d(data_points: np.ndarray, return_index=False) -> list[np.ndarray] | tuple[list, list]:
+    """
+    Removes the missing (NaN) points from each row of a 2D array, e.g., from each column of a CSV file read using
+    csv_to_numpy with rotate
+
+    The rows are left with different lengths, so they're given as a list of arrays. These are all views into a single
+    array holding every point which isn't missing.
+
+    Parameters
+    ----------
+    data_points : np.ndarray
+        The points, with each row being cleaned up on its own
+    return_index : bool
+        Whether to also return, for each row, the indices in the original row of the points that are kept
+
+    Returns
+    -------
+    list[np.ndarray] | tuple[list[np.ndarray], list[np.ndarray]]
+        The points kept in each row, along with the indices of those points if return_index is True
+
+    Examples
+    --------
+    >>> remove_nan_2d(np.array([[1.0, np.nan, 3.0], [np.nan, 5.0, 6.0]]), return_index=True)
+    ([array([1., 3.]), array([5., 6.])], [array([0, 2]), array([1, 2])])
+    """
+    data_points = np.asarray(data_points, dtype=float)
+    kept = ~np.isnan(data_points)
+
+    if len(data_points) == 0:
+        return ([], []) if return_index else []
+
+    # every point kept is compacted at once, and then split back up into rows
+    splits = np.cumsum(kept.sum(axis=1))[:-1]
+    rows = np.split(data_points[kept], splits)
+
+    if not return_index:
+        return rows
+
+    return rows, np.split(np.nonzero(kept)[1], splits)
+
+def avg_from_set(measurements: Iterable[float], reading_error: float) -> MeasuredData:
     """
     Averages a list of floats all having the same reading error
 
+    The measurements are gone through in a single pass, so any iterable (e.g., a generator of readings) or array can be
+    given without it being stored in full.
+
     Parameters
     ----------
-    measurements : list[float]
+    measurements : Iterable[float]
         The measurements to be averaged
     reading_error : float
         The error which all of the measurements share
@@ -33,19 +111,17 @@ def avg_from_set(measurements: list[float], reading_error: float) -> MeasuredDat
     MeasuredData
         The average of all the measurements, with the uncertainty propagated
     """
-    n = len(measurements)
-    average = sum(measurements) / n
-    standard_deviation = float(std(measurements))
-    return MeasuredData(average, reading_error, standard_deviation)
+    return RunningStats(measurements).average(reading_error)
 
-def avg_measured_datas(measurements: list[MeasuredData]) -> MeasuredData:
-    import math
+def avg_measured_datas(measurements: Iterable[MeasuredData]) -> MeasuredData:
     """
     Averages a list of MeasuredDatas
 
+    The measurements are gone through in a single pass, so any iterable (or a MeasuredArray) can be given.
+
     Parameters
     ----------
-    measurements : list[MeasuredData]
+    measurements : Iterable[MeasuredData]
         The MeasuredDatas to be averaged
 
     Returns
@@ -54,9 +130,89 @@ def avg_measured_datas(measurements: list[MeasuredData]) -> MeasuredData:
         The average of all the MeasuredDatas, with the standard error being
         the standard deviation.
     """
-    values = [float(x) for x in measurements]
+    return RunningStats(measurements).average(0)
+
+def avg_weighted(measurements: Iterable[MeasuredData] | MeasuredArray) -> MeasuredData:
+    """
+    Takes the inverse-variance weighted average of a set of measurements, so that more precise measurements count for
+    more
+
+    Parameters
+    ----------
+    measurements : Iterable[MeasuredData] | MeasuredArray
+        The measurements to be averaged, each of which needs a nonzero error
+
+    Returns
+    -------
+    MeasuredData
+        The weighted average, with the standard error of the weighted mean as its standard error
+
+    Examples
+    --------
+    >>> avg_weighted(MeasuredArray([1.0, 2.0], [0.1, 0.2])).value
+    1.2
+    """
+    if not isinstance(measurements, MeasuredArray):
+        measurements = MeasuredArray.from_measured_datas(measurements)
+
+    if len(measurements) == 0:
+        raise ValueError("Cannot average an empty set of measurements")
+
+    _, means, _ = avg_weighted_groups(np.zeros(len(measurements), dtype=int), measurements)
+    return means[0]
+
+def avg_weighted_groups(keys, measurements: Iterable[MeasuredData] | MeasuredArray) \
+        -> tuple[np.ndarray, MeasuredArray, np.ndarray]:
+    """
+    Takes the inverse-variance weighted average of every group of measurements at once, e.g., of the points from each
+    of many repeated runs
+
+    Each point is weighted by one over the square of its error (the greatest of its errors.) Along with the weighted
+    mean of each group, the reduced chi-square of the group about its mean is given, which should be close to one when
+    the errors of the group account for its spread.
+
+    Parameters
+    ----------
+    keys : array_like
+        The group of each measurement (e.g., the number of the run it came from)
+    measurements : Iterable[MeasuredData] | MeasuredArray
+        The measurements, each of which needs a nonzero error
+
+    Returns
+    -------
+    tuple[np.ndarray, MeasuredArray, np.ndarray]
+        The distinct keys in sorted order, the weighted mean of each group (with the standard error of the weighted
+        mean as its standard error), and the reduced chi-square of each group (NaN for groups with a single point)
+
+    Examples
+    --------
+    >>> keys, means, chi2 = avg_weighted_groups([0, 1, 0, 1], MeasuredArray([1.0, 5.0, 3.0, 5.0], 1.0))
+    >>> means.value, means.standard_error, chi2
+    (array([2., 5.]), array([0.70710678, 0.70710678]), array([2., 0.]))
+    """
+    if not isinstance(measurements, MeasuredArray):
+        measurements = MeasuredArray.from_measured_datas(measurements)
+
+    keys = np.asarray(keys)
+
+    if keys.shape != measurements.value.shape:
+        raise ValueError("There must be one key per measurement")
+
+    errors = measurements.error()
+
+    if np.any(errors <= 0):
+        raise ValueError("Every measurement needs a nonzero error to be weighted")
+
+    groups, inverse = np.unique(keys, return_inverse=True)
+    weights = 1 / errors ** 2
+
+    counts = np.bincount(inverse, minlength=len(groups))
+    total_weights = np.bincount(inverse, weights, len(groups))
+    means = np.bincount(inverse, weights * measurements.value, len(groups)) / total_weights
+
+    chi2 = np.bincount(inverse, weights * (measurements.value - means[inverse]) ** 2, len(groups))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        reduced_chi2 = np.where(counts > 1, chi2 / (counts - 1), np.nan)
 
-    n = len(values)
-    average = sum(values) / n
-    standard_deviation = float(std(values))
-    return MeasuredData(average, 0, standard_deviation)
\ No newline at end of file
+    return groups, MeasuredArray(means, 0.0, 1 / np.sqrt(total_weights)), reduced_chi2
@@ -0,0 +1,219 @@
+"""
+Optional counters for the hot paths of the library: operations on measurements, the objects they allocate, and the work
+done by the script interpreter
+
+Counting is done by wrapping the counted methods while instrumentation is turned on, and unwrapping them when it's
+turned off again, so nothing is added to those paths the rest of the time.
+"""
+from collections import Counter
+from contextlib import contextmanager
+import functools
+import sys
+
+__all__ = ["stats", "reset_stats", "instrument", "instrumenting", "instrumented", "steps_size"]
+
+# the counters of each group, which are kept (and only cleared) across turning instrumentation on and off
+_counters: dict[str, Counter] = {}
+# the original attribute of every wrapped method as (owner, name, original), where original is None if the owner only
+# inherited it
+_wrapped = []
+
+# the operations currently running on measurements (innermost last), which the MeasuredDatas they create are counted
+# under
+_running_ops: list[str] = []
+
+# the operations counted on measurements, by the name they're counted under
+measured_ops = {
+    "add": "__add__", "radd": "__radd__", "sub": "__sub__", "rsub": "__rsub__", "mul": "__mul__", "rmul": "__rmul__",
+    "div": "__truediv__", "rdiv": "__rtruediv__", "pow": "__pow__", "rpow": "__rpow__", "neg": "__neg__",
+    "abs": "__abs__", "sine": "sine", "cosine": "cosine", "tangent": "tangent", "arctan": "arctan", "arcsin": "arcsin"
+}
+
+def _counter(group: str) -> Counter:
+    if group not in _counters:
+        _counters[group] = Counter()
+    return _counters[group]
+
+def _counting(fn, counter: Counter, key: str):
+    @functools.wraps(fn)
+    def counted(*args, **kwargs):
+        result = fn(*args, **kwargs)
+
+        if result is not NotImplemented:
+            counter[key] += 1
+
+        return result
+
+    return counted
+
+def _operation(fn, counter: Counter, key: str):
+    @functools.wraps(fn)
+    def counted(*args, **kwargs):
+        _running_ops.append(key)
+
+        try:
+            result = fn(*args, **kwargs)
+        finally:
+            _running_ops.pop()
+
+        if result is not NotImplemented:
+            counter[key] += 1
+
+        return result
+
+    return counted
+
+def _running(compile, counter: Counter):
+    # wraps the code compiled for each node, so that running it is counted like visiting the node would be
+    @functools.wraps(compile)
+    def compiled(self, context):
+        code = compile(self, context)
+        key = type(context).__name__[:-len("Context")]
+
+        def counted(*args):
+            # code compiled while counting can still be run after counting is turned off
+            if _wrapped:
+                counter[key] += 1
+            return code(*args)
+
+        return counted
+
+    return compiled
+
+def _allocating(fn, counter: Counter):
+    @functools.wraps(fn)
+    def counted(self, *args, **kwargs):
+        # the operation which made it, or "new" for ones made directly
+        counter[_running_ops[-1] if _running_ops else "new"] += 1
+        return fn(self, *args, **kwargs)
+
+    return counted
+
+def _wrap(owner, name: str, wrapper) -> None:
+    original = owner.__dict__.get(name)
+    _wrapped.append((owner, name, original))
+    setattr(owner, name, wrapper(getattr(owner, name)))
+
+def _wrap_all() -> None:
+    from .data import MeasuredData, MeasuredArray
+
+    # wrapped on MeasuredData rather than the classes defining them, so that a method calling the one it overrides
+    # through super() is only counted once (and CorrelatedData is counted through its calls to super())
+    for key, name in measured_ops.items():
+        if hasattr(MeasuredData, name):
+            _wrap(MeasuredData, name, lambda fn, key=key: _operation(fn, _counter("data.ops"), key))
+        if hasattr(MeasuredArray, name):
+            _wrap(MeasuredArray, name, lambda fn, key=key: _operation(fn, _counter("array.ops"), key))
+
+    _wrap(MeasuredData, "__init__", lambda fn: _allocating(fn, _counter("data.allocations")))
+
+    try:
+        from .script import expressions
+        from .script.compiler import Compiler
+        from .script.visitor_interpreter import VisitorInterpreter
+    except ImportError:
+        # the parser hasn't been generated, so there's no interpreter to count
+        return
+
+    # nodes are counted by their kind whether they're visited or compiled and run (scripts loaded from a transpiled
+    # cache have no nodes left to count)
+    for name in [name for name in vars(VisitorInterpreter) if name.startswith("visit")]:
+        key = name[len("visit"):]
+        _wrap(VisitorInterpreter, name, lambda fn, key=key: _counting(fn, _counter("script.nodes"), key))
+
+    _wrap(Compiler, "compile", lambda fn: _running(fn, _counter("script.nodes")))
+
+    # both the interpreter and compiled scripts make their calls through these
+    for key, name in (("call", "call"), ("image call", "image_call"), ("starred call", "starred_call")):
+        _wrap(expressions, name, lambda fn, key=key: _counting(fn, _counter("script.calls"), key))
+
+def _unwrap_all() -> None:
+    while _wrapped:
+        owner, name, original = _wrapped.pop()
+
+        if original is None:
+            delattr(owner, name)
+        else:
+            setattr(owner, name, original)
+
+def instrumenting() -> bool:
+    """
+    Returns whether the counters are currently being updated
+    """
+    return len(_wrapped) > 0
+
+def instrument(enabled: bool) -> None:
+    """
+    Globally turns the counters on or off
+
+    While on, stats() counts every operation done on a MeasuredData or MeasuredArray (by operation), every MeasuredData
+    created (by the innermost operation which made it, or "new" if it was made directly), and every node of a script
+    run by the interpreter (by kind of node), along with every function call made by a script. Nodes are only counted
+    in scripts compiled (or visited) while the counters are on.
+    """
+    if enabled and not instrumenting():
+        _wrap_all()
+    elif not enabled:
+        _unwrap_all()
+
+@contextmanager
+def instrumented():
+    """
+    Turns the counters on inside of a with block, starting them from zero
+
+    Examples
+    --------
+    >>> from physics_utils import MeasuredData
+    >>> with instrumented():
+    ...     x = MeasuredData(2, 0.1) * 3 + 1
+    >>> stats()["data.ops"]
+    {'mul': 1, 'add': 1}
+    """
+    previous = instrumenting()
+
+    reset_stats()
+    instrument(True)
+
+    try:
+        yield
+    finally:
+        instrument(previous)
+
+def stats() -> dict[str, dict[str, int]]:
+    """
+    Returns a copy of every counter, by group
+
+    The groups are "data.ops", "data.allocations", "array.ops", "script.nodes" and "script.calls", with groups that
+    haven't counted anything yet being left out.
+    """
+    return {group: dict(counter) for group, counter in _counters.items() if counter}
+
+def reset_stats() -> None:
+    """
+    Sets every counter back to zero, e.g., at the start of a job
+    """
+    for counter in _counters.values():
+        counter.clear()
+
+def steps_size(result) -> dict[str, int]:
+    """
+    Returns the number of MeasuredDatas kept alive by the steps of a result (including itself), along with roughly how
+    many bytes they take up
+
+    Examples
+    --------
+    >>> from physics_utils import MeasuredData
+    >>> x = MeasuredData(2, 0.1)
+    >>> steps_size(x * x + 1)["nodes"]
+    3
+    """
+    from .data.md_steps import walk_steps
+
+    nodes = walk_steps(result)
+    size = sum(sys.getsizeof(dp) + (sys.getsizeof(dp.step_variables) if dp.step_variables else 0) for dp, _ in nodes)
+
+    return {"nodes": len(nodes), "bytes": size}
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,265 @@
+# Generated from Expr.g4 by ANTLR 4.13.2
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+    from typing import TextIO
+else:
+    from typing.io import TextIO
+
+
+def serializedATN():
+    return [
+        4,0,57,418,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
+        13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
+        19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
+        26,7,26,2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,2,31,7,31,2,32,7,
+        32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
+        39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
+        45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
+        52,7,52,2,53,7,53,2,54,7,54,2,55,7,55,2,56,7,56,2,57,7,57,2,58,7,
+        58,2,59,7,59,1,0,1,0,1,0,1,1,1,1,1,1,1,2,1,2,1,3,1,3,1,3,1,3,1,3,
+        1,4,1,4,1,4,1,5,1,5,1,5,1,5,1,5,1,6,1,6,1,6,1,6,1,6,1,6,1,6,1,6,
+        1,7,1,7,1,7,1,7,1,7,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,9,1,9,
+        1,9,1,9,1,10,1,10,1,10,1,10,1,10,1,11,1,11,1,11,1,11,1,11,1,11,1,
+        11,1,11,1,11,1,12,1,12,1,12,1,12,1,13,1,13,1,13,1,14,1,14,1,14,1,
+        14,1,14,1,15,1,15,1,15,1,16,1,16,1,16,1,16,1,16,1,16,1,16,1,17,1,
+        17,1,18,1,18,1,19,1,19,1,19,1,20,1,20,1,20,1,20,1,21,1,21,1,21,1,
+        21,1,21,1,21,1,21,1,22,1,22,1,23,1,23,1,23,1,23,1,23,1,23,1,24,1,
+        24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,25,1,25,1,25,1,25,1,25,1,
+        25,1,25,1,26,1,26,1,26,1,26,1,26,1,27,1,27,1,28,1,28,1,29,1,29,1,
+        30,1,30,1,31,1,31,1,32,1,32,1,33,1,33,1,34,1,34,1,35,1,35,1,36,1,
+        36,1,37,1,37,1,37,1,38,1,38,1,39,1,39,1,39,1,40,1,40,1,41,1,41,1,
+        41,1,42,1,42,1,42,1,42,1,43,1,43,1,43,1,44,1,44,1,44,1,45,1,45,1,
+        46,1,46,1,46,1,46,1,46,1,47,1,47,1,48,4,48,305,8,48,11,48,12,48,
+        306,1,48,1,48,1,49,4,49,312,8,49,11,49,12,49,313,1,49,1,49,1,50,
+        1,50,1,50,1,50,5,50,322,8,50,10,50,12,50,325,9,50,1,50,1,50,1,50,
+        1,50,1,50,1,51,1,51,1,51,1,51,5,51,336,8,51,10,51,12,51,339,9,51,
+        1,51,1,51,1,51,1,51,1,52,1,52,3,52,347,8,52,1,53,3,53,350,8,53,1,
+        53,4,53,353,8,53,11,53,12,53,354,1,53,1,53,5,53,359,8,53,10,53,12,
+        53,362,9,53,3,53,364,8,53,1,53,3,53,367,8,53,1,53,1,53,4,53,371,
+        8,53,11,53,12,53,372,3,53,375,8,53,1,54,1,54,1,54,1,54,1,54,1,54,
+        3,54,383,8,54,1,54,4,54,386,8,54,11,54,12,54,387,1,55,1,55,1,55,
+        3,55,393,8,55,1,55,1,55,1,55,1,55,5,55,399,8,55,10,55,12,55,402,
+        9,55,1,56,1,56,5,56,406,8,56,10,56,12,56,409,9,56,1,56,1,56,1,57,
+        1,57,1,58,1,58,1,59,1,59,2,323,337,0,60,1,1,3,2,5,3,7,4,9,5,11,6,
+        13,7,15,8,17,9,19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,
+        18,37,19,39,20,41,21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,57,
+        29,59,30,61,31,63,32,65,33,67,34,69,35,71,36,73,37,75,38,77,39,79,
+        40,81,41,83,42,85,43,87,44,89,45,91,46,93,47,95,48,97,49,99,50,101,
+        51,103,52,105,53,107,54,109,55,111,56,113,57,115,0,117,0,119,0,1,
+        0,6,2,0,10,10,13,13,2,0,9,9,32,32,1,0,34,34,1,0,48,57,1,0,97,122,
+        1,0,65,90,435,0,1,1,0,0,0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,
+        9,1,0,0,0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,
+        19,1,0,0,0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,
+        29,1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,0,
+        39,1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,0,
+        49,1,0,0,0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,1,0,0,0,0,57,1,0,0,0,0,
+        59,1,0,0,0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,1,0,0,0,0,67,1,0,0,0,0,
+        69,1,0,0,0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,1,0,0,0,0,77,1,0,0,0,0,
+        79,1,0,0,0,0,81,1,0,0,0,0,83,1,0,0,0,0,85,1,0,0,0,0,87,1,0,0,0,0,
+        89,1,0,0,0,0,91,1,0,0,0,0,93,1,0,0,0,0,95,1,0,0,0,0,97,1,0,0,0,0,
+        99,1,0,0,0,0,101,1,0,0,0,0,103,1,0,0,0,0,105,1,0,0,0,0,107,1,0,0,
+        0,0,109,1,0,0,0,0,111,1,0,0,0,0,113,1,0,0,0,1,121,1,0,0,0,3,124,
+        1,0,0,0,5,127,1,0,0,0,7,129,1,0,0,0,9,134,1,0,0,0,11,137,1,0,0,0,
+        13,142,1,0,0,0,15,150,1,0,0,0,17,155,1,0,0,0,19,162,1,0,0,0,21,168,
+        1,0,0,0,23,173,1,0,0,0,25,182,1,0,0,0,27,186,1,0,0,0,29,189,1,0,
+        0,0,31,194,1,0,0,0,33,197,1,0,0,0,35,204,1,0,0,0,37,206,1,0,0,0,
+        39,208,1,0,0,0,41,211,1,0,0,0,43,215,1,0,0,0,45,222,1,0,0,0,47,224,
+        1,0,0,0,49,230,1,0,0,0,51,239,1,0,0,0,53,246,1,0,0,0,55,251,1,0,
+        0,0,57,253,1,0,0,0,59,255,1,0,0,0,61,257,1,0,0,0,63,259,1,0,0,0,
+        65,261,1,0,0,0,67,263,1,0,0,0,69,265,1,0,0,0,71,267,1,0,0,0,73,269,
+        1,0,0,0,75,271,1,0,0,0,77,274,1,0,0,0,79,276,1,0,0,0,81,279,1,0,
+        0,0,83,281,1,0,0,0,85,284,1,0,0,0,87,288,1,0,0,0,89,291,1,0,0,0,
+        91,294,1,0,0,0,93,296,1,0,0,0,95,301,1,0,0,0,97,304,1,0,0,0,99,311,
+        1,0,0,0,101,317,1,0,0,0,103,331,1,0,0,0,105,344,1,0,0,0,107,374,
+        1,0,0,0,109,376,1,0,0,0,111,392,1,0,0,0,113,403,1,0,0,0,115,412,
+        1,0,0,0,117,414,1,0,0,0,119,416,1,0,0,0,121,122,5,58,0,0,122,123,
+        5,61,0,0,123,2,1,0,0,0,124,125,5,58,0,0,125,126,5,126,0,0,126,4,
+        1,0,0,0,127,128,5,91,0,0,128,6,1,0,0,0,129,130,5,93,0,0,130,131,
+        5,32,0,0,131,132,5,58,0,0,132,133,5,61,0,0,133,8,1,0,0,0,134,135,
+        5,105,0,0,135,136,5,102,0,0,136,10,1,0,0,0,137,138,5,116,0,0,138,
+        139,5,104,0,0,139,140,5,101,0,0,140,141,5,110,0,0,141,12,1,0,0,0,
+        142,143,5,101,0,0,143,144,5,108,0,0,144,145,5,115,0,0,145,146,5,
+        101,0,0,146,147,5,32,0,0,147,148,5,105,0,0,148,149,5,102,0,0,149,
+        14,1,0,0,0,150,151,5,101,0,0,151,152,5,108,0,0,152,153,5,115,0,0,
+        153,154,5,101,0,0,154,16,1,0,0,0,155,156,5,101,0,0,156,157,5,110,
+        0,0,157,158,5,100,0,0,158,159,5,32,0,0,159,160,5,105,0,0,160,161,
+        5,102,0,0,161,18,1,0,0,0,162,163,5,119,0,0,163,164,5,104,0,0,164,
+        165,5,105,0,0,165,166,5,108,0,0,166,167,5,101,0,0,167,20,1,0,0,0,
+        168,169,5,108,0,0,169,170,5,111,0,0,170,171,5,111,0,0,171,172,5,
+        112,0,0,172,22,1,0,0,0,173,174,5,101,0,0,174,175,5,110,0,0,175,176,
+        5,100,0,0,176,177,5,32,0,0,177,178,5,108,0,0,178,179,5,111,0,0,179,
+        180,5,111,0,0,180,181,5,112,0,0,181,24,1,0,0,0,182,183,5,102,0,0,
+        183,184,5,111,0,0,184,185,5,114,0,0,185,26,1,0,0,0,186,187,5,105,
+        0,0,187,188,5,110,0,0,188,28,1,0,0,0,189,190,5,102,0,0,190,191,5,
+        114,0,0,191,192,5,111,0,0,192,193,5,109,0,0,193,30,1,0,0,0,194,195,
+        5,116,0,0,195,196,5,111,0,0,196,32,1,0,0,0,197,198,5,100,0,0,198,
+        199,5,101,0,0,199,200,5,102,0,0,200,201,5,105,0,0,201,202,5,110,
+        0,0,202,203,5,101,0,0,203,34,1,0,0,0,204,205,5,40,0,0,205,36,1,0,
+        0,0,206,207,5,41,0,0,207,38,1,0,0,0,208,209,5,97,0,0,209,210,5,115,
+        0,0,210,40,1,0,0,0,211,212,5,101,0,0,212,213,5,110,0,0,213,214,5,
+        100,0,0,214,42,1,0,0,0,215,216,5,105,0,0,216,217,5,109,0,0,217,218,
+        5,112,0,0,218,219,5,111,0,0,219,220,5,114,0,0,220,221,5,116,0,0,
+        221,44,1,0,0,0,222,223,5,44,0,0,223,46,1,0,0,0,224,225,5,98,0,0,
+        225,226,5,114,0,0,226,227,5,101,0,0,227,228,5,97,0,0,228,229,5,107,
+        0,0,229,48,1,0,0,0,230,231,5,99,0,0,231,232,5,111,0,0,232,233,5,
+        110,0,0,233,234,5,116,0,0,234,235,5,105,0,0,235,236,5,110,0,0,236,
+        237,5,117,0,0,237,238,5,101,0,0,238,50,1,0,0,0,239,240,5,114,0,0,
+        240,241,5,101,0,0,241,242,5,116,0,0,242,243,5,117,0,0,243,244,5,
+        114,0,0,244,245,5,110,0,0,245,52,1,0,0,0,246,247,5,103,0,0,247,248,
+        5,111,0,0,248,249,5,116,0,0,249,250,5,111,0,0,250,54,1,0,0,0,251,
+        252,5,35,0,0,252,56,1,0,0,0,253,254,5,93,0,0,254,58,1,0,0,0,255,
+        256,5,96,0,0,256,60,1,0,0,0,257,258,5,94,0,0,258,62,1,0,0,0,259,
+        260,5,42,0,0,260,64,1,0,0,0,261,262,5,47,0,0,262,66,1,0,0,0,263,
+        264,5,43,0,0,264,68,1,0,0,0,265,266,5,45,0,0,266,70,1,0,0,0,267,
+        268,5,124,0,0,268,72,1,0,0,0,269,270,5,61,0,0,270,74,1,0,0,0,271,
+        272,5,33,0,0,272,273,5,61,0,0,273,76,1,0,0,0,274,275,5,62,0,0,275,
+        78,1,0,0,0,276,277,5,62,0,0,277,278,5,61,0,0,278,80,1,0,0,0,279,
+        280,5,60,0,0,280,82,1,0,0,0,281,282,5,60,0,0,282,283,5,61,0,0,283,
+        84,1,0,0,0,284,285,5,97,0,0,285,286,5,110,0,0,286,287,5,100,0,0,
+        287,86,1,0,0,0,288,289,5,111,0,0,289,290,5,114,0,0,290,88,1,0,0,
+        0,291,292,5,124,0,0,292,293,5,62,0,0,293,90,1,0,0,0,294,295,5,46,
+        0,0,295,92,1,0,0,0,296,297,5,41,0,0,297,298,5,32,0,0,298,299,5,45,
+        0,0,299,300,5,62,0,0,300,94,1,0,0,0,301,302,5,126,0,0,302,96,1,0,
+        0,0,303,305,7,0,0,0,304,303,1,0,0,0,305,306,1,0,0,0,306,304,1,0,
+        0,0,306,307,1,0,0,0,307,308,1,0,0,0,308,309,6,48,0,0,309,98,1,0,
+        0,0,310,312,7,1,0,0,311,310,1,0,0,0,312,313,1,0,0,0,313,311,1,0,
+        0,0,313,314,1,0,0,0,314,315,1,0,0,0,315,316,6,49,0,0,316,100,1,0,
+        0,0,317,318,5,47,0,0,318,319,5,42,0,0,319,323,1,0,0,0,320,322,9,
+        0,0,0,321,320,1,0,0,0,322,325,1,0,0,0,323,324,1,0,0,0,323,321,1,
+        0,0,0,324,326,1,0,0,0,325,323,1,0,0,0,326,327,5,42,0,0,327,328,5,
+        47,0,0,328,329,1,0,0,0,329,330,6,50,0,0,330,102,1,0,0,0,331,332,
+        5,47,0,0,332,333,5,47,0,0,333,337,1,0,0,0,334,336,9,0,0,0,335,334,
+        1,0,0,0,336,339,1,0,0,0,337,338,1,0,0,0,337,335,1,0,0,0,338,340,
+        1,0,0,0,339,337,1,0,0,0,340,341,3,97,48,0,341,342,1,0,0,0,342,343,
+        6,51,0,0,343,104,1,0,0,0,344,346,3,107,53,0,345,347,3,109,54,0,346,
+        345,1,0,0,0,346,347,1,0,0,0,347,106,1,0,0,0,348,350,5,45,0,0,349,
+        348,1,0,0,0,349,350,1,0,0,0,350,352,1,0,0,0,351,353,3,115,57,0,352,
+        351,1,0,0,0,353,354,1,0,0,0,354,352,1,0,0,0,354,355,1,0,0,0,355,
+        363,1,0,0,0,356,360,5,46,0,0,357,359,3,115,57,0,358,357,1,0,0,0,
+        359,362,1,0,0,0,360,358,1,0,0,0,360,361,1,0,0,0,361,364,1,0,0,0,
+        362,360,1,0,0,0,363,356,1,0,0,0,363,364,1,0,0,0,364,375,1,0,0,0,
+        365,367,5,45,0,0,366,365,1,0,0,0,366,367,1,0,0,0,367,368,1,0,0,0,
+        368,370,5,46,0,0,369,371,3,115,57,0,370,369,1,0,0,0,371,372,1,0,
+        0,0,372,370,1,0,0,0,372,373,1,0,0,0,373,375,1,0,0,0,374,349,1,0,
+        0,0,374,366,1,0,0,0,375,108,1,0,0,0,376,377,5,42,0,0,377,378,5,49,
+        0,0,378,379,5,48,0,0,379,380,1,0,0,0,380,382,5,94,0,0,381,383,5,
+        45,0,0,382,381,1,0,0,0,382,383,1,0,0,0,383,385,1,0,0,0,384,386,3,
+        115,57,0,385,384,1,0,0,0,386,387,1,0,0,0,387,385,1,0,0,0,387,388,
+        1,0,0,0,388,110,1,0,0,0,389,393,3,117,58,0,390,393,3,119,59,0,391,
+        393,5,95,0,0,392,389,1,0,0,0,392,390,1,0,0,0,392,391,1,0,0,0,393,
+        400,1,0,0,0,394,399,3,117,58,0,395,399,3,119,59,0,396,399,5,95,0,
+        0,397,399,3,115,57,0,398,394,1,0,0,0,398,395,1,0,0,0,398,396,1,0,
+        0,0,398,397,1,0,0,0,399,402,1,0,0,0,400,398,1,0,0,0,400,401,1,0,
+        0,0,401,112,1,0,0,0,402,400,1,0,0,0,403,407,5,34,0,0,404,406,8,2,
+        0,0,405,404,1,0,0,0,406,409,1,0,0,0,407,405,1,0,0,0,407,408,1,0,
+        0,0,408,410,1,0,0,0,409,407,1,0,0,0,410,411,5,34,0,0,411,114,1,0,
+        0,0,412,413,7,3,0,0,413,116,1,0,0,0,414,415,7,4,0,0,415,118,1,0,
+        0,0,416,417,7,5,0,0,417,120,1,0,0,0,19,0,306,313,323,337,346,349,
+        354,360,363,366,372,374,382,387,392,398,400,407,1,6,0,0
+    ]
+
+class ExprLexer(Lexer):
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    T__0 = 1
+    T__1 = 2
+    T__2 = 3
+    T__3 = 4
+    T__4 = 5
+    T__5 = 6
+    T__6 = 7
+    T__7 = 8
+    T__8 = 9
+    T__9 = 10
+    T__10 = 11
+    T__11 = 12
+    T__12 = 13
+    T__13 = 14
+    T__14 = 15
+    T__15 = 16
+    T__16 = 17
+    T__17 = 18
+    T__18 = 19
+    T__19 = 20
+    T__20 = 21
+    T__21 = 22
+    T__22 = 23
+    T__23 = 24
+    T__24 = 25
+    T__25 = 26
+    T__26 = 27
+    T__27 = 28
+    T__28 = 29
+    T__29 = 30
+    T__30 = 31
+    T__31 = 32
+    T__32 = 33
+    T__33 = 34
+    T__34 = 35
+    T__35 = 36
+    T__36 = 37
+    T__37 = 38
+    T__38 = 39
+    T__39 = 40
+    T__40 = 41
+    T__41 = 42
+    T__42 = 43
+    T__43 = 44
+    T__44 = 45
+    T__45 = 46
+    T__46 = 47
+    T__47 = 48
+    NEWLINE = 49
+    SPACE = 50
+    MLC = 51
+    SLC = 52
+    SCI_NUM = 53
+    FLOAT = 54
+    MAG = 55
+    SYMBOL = 56
+    STRING = 57
+
+    channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
+
+    modeNames = [ "DEFAULT_MODE" ]
+
+    literalNames = [ "<INVALID>",
+            "':='", "':~'", "'['", "'] :='", "'if'", "'then'", "'else if'", 
+            "'else'", "'end if'", "'while'", "'loop'", "'end loop'", "'for'", 
+            "'in'", "'from'", "'to'", "'define'", "'('", "')'", "'as'", 
+            "'end'", "'import'", "','", "'break'", "'continue'", "'return'", 
+            "'goto'", "'#'", "']'", "'`'", "'^'", "'*'", "'/'", "'+'", "'-'", 
+            "'|'", "'='", "'!='", "'>'", "'>='", "'<'", "'<='", "'and'", 
+            "'or'", "'|>'", "'.'", "') ->'", "'~'" ]
+
+    symbolicNames = [ "<INVALID>",
+            "NEWLINE", "SPACE", "MLC", "SLC", "SCI_NUM", "FLOAT", "MAG", 
+            "SYMBOL", "STRING" ]
+
+    ruleNames = [ "T__0", "T__1", "T__2", "T__3", "T__4", "T__5", "T__6", 
+                  "T__7", "T__8", "T__9", "T__10", "T__11", "T__12", "T__13", 
+                  "T__14", "T__15", "T__16", "T__17", "T__18", "T__19", 
+                  "T__20", "T__21", "T__22", "T__23", "T__24", "T__25", 
+                  "T__26", "T__27", "T__28", "T__29", "T__30", "T__31", 
+                  "T__32", "T__33", "T__34", "T__35", "T__36", "T__37", 
+                  "T__38", "T__39", "T__40", "T__41", "T__42", "T__43", 
+                  "T__44", "T__45", "T__46", "T__47", "NEWLINE", "SPACE", 
+                  "MLC", "SLC", "SCI_NUM", "FLOAT", "MAG", "SYMBOL", "STRING", 
+                  "DIGIT", "LOWER", "UPPER" ]
+
+    grammarFileName = "Expr.g4"
+
+    def __init__(self, input=None, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = LexerATNSimulator(self, self.atn, self.decisionsToDFA, PredictionContextCache())
+        self._actions = None
+        self._predicates = None
+
+
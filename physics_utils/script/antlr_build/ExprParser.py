@@ -0,0 +1,1786 @@
+# Generated from Expr.g4 by ANTLR 4.13.2
+# encoding: utf-8
+from antlr4 import *
+from io import StringIO
+import sys
+if sys.version_info[1] > 5:
+	from typing import TextIO
+else:
+	from typing.io import TextIO
+
+def serializedATN():
+    return [
+        4,1,57,274,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
+        2,14,7,14,2,15,7,15,1,0,1,0,1,0,1,1,1,1,1,1,5,1,39,8,1,10,1,12,1,
+        42,9,1,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,
+        2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,5,2,67,8,2,10,2,12,2,70,9,2,1,
+        2,1,2,3,2,74,8,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,
+        1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,
+        1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,1,2,
+        5,2,120,8,2,10,2,12,2,123,9,2,3,2,125,8,2,1,3,1,3,1,3,1,3,1,3,1,
+        3,1,3,3,3,134,8,3,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,
+        4,1,4,1,4,1,4,1,4,3,4,152,8,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,
+        4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,
+        4,1,4,1,4,1,4,3,4,182,8,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,4,1,
+        4,1,4,1,4,1,4,5,4,197,8,4,10,4,12,4,200,9,4,1,5,1,5,1,6,1,6,1,6,
+        5,6,207,8,6,10,6,12,6,210,9,6,1,7,1,7,1,7,1,7,5,7,216,8,7,10,7,12,
+        7,219,9,7,3,7,221,8,7,1,7,1,7,1,8,1,8,1,8,5,8,228,8,8,10,8,12,8,
+        231,9,8,3,8,233,8,8,1,9,1,9,1,9,1,10,1,10,1,10,5,10,241,8,10,10,
+        10,12,10,244,9,10,1,11,5,11,247,8,11,10,11,12,11,250,9,11,1,12,1,
+        12,1,12,5,12,255,8,12,10,12,12,12,258,9,12,3,12,260,8,12,1,13,1,
+        13,1,13,3,13,265,8,13,1,13,3,13,268,8,13,1,14,1,14,1,15,1,15,1,15,
+        0,1,8,16,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,0,4,1,0,32,33,
+        1,0,34,35,1,0,37,42,1,0,43,44,305,0,32,1,0,0,0,2,40,1,0,0,0,4,124,
+        1,0,0,0,6,133,1,0,0,0,8,151,1,0,0,0,10,201,1,0,0,0,12,203,1,0,0,
+        0,14,211,1,0,0,0,16,232,1,0,0,0,18,234,1,0,0,0,20,237,1,0,0,0,22,
+        248,1,0,0,0,24,259,1,0,0,0,26,261,1,0,0,0,28,269,1,0,0,0,30,271,
+        1,0,0,0,32,33,3,2,1,0,33,34,5,0,0,1,34,1,1,0,0,0,35,39,3,4,2,0,36,
+        39,3,8,4,0,37,39,3,6,3,0,38,35,1,0,0,0,38,36,1,0,0,0,38,37,1,0,0,
+        0,39,42,1,0,0,0,40,38,1,0,0,0,40,41,1,0,0,0,41,3,1,0,0,0,42,40,1,
+        0,0,0,43,44,3,30,15,0,44,45,5,1,0,0,45,46,3,8,4,0,46,125,1,0,0,0,
+        47,48,3,30,15,0,48,49,5,2,0,0,49,50,3,8,4,0,50,125,1,0,0,0,51,52,
+        3,30,15,0,52,53,5,3,0,0,53,54,3,8,4,0,54,55,5,4,0,0,55,56,3,8,4,
+        0,56,125,1,0,0,0,57,58,5,5,0,0,58,59,3,8,4,0,59,60,5,6,0,0,60,68,
+        3,2,1,0,61,62,5,7,0,0,62,63,3,8,4,0,63,64,5,6,0,0,64,65,3,2,1,0,
+        65,67,1,0,0,0,66,61,1,0,0,0,67,70,1,0,0,0,68,66,1,0,0,0,68,69,1,
+        0,0,0,69,73,1,0,0,0,70,68,1,0,0,0,71,72,5,8,0,0,72,74,3,2,1,0,73,
+        71,1,0,0,0,73,74,1,0,0,0,74,75,1,0,0,0,75,76,5,9,0,0,76,125,1,0,
+        0,0,77,78,5,10,0,0,78,79,3,8,4,0,79,80,5,11,0,0,80,81,3,2,1,0,81,
+        82,5,12,0,0,82,125,1,0,0,0,83,84,5,13,0,0,84,85,3,30,15,0,85,86,
+        5,14,0,0,86,87,3,8,4,0,87,88,5,11,0,0,88,89,3,2,1,0,89,90,5,12,0,
+        0,90,125,1,0,0,0,91,92,5,13,0,0,92,93,3,30,15,0,93,94,5,15,0,0,94,
+        95,3,8,4,0,95,96,5,16,0,0,96,97,3,8,4,0,97,98,5,11,0,0,98,99,3,2,
+        1,0,99,100,5,12,0,0,100,125,1,0,0,0,101,102,5,17,0,0,102,103,3,30,
+        15,0,103,104,5,18,0,0,104,105,3,24,12,0,105,106,5,19,0,0,106,107,
+        5,20,0,0,107,108,3,2,1,0,108,109,5,21,0,0,109,110,3,30,15,0,110,
+        125,1,0,0,0,111,112,5,22,0,0,112,125,3,12,6,0,113,114,5,15,0,0,114,
+        115,3,12,6,0,115,116,5,22,0,0,116,121,3,10,5,0,117,118,5,23,0,0,
+        118,120,3,10,5,0,119,117,1,0,0,0,120,123,1,0,0,0,121,119,1,0,0,0,
+        121,122,1,0,0,0,122,125,1,0,0,0,123,121,1,0,0,0,124,43,1,0,0,0,124,
+        47,1,0,0,0,124,51,1,0,0,0,124,57,1,0,0,0,124,77,1,0,0,0,124,83,1,
+        0,0,0,124,91,1,0,0,0,124,101,1,0,0,0,124,111,1,0,0,0,124,113,1,0,
+        0,0,125,5,1,0,0,0,126,134,5,24,0,0,127,134,5,25,0,0,128,129,5,26,
+        0,0,129,134,3,8,4,0,130,134,5,26,0,0,131,132,5,27,0,0,132,134,3,
+        30,15,0,133,126,1,0,0,0,133,127,1,0,0,0,133,128,1,0,0,0,133,130,
+        1,0,0,0,133,131,1,0,0,0,134,7,1,0,0,0,135,136,6,4,-1,0,136,137,5,
+        28,0,0,137,152,3,8,4,18,138,139,5,18,0,0,139,140,3,24,12,0,140,141,
+        5,47,0,0,141,142,3,8,4,6,142,152,1,0,0,0,143,152,3,26,13,0,144,152,
+        3,28,14,0,145,152,3,14,7,0,146,147,5,18,0,0,147,148,3,8,4,0,148,
+        149,5,19,0,0,149,152,1,0,0,0,150,152,3,30,15,0,151,135,1,0,0,0,151,
+        138,1,0,0,0,151,143,1,0,0,0,151,144,1,0,0,0,151,145,1,0,0,0,151,
+        146,1,0,0,0,151,150,1,0,0,0,152,198,1,0,0,0,153,154,10,14,0,0,154,
+        155,5,31,0,0,155,197,3,8,4,15,156,157,10,13,0,0,157,158,7,0,0,0,
+        158,197,3,8,4,14,159,160,10,12,0,0,160,161,7,1,0,0,161,197,3,8,4,
+        13,162,163,10,11,0,0,163,164,5,36,0,0,164,197,3,8,4,12,165,166,10,
+        10,0,0,166,167,7,2,0,0,167,197,3,8,4,11,168,169,10,9,0,0,169,170,
+        7,3,0,0,170,197,3,8,4,10,171,172,10,8,0,0,172,173,5,45,0,0,173,197,
+        3,8,4,9,174,175,10,17,0,0,175,176,5,3,0,0,176,177,3,8,4,0,177,178,
+        5,29,0,0,178,197,1,0,0,0,179,181,10,16,0,0,180,182,5,30,0,0,181,
+        180,1,0,0,0,181,182,1,0,0,0,182,183,1,0,0,0,183,184,5,18,0,0,184,
+        185,3,16,8,0,185,186,5,19,0,0,186,197,1,0,0,0,187,188,10,15,0,0,
+        188,189,3,22,11,0,189,190,5,18,0,0,190,191,3,20,10,0,191,192,5,19,
+        0,0,192,197,1,0,0,0,193,194,10,7,0,0,194,195,5,46,0,0,195,197,3,
+        10,5,0,196,153,1,0,0,0,196,156,1,0,0,0,196,159,1,0,0,0,196,162,1,
+        0,0,0,196,165,1,0,0,0,196,168,1,0,0,0,196,171,1,0,0,0,196,174,1,
+        0,0,0,196,179,1,0,0,0,196,187,1,0,0,0,196,193,1,0,0,0,197,200,1,
+        0,0,0,198,196,1,0,0,0,198,199,1,0,0,0,199,9,1,0,0,0,200,198,1,0,
+        0,0,201,202,5,56,0,0,202,11,1,0,0,0,203,208,5,56,0,0,204,205,5,46,
+        0,0,205,207,5,56,0,0,206,204,1,0,0,0,207,210,1,0,0,0,208,206,1,0,
+        0,0,208,209,1,0,0,0,209,13,1,0,0,0,210,208,1,0,0,0,211,220,5,3,0,
+        0,212,217,3,8,4,0,213,214,5,23,0,0,214,216,3,8,4,0,215,213,1,0,0,
+        0,216,219,1,0,0,0,217,215,1,0,0,0,217,218,1,0,0,0,218,221,1,0,0,
+        0,219,217,1,0,0,0,220,212,1,0,0,0,220,221,1,0,0,0,221,222,1,0,0,
+        0,222,223,5,29,0,0,223,15,1,0,0,0,224,229,3,8,4,0,225,226,5,23,0,
+        0,226,228,3,8,4,0,227,225,1,0,0,0,228,231,1,0,0,0,229,227,1,0,0,
+        0,229,230,1,0,0,0,230,233,1,0,0,0,231,229,1,0,0,0,232,224,1,0,0,
+        0,232,233,1,0,0,0,233,17,1,0,0,0,234,235,3,22,11,0,235,236,3,8,4,
+        0,236,19,1,0,0,0,237,242,3,18,9,0,238,239,5,23,0,0,239,241,3,18,
+        9,0,240,238,1,0,0,0,241,244,1,0,0,0,242,240,1,0,0,0,242,243,1,0,
+        0,0,243,21,1,0,0,0,244,242,1,0,0,0,245,247,5,32,0,0,246,245,1,0,
+        0,0,247,250,1,0,0,0,248,246,1,0,0,0,248,249,1,0,0,0,249,23,1,0,0,
+        0,250,248,1,0,0,0,251,256,3,30,15,0,252,253,5,23,0,0,253,255,3,30,
+        15,0,254,252,1,0,0,0,255,258,1,0,0,0,256,254,1,0,0,0,256,257,1,0,
+        0,0,257,260,1,0,0,0,258,256,1,0,0,0,259,251,1,0,0,0,259,260,1,0,
+        0,0,260,25,1,0,0,0,261,264,5,53,0,0,262,263,5,48,0,0,263,265,5,53,
+        0,0,264,262,1,0,0,0,264,265,1,0,0,0,265,267,1,0,0,0,266,268,5,56,
+        0,0,267,266,1,0,0,0,267,268,1,0,0,0,268,27,1,0,0,0,269,270,5,57,
+        0,0,270,29,1,0,0,0,271,272,5,56,0,0,272,31,1,0,0,0,22,38,40,68,73,
+        121,124,133,151,181,196,198,208,217,220,229,232,242,248,256,259,
+        264,267
+    ]
+
+class ExprParser ( Parser ):
+
+    grammarFileName = "Expr.g4"
+
+    atn = ATNDeserializer().deserialize(serializedATN())
+
+    decisionsToDFA = [ DFA(ds, i) for i, ds in enumerate(atn.decisionToState) ]
+
+    sharedContextCache = PredictionContextCache()
+
+    literalNames = [ "<INVALID>", "':='", "':~'", "'['", "'] :='", "'if'", 
+                     "'then'", "'else if'", "'else'", "'end if'", "'while'", 
+                     "'loop'", "'end loop'", "'for'", "'in'", "'from'", 
+                     "'to'", "'define'", "'('", "')'", "'as'", "'end'", 
+                     "'import'", "','", "'break'", "'continue'", "'return'", 
+                     "'goto'", "'#'", "']'", "'`'", "'^'", "'*'", "'/'", 
+                     "'+'", "'-'", "'|'", "'='", "'!='", "'>'", "'>='", 
+                     "'<'", "'<='", "'and'", "'or'", "'|>'", "'.'", "') ->'", 
+                     "'~'" ]
+
+    symbolicNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
+                      "<INVALID>", "NEWLINE", "SPACE", "MLC", "SLC", "SCI_NUM", 
+                      "FLOAT", "MAG", "SYMBOL", "STRING" ]
+
+    RULE_prog = 0
+    RULE_block = 1
+    RULE_stat = 2
+    RULE_ctrl = 3
+    RULE_expr = 4
+    RULE_symbol = 5
+    RULE_package = 6
+    RULE_list = 7
+    RULE_args = 8
+    RULE_parg = 9
+    RULE_pargs = 10
+    RULE_stars = 11
+    RULE_params = 12
+    RULE_num = 13
+    RULE_str = 14
+    RULE_var = 15
+
+    ruleNames =  [ "prog", "block", "stat", "ctrl", "expr", "symbol", "package", 
+                   "list", "args", "parg", "pargs", "stars", "params", "num", 
+                   "str", "var" ]
+
+    EOF = Token.EOF
+    T__0=1
+    T__1=2
+    T__2=3
+    T__3=4
+    T__4=5
+    T__5=6
+    T__6=7
+    T__7=8
+    T__8=9
+    T__9=10
+    T__10=11
+    T__11=12
+    T__12=13
+    T__13=14
+    T__14=15
+    T__15=16
+    T__16=17
+    T__17=18
+    T__18=19
+    T__19=20
+    T__20=21
+    T__21=22
+    T__22=23
+    T__23=24
+    T__24=25
+    T__25=26
+    T__26=27
+    T__27=28
+    T__28=29
+    T__29=30
+    T__30=31
+    T__31=32
+    T__32=33
+    T__33=34
+    T__34=35
+    T__35=36
+    T__36=37
+    T__37=38
+    T__38=39
+    T__39=40
+    T__40=41
+    T__41=42
+    T__42=43
+    T__43=44
+    T__44=45
+    T__45=46
+    T__46=47
+    T__47=48
+    NEWLINE=49
+    SPACE=50
+    MLC=51
+    SLC=52
+    SCI_NUM=53
+    FLOAT=54
+    MAG=55
+    SYMBOL=56
+    STRING=57
+
+    def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
+        super().__init__(input, output)
+        self.checkVersion("4.13.2")
+        self._interp = ParserATNSimulator(self, self.atn, self.decisionsToDFA, self.sharedContextCache)
+        self._predicates = None
+
+
+
+
+    class ProgContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def block(self):
+            return self.getTypedRuleContext(ExprParser.BlockContext,0)
+
+
+        def EOF(self):
+            return self.getToken(ExprParser.EOF, 0)
+
+        def getRuleIndex(self):
+            return ExprParser.RULE_prog
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterProg" ):
+                listener.enterProg(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitProg" ):
+                listener.exitProg(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitProg" ):
+                return visitor.visitProg(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def prog(self):
+
+        localctx = ExprParser.ProgContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 0, self.RULE_prog)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 32
+            self.block()
+            self.state = 33
+            self.match(ExprParser.EOF)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class BlockContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def stat(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ExprParser.StatContext)
+            else:
+                return self.getTypedRuleContext(ExprParser.StatContext,i)
+
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ExprParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(ExprParser.ExprContext,i)
+
+
+        def ctrl(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ExprParser.CtrlContext)
+            else:
+                return self.getTypedRuleContext(ExprParser.CtrlContext,i)
+
+
+        def getRuleIndex(self):
+            return ExprParser.RULE_block
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterBlock" ):
+                listener.enterBlock(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitBlock" ):
+                listener.exitBlock(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitBlock" ):
+                return visitor.visitBlock(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def block(self):
+
+        localctx = ExprParser.BlockContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 2, self.RULE_block)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 40
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 225179981893248040) != 0):
+                self.state = 38
+                self._errHandler.sync(self)
+                la_ = self._interp.adaptivePredict(self._input,0,self._ctx)
+                if la_ == 1:
+                    self.state = 35
+                    self.stat()
+                    pass
+
+                elif la_ == 2:
+                    self.state = 36
+                    self.expr(0)
+                    pass
+
+                elif la_ == 3:
+                    self.state = 37
+                    self.ctrl()
+                    pass
+
+
+                self.state = 42
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StatContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def var(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ExprParser.VarContext)
+            else:
+                return self.getTypedRuleContext(ExprParser.VarContext,i)
+
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ExprParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(ExprParser.ExprContext,i)
+
+
+        def block(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ExprParser.BlockContext)
+            else:
+                return self.getTypedRuleContext(ExprParser.BlockContext,i)
+
+
+        def params(self):
+            return self.getTypedRuleContext(ExprParser.ParamsContext,0)
+
+
+        def package(self):
+            return self.getTypedRuleContext(ExprParser.PackageContext,0)
+
+
+        def symbol(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ExprParser.SymbolContext)
+            else:
+                return self.getTypedRuleContext(ExprParser.SymbolContext,i)
+
+
+        def getRuleIndex(self):
+            return ExprParser.RULE_stat
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterStat" ):
+                listener.enterStat(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitStat" ):
+                listener.exitStat(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStat" ):
+                return visitor.visitStat(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def stat(self):
+
+        localctx = ExprParser.StatContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 4, self.RULE_stat)
+        self._la = 0 # Token type
+        try:
+            self.state = 124
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,5,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 43
+                self.var()
+                self.state = 44
+                self.match(ExprParser.T__0)
+                self.state = 45
+                self.expr(0)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 47
+                self.var()
+                self.state = 48
+                self.match(ExprParser.T__1)
+                self.state = 49
+                self.expr(0)
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 51
+                self.var()
+                self.state = 52
+                self.match(ExprParser.T__2)
+                self.state = 53
+                self.expr(0)
+                self.state = 54
+                self.match(ExprParser.T__3)
+                self.state = 55
+                self.expr(0)
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 57
+                self.match(ExprParser.T__4)
+                self.state = 58
+                self.expr(0)
+                self.state = 59
+                self.match(ExprParser.T__5)
+                self.state = 60
+                self.block()
+                self.state = 68
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==7:
+                    self.state = 61
+                    self.match(ExprParser.T__6)
+                    self.state = 62
+                    self.expr(0)
+                    self.state = 63
+                    self.match(ExprParser.T__5)
+                    self.state = 64
+                    self.block()
+                    self.state = 70
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                self.state = 73
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                if _la==8:
+                    self.state = 71
+                    self.match(ExprParser.T__7)
+                    self.state = 72
+                    self.block()
+
+
+                self.state = 75
+                self.match(ExprParser.T__8)
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 77
+                self.match(ExprParser.T__9)
+                self.state = 78
+                self.expr(0)
+                self.state = 79
+                self.match(ExprParser.T__10)
+                self.state = 80
+                self.block()
+                self.state = 81
+                self.match(ExprParser.T__11)
+                pass
+
+            elif la_ == 6:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 83
+                self.match(ExprParser.T__12)
+                self.state = 84
+                self.var()
+                self.state = 85
+                self.match(ExprParser.T__13)
+                self.state = 86
+                self.expr(0)
+                self.state = 87
+                self.match(ExprParser.T__10)
+                self.state = 88
+                self.block()
+                self.state = 89
+                self.match(ExprParser.T__11)
+                pass
+
+            elif la_ == 7:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 91
+                self.match(ExprParser.T__12)
+                self.state = 92
+                self.var()
+                self.state = 93
+                self.match(ExprParser.T__14)
+                self.state = 94
+                self.expr(0)
+                self.state = 95
+                self.match(ExprParser.T__15)
+                self.state = 96
+                self.expr(0)
+                self.state = 97
+                self.match(ExprParser.T__10)
+                self.state = 98
+                self.block()
+                self.state = 99
+                self.match(ExprParser.T__11)
+                pass
+
+            elif la_ == 8:
+                self.enterOuterAlt(localctx, 8)
+                self.state = 101
+                self.match(ExprParser.T__16)
+                self.state = 102
+                self.var()
+                self.state = 103
+                self.match(ExprParser.T__17)
+                self.state = 104
+                self.params()
+                self.state = 105
+                self.match(ExprParser.T__18)
+                self.state = 106
+                self.match(ExprParser.T__19)
+                self.state = 107
+                self.block()
+                self.state = 108
+                self.match(ExprParser.T__20)
+                self.state = 109
+                self.var()
+                pass
+
+            elif la_ == 9:
+                self.enterOuterAlt(localctx, 9)
+                self.state = 111
+                self.match(ExprParser.T__21)
+                self.state = 112
+                self.package()
+                pass
+
+            elif la_ == 10:
+                self.enterOuterAlt(localctx, 10)
+                self.state = 113
+                self.match(ExprParser.T__14)
+                self.state = 114
+                self.package()
+                self.state = 115
+                self.match(ExprParser.T__21)
+                self.state = 116
+                self.symbol()
+                self.state = 121
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==23:
+                    self.state = 117
+                    self.match(ExprParser.T__22)
+                    self.state = 118
+                    self.symbol()
+                    self.state = 123
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class CtrlContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self):
+            return self.getTypedRuleContext(ExprParser.ExprContext,0)
+
+
+        def var(self):
+            return self.getTypedRuleContext(ExprParser.VarContext,0)
+
+
+        def getRuleIndex(self):
+            return ExprParser.RULE_ctrl
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterCtrl" ):
+                listener.enterCtrl(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitCtrl" ):
+                listener.exitCtrl(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitCtrl" ):
+                return visitor.visitCtrl(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def ctrl(self):
+
+        localctx = ExprParser.CtrlContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 6, self.RULE_ctrl)
+        try:
+            self.state = 133
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,6,self._ctx)
+            if la_ == 1:
+                self.enterOuterAlt(localctx, 1)
+                self.state = 126
+                self.match(ExprParser.T__23)
+                pass
+
+            elif la_ == 2:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 127
+                self.match(ExprParser.T__24)
+                pass
+
+            elif la_ == 3:
+                self.enterOuterAlt(localctx, 3)
+                self.state = 128
+                self.match(ExprParser.T__25)
+                self.state = 129
+                self.expr(0)
+                pass
+
+            elif la_ == 4:
+                self.enterOuterAlt(localctx, 4)
+                self.state = 130
+                self.match(ExprParser.T__25)
+                pass
+
+            elif la_ == 5:
+                self.enterOuterAlt(localctx, 5)
+                self.state = 131
+                self.match(ExprParser.T__26)
+                self.state = 132
+                self.var()
+                pass
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ExprContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ExprParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(ExprParser.ExprContext,i)
+
+
+        def params(self):
+            return self.getTypedRuleContext(ExprParser.ParamsContext,0)
+
+
+        def num(self):
+            return self.getTypedRuleContext(ExprParser.NumContext,0)
+
+
+        def str_(self):
+            return self.getTypedRuleContext(ExprParser.StrContext,0)
+
+
+        def list_(self):
+            return self.getTypedRuleContext(ExprParser.ListContext,0)
+
+
+        def var(self):
+            return self.getTypedRuleContext(ExprParser.VarContext,0)
+
+
+        def args(self):
+            return self.getTypedRuleContext(ExprParser.ArgsContext,0)
+
+
+        def stars(self):
+            return self.getTypedRuleContext(ExprParser.StarsContext,0)
+
+
+        def pargs(self):
+            return self.getTypedRuleContext(ExprParser.PargsContext,0)
+
+
+        def symbol(self):
+            return self.getTypedRuleContext(ExprParser.SymbolContext,0)
+
+
+        def getRuleIndex(self):
+            return ExprParser.RULE_expr
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterExpr" ):
+                listener.enterExpr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitExpr" ):
+                listener.exitExpr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitExpr" ):
+                return visitor.visitExpr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+    def expr(self, _p:int=0):
+        _parentctx = self._ctx
+        _parentState = self.state
+        localctx = ExprParser.ExprContext(self, self._ctx, _parentState)
+        _prevctx = localctx
+        _startState = 8
+        self.enterRecursionRule(localctx, 8, self.RULE_expr, _p)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 151
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,7,self._ctx)
+            if la_ == 1:
+                self.state = 136
+                self.match(ExprParser.T__27)
+                self.state = 137
+                self.expr(18)
+                pass
+
+            elif la_ == 2:
+                self.state = 138
+                self.match(ExprParser.T__17)
+                self.state = 139
+                self.params()
+                self.state = 140
+                self.match(ExprParser.T__46)
+                self.state = 141
+                self.expr(6)
+                pass
+
+            elif la_ == 3:
+                self.state = 143
+                self.num()
+                pass
+
+            elif la_ == 4:
+                self.state = 144
+                self.str_()
+                pass
+
+            elif la_ == 5:
+                self.state = 145
+                self.list_()
+                pass
+
+            elif la_ == 6:
+                self.state = 146
+                self.match(ExprParser.T__17)
+                self.state = 147
+                self.expr(0)
+                self.state = 148
+                self.match(ExprParser.T__18)
+                pass
+
+            elif la_ == 7:
+                self.state = 150
+                self.var()
+                pass
+
+
+            self._ctx.stop = self._input.LT(-1)
+            self.state = 198
+            self._errHandler.sync(self)
+            _alt = self._interp.adaptivePredict(self._input,10,self._ctx)
+            while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
+                if _alt==1:
+                    if self._parseListeners is not None:
+                        self.triggerExitRuleEvent()
+                    _prevctx = localctx
+                    self.state = 196
+                    self._errHandler.sync(self)
+                    la_ = self._interp.adaptivePredict(self._input,9,self._ctx)
+                    if la_ == 1:
+                        localctx = ExprParser.ExprContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 153
+                        if not self.precpred(self._ctx, 14):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 14)")
+                        self.state = 154
+                        self.match(ExprParser.T__30)
+                        self.state = 155
+                        self.expr(15)
+                        pass
+
+                    elif la_ == 2:
+                        localctx = ExprParser.ExprContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 156
+                        if not self.precpred(self._ctx, 13):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 13)")
+                        self.state = 157
+                        _la = self._input.LA(1)
+                        if not(_la==32 or _la==33):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 158
+                        self.expr(14)
+                        pass
+
+                    elif la_ == 3:
+                        localctx = ExprParser.ExprContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 159
+                        if not self.precpred(self._ctx, 12):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 12)")
+                        self.state = 160
+                        _la = self._input.LA(1)
+                        if not(_la==34 or _la==35):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 161
+                        self.expr(13)
+                        pass
+
+                    elif la_ == 4:
+                        localctx = ExprParser.ExprContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 162
+                        if not self.precpred(self._ctx, 11):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 11)")
+                        self.state = 163
+                        self.match(ExprParser.T__35)
+                        self.state = 164
+                        self.expr(12)
+                        pass
+
+                    elif la_ == 5:
+                        localctx = ExprParser.ExprContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 165
+                        if not self.precpred(self._ctx, 10):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 10)")
+                        self.state = 166
+                        _la = self._input.LA(1)
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 8658654068736) != 0)):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 167
+                        self.expr(11)
+                        pass
+
+                    elif la_ == 6:
+                        localctx = ExprParser.ExprContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 168
+                        if not self.precpred(self._ctx, 9):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 9)")
+                        self.state = 169
+                        _la = self._input.LA(1)
+                        if not(_la==43 or _la==44):
+                            self._errHandler.recoverInline(self)
+                        else:
+                            self._errHandler.reportMatch(self)
+                            self.consume()
+                        self.state = 170
+                        self.expr(10)
+                        pass
+
+                    elif la_ == 7:
+                        localctx = ExprParser.ExprContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 171
+                        if not self.precpred(self._ctx, 8):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 8)")
+                        self.state = 172
+                        self.match(ExprParser.T__44)
+                        self.state = 173
+                        self.expr(9)
+                        pass
+
+                    elif la_ == 8:
+                        localctx = ExprParser.ExprContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 174
+                        if not self.precpred(self._ctx, 17):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 17)")
+                        self.state = 175
+                        self.match(ExprParser.T__2)
+                        self.state = 176
+                        self.expr(0)
+                        self.state = 177
+                        self.match(ExprParser.T__28)
+                        pass
+
+                    elif la_ == 9:
+                        localctx = ExprParser.ExprContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 179
+                        if not self.precpred(self._ctx, 16):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 16)")
+                        self.state = 181
+                        self._errHandler.sync(self)
+                        _la = self._input.LA(1)
+                        if _la==30:
+                            self.state = 180
+                            self.match(ExprParser.T__29)
+
+
+                        self.state = 183
+                        self.match(ExprParser.T__17)
+                        self.state = 184
+                        self.args()
+                        self.state = 185
+                        self.match(ExprParser.T__18)
+                        pass
+
+                    elif la_ == 10:
+                        localctx = ExprParser.ExprContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 187
+                        if not self.precpred(self._ctx, 15):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 15)")
+                        self.state = 188
+                        self.stars()
+                        self.state = 189
+                        self.match(ExprParser.T__17)
+                        self.state = 190
+                        self.pargs()
+                        self.state = 191
+                        self.match(ExprParser.T__18)
+                        pass
+
+                    elif la_ == 11:
+                        localctx = ExprParser.ExprContext(self, _parentctx, _parentState)
+                        self.pushNewRecursionContext(localctx, _startState, self.RULE_expr)
+                        self.state = 193
+                        if not self.precpred(self._ctx, 7):
+                            from antlr4.error.Errors import FailedPredicateException
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 7)")
+                        self.state = 194
+                        self.match(ExprParser.T__45)
+                        self.state = 195
+                        self.symbol()
+                        pass
+
+             
+                self.state = 200
+                self._errHandler.sync(self)
+                _alt = self._interp.adaptivePredict(self._input,10,self._ctx)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.unrollRecursionContexts(_parentctx)
+        return localctx
+
+
+    class SymbolContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def SYMBOL(self):
+            return self.getToken(ExprParser.SYMBOL, 0)
+
+        def getRuleIndex(self):
+            return ExprParser.RULE_symbol
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterSymbol" ):
+                listener.enterSymbol(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitSymbol" ):
+                listener.exitSymbol(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitSymbol" ):
+                return visitor.visitSymbol(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def symbol(self):
+
+        localctx = ExprParser.SymbolContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 10, self.RULE_symbol)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 201
+            self.match(ExprParser.SYMBOL)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PackageContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def SYMBOL(self, i:int=None):
+            if i is None:
+                return self.getTokens(ExprParser.SYMBOL)
+            else:
+                return self.getToken(ExprParser.SYMBOL, i)
+
+        def getRuleIndex(self):
+            return ExprParser.RULE_package
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterPackage" ):
+                listener.enterPackage(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitPackage" ):
+                listener.exitPackage(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPackage" ):
+                return visitor.visitPackage(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def package(self):
+
+        localctx = ExprParser.PackageContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 12, self.RULE_package)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 203
+            self.match(ExprParser.SYMBOL)
+            self.state = 208
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==46:
+                self.state = 204
+                self.match(ExprParser.T__45)
+                self.state = 205
+                self.match(ExprParser.SYMBOL)
+                self.state = 210
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ListContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ExprParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(ExprParser.ExprContext,i)
+
+
+        def getRuleIndex(self):
+            return ExprParser.RULE_list
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterList" ):
+                listener.enterList(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitList" ):
+                listener.exitList(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitList" ):
+                return visitor.visitList(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def list_(self):
+
+        localctx = ExprParser.ListContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 14, self.RULE_list)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 211
+            self.match(ExprParser.T__2)
+            self.state = 220
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 225179981637222408) != 0):
+                self.state = 212
+                self.expr(0)
+                self.state = 217
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==23:
+                    self.state = 213
+                    self.match(ExprParser.T__22)
+                    self.state = 214
+                    self.expr(0)
+                    self.state = 219
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+
+
+            self.state = 222
+            self.match(ExprParser.T__28)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ArgsContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expr(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ExprParser.ExprContext)
+            else:
+                return self.getTypedRuleContext(ExprParser.ExprContext,i)
+
+
+        def getRuleIndex(self):
+            return ExprParser.RULE_args
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterArgs" ):
+                listener.enterArgs(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitArgs" ):
+                listener.exitArgs(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitArgs" ):
+                return visitor.visitArgs(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def args(self):
+
+        localctx = ExprParser.ArgsContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 16, self.RULE_args)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 232
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 225179981637222408) != 0):
+                self.state = 224
+                self.expr(0)
+                self.state = 229
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==23:
+                    self.state = 225
+                    self.match(ExprParser.T__22)
+                    self.state = 226
+                    self.expr(0)
+                    self.state = 231
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PargContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def stars(self):
+            return self.getTypedRuleContext(ExprParser.StarsContext,0)
+
+
+        def expr(self):
+            return self.getTypedRuleContext(ExprParser.ExprContext,0)
+
+
+        def getRuleIndex(self):
+            return ExprParser.RULE_parg
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterParg" ):
+                listener.enterParg(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitParg" ):
+                listener.exitParg(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParg" ):
+                return visitor.visitParg(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def parg(self):
+
+        localctx = ExprParser.PargContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 18, self.RULE_parg)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 234
+            self.stars()
+            self.state = 235
+            self.expr(0)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class PargsContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def parg(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ExprParser.PargContext)
+            else:
+                return self.getTypedRuleContext(ExprParser.PargContext,i)
+
+
+        def getRuleIndex(self):
+            return ExprParser.RULE_pargs
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterPargs" ):
+                listener.enterPargs(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitPargs" ):
+                listener.exitPargs(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitPargs" ):
+                return visitor.visitPargs(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def pargs(self):
+
+        localctx = ExprParser.PargsContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 20, self.RULE_pargs)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 237
+            self.parg()
+            self.state = 242
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==23:
+                self.state = 238
+                self.match(ExprParser.T__22)
+                self.state = 239
+                self.parg()
+                self.state = 244
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StarsContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+
+        def getRuleIndex(self):
+            return ExprParser.RULE_stars
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterStars" ):
+                listener.enterStars(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitStars" ):
+                listener.exitStars(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStars" ):
+                return visitor.visitStars(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def stars(self):
+
+        localctx = ExprParser.StarsContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 22, self.RULE_stars)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 248
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            while _la==32:
+                self.state = 245
+                self.match(ExprParser.T__31)
+                self.state = 250
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class ParamsContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def var(self, i:int=None):
+            if i is None:
+                return self.getTypedRuleContexts(ExprParser.VarContext)
+            else:
+                return self.getTypedRuleContext(ExprParser.VarContext,i)
+
+
+        def getRuleIndex(self):
+            return ExprParser.RULE_params
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterParams" ):
+                listener.enterParams(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitParams" ):
+                listener.exitParams(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitParams" ):
+                return visitor.visitParams(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def params(self):
+
+        localctx = ExprParser.ParamsContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 24, self.RULE_params)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 259
+            self._errHandler.sync(self)
+            _la = self._input.LA(1)
+            if _la==56:
+                self.state = 251
+                self.var()
+                self.state = 256
+                self._errHandler.sync(self)
+                _la = self._input.LA(1)
+                while _la==23:
+                    self.state = 252
+                    self.match(ExprParser.T__22)
+                    self.state = 253
+                    self.var()
+                    self.state = 258
+                    self._errHandler.sync(self)
+                    _la = self._input.LA(1)
+
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class NumContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def SCI_NUM(self, i:int=None):
+            if i is None:
+                return self.getTokens(ExprParser.SCI_NUM)
+            else:
+                return self.getToken(ExprParser.SCI_NUM, i)
+
+        def SYMBOL(self):
+            return self.getToken(ExprParser.SYMBOL, 0)
+
+        def getRuleIndex(self):
+            return ExprParser.RULE_num
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterNum" ):
+                listener.enterNum(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitNum" ):
+                listener.exitNum(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitNum" ):
+                return visitor.visitNum(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def num(self):
+
+        localctx = ExprParser.NumContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 26, self.RULE_num)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 261
+            self.match(ExprParser.SCI_NUM)
+            self.state = 264
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,20,self._ctx)
+            if la_ == 1:
+                self.state = 262
+                self.match(ExprParser.T__47)
+                self.state = 263
+                self.match(ExprParser.SCI_NUM)
+
+
+            self.state = 267
+            self._errHandler.sync(self)
+            la_ = self._interp.adaptivePredict(self._input,21,self._ctx)
+            if la_ == 1:
+                self.state = 266
+                self.match(ExprParser.SYMBOL)
+
+
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class StrContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def STRING(self):
+            return self.getToken(ExprParser.STRING, 0)
+
+        def getRuleIndex(self):
+            return ExprParser.RULE_str
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterStr" ):
+                listener.enterStr(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitStr" ):
+                listener.exitStr(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitStr" ):
+                return visitor.visitStr(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def str_(self):
+
+        localctx = ExprParser.StrContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 28, self.RULE_str)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 269
+            self.match(ExprParser.STRING)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+    class VarContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def SYMBOL(self):
+            return self.getToken(ExprParser.SYMBOL, 0)
+
+        def getRuleIndex(self):
+            return ExprParser.RULE_var
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterVar" ):
+                listener.enterVar(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitVar" ):
+                listener.exitVar(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitVar" ):
+                return visitor.visitVar(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def var(self):
+
+        localctx = ExprParser.VarContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 30, self.RULE_var)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 271
+            self.match(ExprParser.SYMBOL)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
+
+    def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
+        if self._predicates == None:
+            self._predicates = dict()
+        self._predicates[4] = self.expr_sempred
+        pred = self._predicates.get(ruleIndex, None)
+        if pred is None:
+            raise Exception("No predicate with index:" + str(ruleIndex))
+        else:
+            return pred(localctx, predIndex)
+
+    def expr_sempred(self, localctx:ExprContext, predIndex:int):
+            if predIndex == 0:
+                return self.precpred(self._ctx, 14)
+         
+
+            if predIndex == 1:
+                return self.precpred(self._ctx, 13)
+         
+
+            if predIndex == 2:
+                return self.precpred(self._ctx, 12)
+         
+
+            if predIndex == 3:
+                return self.precpred(self._ctx, 11)
+         
+
+            if predIndex == 4:
+                return self.precpred(self._ctx, 10)
+         
+
+            if predIndex == 5:
+                return self.precpred(self._ctx, 9)
+         
+
+            if predIndex == 6:
+                return self.precpred(self._ctx, 8)
+         
+
+            if predIndex == 7:
+                return self.precpred(self._ctx, 17)
+         
+
+            if predIndex == 8:
+                return self.precpred(self._ctx, 16)
+         
+
+            if predIndex == 9:
+                return self.precpred(self._ctx, 15)
+         
+
+            if predIndex == 10:
+                return self.precpred(self._ctx, 7)
+         
+
+
+
+
@@ -1,5 +1,6 @@
 from .antlr_build.ExprParser import ExprParser
 
+from .builtin import show
 from .util import *
 
 def handle_block(interpreter, context, output_expr: bool):
@@ -9,7 +10,7 @@ def handle_block(interpreter, context, output_expr: bool):
         result = get_eval(interpreter, child)
 
         if output_expr and isinstance(child, ExprParser.ExprContext) and result is not None:
-            print(result)
+            print(show(result))
         elif result is not None:
             assert len(result) > 0
 
@@ -1,4 +1,6 @@
 from physics_utils import MeasuredData
+from physics_utils.data.formatting import format_many
+from physics_utils.data.md_base import MeasuredDataBase
 
 import numpy
 
@@ -28,4 +30,21 @@ def std(data: list[MeasuredData]) -> MeasuredData:
     return MeasuredData(
         float(numpy.std(list(map(float, data)))),
         0
-    )
\ No newline at end of file
+    )
+
+def show(value) -> str:
+    """
+    Converts a value into text as print would, with every MeasuredData in a list being formatted together
+    """
+    if not isinstance(value, list):
+        return str(value)
+
+    texts = iter(format_many(x for x in value if isinstance(x, MeasuredDataBase)))
+
+    return "[" + ", ".join(
+        next(texts) if isinstance(x, MeasuredDataBase) else show(x) if isinstance(x, list) else repr(x)
+        for x in value
+    ) + "]"
+
+def print_values(*values) -> None:
+    print(*map(show, values))
@@ -0,0 +1,593 @@
+"""
+Compiles parse trees into trees of closures, so that running a script doesn't have to work out what each node of the
+parse tree is (from its child count and the text of its tokens) every time the node is run
+"""
+from importlib import import_module
+from typing import Any, Callable
+
+from physics_utils import MeasuredData
+from physics_utils.data import tracking_steps
+
+from .antlr_build.ExprParser import ExprParser
+from .builtin import show
+from .control import Break, Continue, BREAK, CONTINUE, raise_signal
+from .datatypes import literal_numbers, parse_number
+from .environment import unset
+from .folding import constant_value
+from .resolver import Scope
+from . import expressions, kinds
+from .kinds import statement_kind, expression_kind
+from .util import *
+
+# a compiled node, which runs it and returns what the interpreter would have returned when visiting it (except for
+# statements, which return the signal of any break or continue run in them)
+Code = Callable[[], Any]
+
+# the kinds of children of a block (see Compiler.compile_children)
+STATEMENT, EXPRESSION, RETURN, SIGNAL = range(4)
+
+class Compiler:
+    """
+    Turns the parse tree of a script into closures which run it with the same behaviour as VisitorInterpreter
+
+    The closures read and write the environment of the interpreter they were compiled for, so a compiled script can be
+    run any number of times, and sees the variables defined by anything else run on the same interpreter. Inside of
+    functions, variables are read and written straight from the slots of the Frames they live in (see resolver.Scope.)
+
+    Attributes
+    ----------
+    interpreter : VisitorInterpreter
+        The interpreter whose environment (and output_expr) the compiled code uses
+    scope : Scope | None
+        The scope of the function being compiled, or None outside of functions
+    """
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        self.scope = None
+
+        self.compilers = {
+            ExprParser.ProgContext:    self.compile_prog,
+            ExprParser.BlockContext:   self.compile_block,
+            ExprParser.StatContext:    self.compile_stat,
+            ExprParser.CtrlContext:    self.compile_ctrl,
+            ExprParser.ExprContext:    self.compile_expr,
+            ExprParser.NumContext:     self.compile_num,
+            ExprParser.StrContext:     self.compile_str,
+            ExprParser.ListContext:    self.compile_list,
+            ExprParser.VarContext:     self.compile_var,
+            ExprParser.SymbolContext:  self.compile_text,
+            ExprParser.PackageContext: self.compile_text,
+        }
+        # statements and expressions are compiled by their kind (see kinds.py)
+        self.statement_compilers = {
+            kinds.ASSIGNMENT:             self.compile_assignment,
+            kinds.UNCERTAINTY_ASSIGNMENT: self.compile_uncertainty_assignment,
+            kinds.LIST_ASSIGNMENT:        self.compile_list_assignment,
+            kinds.IF:                     self.compile_if,
+            kinds.FOR:                    self.compile_for,
+            kinds.WHILE:                  self.compile_while,
+            kinds.DEFINE:                 self.compile_define,
+            kinds.IMPORT:                 self.compile_import,
+            kinds.CTRL:                   self.compile_nothing,
+            kinds.NOTHING:                self.compile_nothing,
+        }
+        self.expression_compilers = {
+            kinds.PARENTHESIS:  lambda context: self.compile_child(context, 1),
+            kinds.BINARY:       self.compile_binary_operator,
+            kinds.INDEX:        self.compile_index,
+            kinds.LAMBDA:       lambda context: self.compile_function(get(context, 1), get(context, 3)),
+            kinds.CALL:         lambda context: self.compile_call(context, 2, expressions.call),
+            kinds.IMAGE_CALL:   lambda context: self.compile_call(context, 3, expressions.image_call),
+            kinds.STARRED_CALL: self.compile_starred_call,
+            kinds.LENGTH:       self.compile_length,
+            kinds.SINGLE:       lambda context: self.compile_child(context, 0),
+            kinds.UNKNOWN:      self.compile_unknown,
+        }
+
+    def compile(self, context) -> Code:
+        """
+        Compiles a node of a parse tree, and everything under it
+        """
+        return self.compilers[type(context)](context)
+
+    def compile_child(self, context, pos: int) -> Code:
+        return self.compile(get(context, pos))
+
+    def compile_prog(self, context) -> Code:
+        children = [self.compile(context.getChild(i)) for i in range(context.getChildCount() - 1)]
+
+        def prog():
+            for child in children:
+                child()
+
+        return prog
+
+    def compile_children(self, context) -> list[tuple[int, Any]]:
+        """
+        Compiles the children of a block, each along with what kind of child it is (see the constants above)
+
+        A statement's code returns a signal (None, BREAK or CONTINUE), an expression's returns its value, a return has
+        the code of the value it returns (or None if it has none), and a break or continue is just its signal.
+        """
+        children = []
+
+        for i in range(count(context)):
+            child = get(context, i)
+
+            if isinstance(child, ExprParser.ExprContext):
+                children.append((EXPRESSION, self.compile(child)))
+            elif isinstance(child, ExprParser.StatContext):
+                children.append((STATEMENT, self.compile(child)))
+            elif get_str(child, 0) == "return":
+                children.append((RETURN, self.compile_child(child, 1) if count(child) == 2 else None))
+            elif get_str(child, 0) in ("break", "continue"):
+                children.append((SIGNAL, BREAK if get_str(child, 0) == "break" else CONTINUE))
+
+        return children
+
+    def compile_block(self, context) -> Code:
+        """
+        Compiles a block which is run on its own (the whole script, or the body of a function), which returns the value
+        it returns, and raises a Break or Continue for any break or continue which isn't inside of one of its loops
+        """
+        interpreter = self.interpreter
+        children = self.compile_children(context)
+
+        def block():
+            output_expr = interpreter.output_expr
+
+            for kind, child in children:
+                if kind is STATEMENT:
+                    signal = child()
+
+                    if signal is not None:
+                        raise_signal(signal)
+                elif kind is EXPRESSION:
+                    result = child()
+
+                    if result is not None:
+                        if output_expr:
+                            print(show(result))
+                        else:
+                            assert len(result) > 0
+
+                            if result[0] == "return" and len(result) == 2:
+                                return result[1]
+                elif kind is RETURN:
+                    # a return without a value is ignored
+                    if child is not None:
+                        return child()
+                else:
+                    raise_signal(child)
+
+            return None
+
+        return block
+
+    def compile_body(self, context) -> Code:
+        """
+        Compiles the body of an if or a loop, which returns the signal of any break or continue run in it (or None),
+        since a return inside of one only leaves the body itself
+        """
+        interpreter = self.interpreter
+        children = self.compile_children(context)
+
+        def body():
+            output_expr = interpreter.output_expr
+
+            for kind, child in children:
+                if kind is STATEMENT:
+                    signal = child()
+
+                    if signal is not None:
+                        return signal
+                elif kind is EXPRESSION:
+                    result = child()
+
+                    if result is not None:
+                        if output_expr:
+                            print(show(result))
+                        else:
+                            assert len(result) > 0
+
+                            if result[0] == "return" and len(result) == 2:
+                                return None
+                elif kind is RETURN:
+                    if child is not None:
+                        child()
+                        return None
+                else:
+                    return child
+
+            return None
+
+        return body
+
+    def compile_stat(self, context) -> Code:
+        return self.statement_compilers[statement_kind(context)](context)
+
+    def compile_nothing(self, context) -> Code:
+        return lambda: None
+
+    def compile_lookup(self, variable: str) -> Code:
+        interpreter = self.interpreter
+
+        if self.scope is None:
+            return lambda: interpreter.env.get(variable)
+
+        address = self.scope.resolve(variable)
+
+        if address is None:
+            # not in any of the Frames, so there's no need to look through them
+            return lambda: interpreter.env.globals.get(variable)
+
+        depth, slot, always_set = address
+
+        if depth == 0 and always_set:
+            return lambda: interpreter.env.slots[slot]
+
+        def lookup():
+            frame = interpreter.env
+
+            for _ in range(depth):
+                frame = frame.parent
+
+            value = frame.slots[slot]
+
+            if value is unset:
+                return frame.parent.get(variable)
+
+            return value
+
+        return lookup
+
+    def compile_store(self, variable: str) -> Callable[[Any], None]:
+        interpreter = self.interpreter
+
+        if self.scope is None:
+            return lambda value: interpreter.env.add(variable, value)
+
+        # everything a function assigns has a slot in its own Frame
+        slot = self.scope.names[variable]
+
+        def store(value):
+            interpreter.env.slots[slot] = value
+
+        return store
+
+    def compile_assignment(self, context) -> Code:
+        # var := expr
+        variable, value = get_str(context, 0), self.compile_child(context, 2)
+        store = self.compile_store(variable)
+
+        def assignment():
+            result = value()
+            store(result)
+
+            if isinstance(result, MeasuredData):
+                result.label = variable
+
+        return assignment
+
+    def compile_uncertainty_assignment(self, context) -> Code:
+        # var :~ expr
+        uncertainty = self.compile_child(context, 2)
+        lookup = self.compile_lookup(get_str(context, 0))
+
+        def uncertainty_assignment():
+            error = uncertainty()
+            lookup().reading_error = error.value
+
+        return uncertainty_assignment
+
+    def compile_list_assignment(self, context) -> Code:
+        # list[index] := expr
+        list_, index = self.compile_child(context, 0), self.compile_child(context, 2)
+        value = self.compile_child(context, 4)
+
+        def list_assignment():
+            target, i = list_(), index()
+            target[int(i)] = value()
+
+        return list_assignment
+
+    def compile_if(self, context) -> Code:
+        # if expr then block (else if expr then block)* (else block)? end if
+        statement_len = count(context)
+        has_else = get_str(context, statement_len - 3) == "else"
+
+        # each condition with its block, starting with the if and then each else if (see statements.handle_if)
+        branches = [
+            (self.compile_child(context, base + 1), self.compile_body(get(context, base + 3)))
+            for base in range(0, statement_len - 4 - 2 * has_else, 4)
+        ]
+        otherwise = self.compile_body(get(context, statement_len - 2)) if has_else else None
+
+        def if_():
+            for condition, body in branches:
+                if condition():
+                    return body()
+
+            if otherwise is not None:
+                return otherwise()
+
+            return None
+
+        return if_
+
+    def compile_for(self, context) -> Code:
+        # for var (in list | from x to y) loop block end loop
+        for_op = get_str(context, 2)
+        store = self.compile_store(get_str(context, 1))
+
+        if for_op == "from":
+            left, right, body = self.compile_child(context, 3), self.compile_child(context, 5), \
+                self.compile_body(get(context, 7))
+
+            def for_range():
+                left_bound, right_bound = left(), right()
+
+                for i in range(int(left_bound), int(right_bound) + 1):
+                    store(MeasuredData(i, 0))
+
+                    # a break or continue in a function called by the body is still raised
+                    try:
+                        signal = body()
+                    except Continue:
+                        continue
+                    except Break:
+                        break
+
+                    if signal is BREAK:
+                        break
+
+            return for_range
+
+        if for_op == "in":
+            values, body = self.compile_child(context, 3), self.compile_body(get(context, 5))
+
+            def for_in():
+                for x in values():
+                    store(x)
+
+                    # a break or continue in a function called by the body is still raised
+                    try:
+                        signal = body()
+                    except Continue:
+                        continue
+                    except Break:
+                        break
+
+                    if signal is BREAK:
+                        break
+
+            return for_in
+
+        def unknown():
+            raise RuntimeError("Unknown for operator \"{}\"".format(for_op))
+
+        return unknown
+
+    def compile_while(self, context) -> Code:
+        # while expr loop block end loop
+        condition, body = self.compile_child(context, 1), self.compile_body(get(context, 3))
+
+        def while_():
+            while condition():
+                try:
+                    signal = body()
+                except Continue:
+                    continue
+                except Break:
+                    break
+
+                if signal is BREAK:
+                    break
+
+        return while_
+
+    def compile_define(self, context) -> Code:
+        # define var(params) as block end var
+        fn_name = get_str(context, 1)
+        end_name = get_str(context, 8)
+
+        if fn_name != end_name:
+            # raised when the definition is run, as the interpreter does
+            def misnamed():
+                raise RuntimeError(
+                    "Function should end with \"end {}\", ends with \"end {}\" instead".format(fn_name, end_name)
+                )
+
+            return misnamed
+
+        store = self.compile_store(fn_name)
+        make_fn = self.compile_function(get(context, 3), get(context, 6))
+
+        def define():
+            store(make_fn())
+
+        return define
+
+    def compile_function(self, parameters, body) -> Code:
+        """
+        Compiles a function, returning code which creates it (closing over the environment it's created in)
+        """
+        interpreter = self.interpreter
+
+        names = [get_str(parameters, i) for i in range(0, count(parameters), 2)]
+        scope = self.scope = Scope(names, body, self.scope)
+
+        body = self.compile(body)
+        self.scope = scope.parent
+
+        def make_fn():
+            curr_env = interpreter.env
+
+            def anon(*args):
+                last_env = interpreter.env
+                interpreter.env = scope.frame(curr_env, args)
+
+                # put back even if the body raises, e.g., a break out of a loop the function was called in
+                try:
+                    return body()
+                finally:
+                    interpreter.env = last_env
+
+            return anon
+
+        return make_fn
+
+    def compile_import(self, context) -> Code:
+        package_name = get_str(context, 1)
+
+        if get_str(context, 0) == "import":
+            # import var
+            store = self.compile_store(package_name)
+            return lambda: store(import_module(package_name))
+
+        # from var import var (, var)*
+        parts = [(get_str(context, i), self.compile_store(get_str(context, i))) for i in range(3, count(context), 2)]
+
+        def import_from():
+            package = import_module(package_name)
+
+            for part_name, store in parts:
+                store(getattr(package, part_name))
+
+        return import_from
+
+    def compile_ctrl(self, context) -> Code:
+        keyword = get_str(context, 0)
+
+        if keyword == "return":
+            if count(context) == 1:
+                return lambda: ["return"]
+
+            value = self.compile_child(context, 1)
+            return lambda: ["return", value()]
+
+        if keyword == "break":
+            def break_():
+                raise Break()
+
+            return break_
+
+        if keyword == "continue":
+            def continue_():
+                raise Continue()
+
+            return continue_
+
+        return lambda: None
+
+    def compile_expr(self, context) -> Code:
+        return self.expression_compilers[expression_kind(context)](context)
+
+    def compile_index(self, context) -> Code:
+        # list[index]
+        list_, index = self.compile_child(context, 0), self.compile_child(context, 2)
+        return lambda: expressions.index_list(list_(), index())
+
+    def compile_length(self, context) -> Code:
+        # #expr
+        value = self.compile_child(context, 1)
+        return lambda: len(value())
+
+    def compile_unknown(self, context) -> Code:
+        text = context.getText()
+
+        def unknown():
+            raise RuntimeError("Failed to handle expression: {}".format(text))
+
+        return unknown
+
+    def compile_binary_operator(self, context) -> Code:
+        # arithmetic on numbers is only worked out ahead of time while steps aren't tracked, since a result with steps
+        # has to be calculated from MeasuredDatas of its own (see folding.py)
+        constant = None if tracking_steps() else constant_value(context)
+
+        if constant is not None:
+            value, reading_error, standard_error = constant.value, constant.reading_error, constant.standard_error
+            return lambda: MeasuredData(value, reading_error, standard_error)
+
+        operator = get_str(context, 1)
+        left, right = self.compile_child(context, 0), self.compile_child(context, 2)
+
+        # the most common operators are written out, rather than going through the lambdas in expressions.operators
+        if operator == "+":
+            return lambda: left() + right()
+        if operator == "-":
+            return lambda: left() - right()
+        if operator == "*":
+            return lambda: left() * right()
+        if operator == "/":
+            return lambda: left() / right()
+        if operator == "^":
+            return lambda: left() ** right()
+
+        if operator not in expressions.operators:
+            # both sides are still run first, as they are by the interpreter
+            def unknown():
+                left(), right()
+                raise RuntimeError("Binary operator '{}' does not exist".format(operator))
+
+            return unknown
+
+        apply = expressions.operators[operator]
+        return lambda: apply(left(), right())
+
+    def compile_call(self, context, args_pos: int, call) -> Code:
+        fn = self.compile_child(context, 0)
+        args_context = get(context, args_pos)
+        args = [self.compile_child(args_context, i) for i in range(0, count(args_context), 2)]
+
+        # looked up when called, rather than bound here, so that the calls can be counted by physics_utils.instrument
+        name = call.__name__
+
+        return lambda: getattr(expressions, name)(fn(), [arg() for arg in args])
+
+    def compile_starred_call(self, context) -> Code:
+        return_stars = len(get_str(context, 1))
+        fn = self.compile_child(context, 0)
+
+        pargs = get(context, 3)
+        pargs = [get(pargs, i) for i in range(0, count(pargs), 2)]
+
+        arg_v = [self.compile_child(parg, 1) for parg in pargs]
+        arg_s = [len(get_str(parg, 0)) for parg in pargs]
+
+        return lambda: expressions.starred_call(fn(), return_stars, [arg() for arg in arg_v], arg_s)
+
+    def compile_num(self, context) -> Code:
+        # worked out once, with a new MeasuredData made every time the number is run (since assigning it to a variable
+        # labels it)
+        value, uncertainty = parse_number(context)
+
+        return lambda: MeasuredData(value, uncertainty)
+
+    def compile_str(self, context) -> Code:
+        text = get_str(context, 0)[1:-1]
+        return lambda: text
+
+    def compile_list(self, context) -> Code:
+        numbers = literal_numbers(context)
+
+        if numbers is not None:
+            # a new list of new MeasuredDatas every time, since lists can be changed and their elements labelled
+            return lambda: [MeasuredData(value, uncertainty) for value, uncertainty in numbers]
+
+        items = [self.compile_child(context, i) for i in range(1, count(context) - 1, 2)]
+        return lambda: [item() for item in items]
+
+    def compile_var(self, context) -> Code:
+        return self.compile_lookup(get_str(context))
+
+    def compile_text(self, context) -> Code:
+        text = get_str(context)
+        return lambda: text
+
+def compile_tree(interpreter, tree) -> Code:
+    """
+    Compiles the parse tree of a script (or any node of it) to be run on the given interpreter
+    """
+    return Compiler(interpreter).compile(tree)
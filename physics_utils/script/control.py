@@ -10,6 +10,14 @@ class Continue(Exception):
     def __init__(self):
         super().__init__("Continue placed outside of loop")
 
+# what the compiled body of an if or a loop returns when a break or continue is run in it, so that loops don't have to
+# catch an exception for every one (see compiler.Compiler.compile_body)
+BREAK, CONTINUE = "break", "continue"
+
+def raise_signal(signal: str):
+    # a signal which reaches the top of a function (or script) is raised, as it would have been
+    raise Break() if signal is BREAK else Continue()
+
 def handle_control(interpreter, context):
     keyword = get_str(context, 0)
 
@@ -3,6 +3,12 @@ from physics_utils import MeasuredData
 from .antlr_build.ExprParser import ExprParser
 
 def make_list(interpreter, context) -> list:
+    numbers = literal_numbers(context)
+
+    if numbers is not None:
+        # a list of only numbers is made straight from their values, without visiting each of them
+        return [MeasuredData(value, uncertainty) for value, uncertainty in numbers]
+
     result = []
 
     for i in range(1, count(context) - 1, 2):
@@ -11,7 +17,49 @@ def make_list(interpreter, context) -> list:
     return result
 
 
+def literal_numbers(context) -> tuple[tuple[float, float], ...] | None:
+    """
+    Returns the value and uncertainty of every element of a list, if they're all numbers (e.g., [1, 2.5~0.1]), and
+    otherwise None
+
+    This is worked out once, and then kept on the list's node of the parse tree.
+    """
+    try:
+        return context.numbers
+    except AttributeError:
+        pass
+
+    numbers = []
+
+    for i in range(1, count(context) - 1, 2):
+        element = get(context, i)
+
+        if count(element) != 1 or not isinstance(get(element, 0), ExprParser.NumContext):
+            numbers = None
+            break
+
+        numbers.append(parse_number(get(element, 0)))
+
+    context.numbers = numbers = None if numbers is None else tuple(numbers)
+    return numbers
+
+
 def make_number(context) -> MeasuredData:
+    # a new MeasuredData is made every time, since assigning it to a variable labels it
+    return MeasuredData(*parse_number(context))
+
+
+def parse_number(context) -> tuple[float, float]:
+    """
+    Returns the value and uncertainty of a number (e.g., 2.5*10^3 ~ 1*10^2)
+
+    The text of the number is only parsed the first time, and then kept on its node of the parse tree.
+    """
+    try:
+        return context.number
+    except AttributeError:
+        pass
+
     numeric_parts = [n.getText().split("*") for n in context.SCI_NUM()]
 
     magnitude_to_int = lambda mag: int(mag.split("^")[1])
@@ -35,7 +83,8 @@ def make_number(context) -> MeasuredData:
         if len(numeric_parts[1]) > 1:
             uncertainty *= 10 ** magnitude_to_int(numeric_parts[1][1])
 
-    return MeasuredData(value, uncertainty)
+    context.number = value, uncertainty
+    return value, uncertainty
 
 
 def make_string(context) -> str:
@@ -1,6 +1,6 @@
 from physics_utils.data import math, avg_measured_datas
 
-from .builtin import steps, std
+from .builtin import steps, std, print_values
 
 class Environment:
     def __init__(self, parent=None, values=None):
@@ -21,9 +21,63 @@ class Environment:
     def add(self, variable: str, value):
         self.values[variable] = value
 
+# what the slot of a variable in a Frame holds until the variable is assigned
+unset = object()
+
+class Frame(Environment):
+    """
+    The environment of a call to a compiled function, which keeps its variables in a list of slots laid out when the
+    function was compiled (see resolver.Scope) rather than in a dictionary
+
+    Compiled code reads and writes the slots directly, while get and add still work by name like any other environment.
+
+    Attributes
+    ----------
+    names : dict[str, int]
+        The slot of each variable the function can assign (shared by every call to it)
+    slots : list
+        The value of each variable, or unset if it hasn't been assigned yet
+    globals : Environment
+        The first environment up the chain which isn't a Frame, which variables no function assigns are looked up in
+    """
+    def __init__(self, parent: Environment, names: dict[str, int], slots: list):
+        self.parent = parent
+        self.names = names
+        self.slots = slots
+        self.globals = parent.globals if isinstance(parent, Frame) else parent
+
+    @property
+    def values(self) -> dict:
+        return {name: self.slots[i] for name, i in self.names.items() if self.slots[i] is not unset}
+
+    def get(self, variable: str):
+        i = self.names.get(variable)
+
+        if i is not None and self.slots[i] is not unset:
+            return self.slots[i]
+
+        return self.parent.get(variable)
+
+    def add(self, variable: str, value):
+        if variable not in self.names:
+            raise RuntimeError("Variable \"{}\" can't be added to a function it isn't assigned in".format(variable))
+
+        self.slots[self.names[variable]] = value
+
+def make_frame(parent: Environment, parameters: list[str], names: dict[str, int], args: tuple) -> Frame:
+    """
+    Returns the Frame for a call to a function with the given parameters (and layout of slots), with its arguments
+    """
+    slots = [unset] * len(names)
+
+    for i, name in enumerate(parameters):
+        slots[names[name]] = args[i]
+
+    return Frame(parent, names, slots)
+
 variables = {
     "sin": math.sin, "cos": math.cos, "tan": math.tan, "arcsin": math.asin, "arctan": math.atan,
-    "exit": exit, "print": print, "steps": steps, "std": std, "avg": avg_measured_datas,
+    "exit": exit, "print": print_values, "steps": steps, "std": std, "avg": avg_measured_datas,
     "true": True, "false": False, "nil": None
 }
 
@@ -1,6 +1,8 @@
 from .util import *
 from .environment import Environment
 from .antlr_build.ExprParser import ExprParser
+from . import kinds
+from .kinds import expression_kind
 
 operators = {
     '+': lambda x, y: x + y, '-': lambda x, y: x - y, '*': lambda x, y: x * y, '/': lambda x, y: x / y,
@@ -41,50 +43,34 @@ def anonymous_fn(interpreter, parameters, body):
 
         interpreter.env = new_env  # add function environment to environment stack
 
-        result = get_eval(interpreter, body)
-
-        interpreter.pop_env()  # remove environment from stack, now that function is done
-        interpreter.env = last_env
-
-        return result
+        # remove environment from stack once the function is done, even if it raised (e.g., breaking out of a loop the
+        # function was called in), so the caller doesn't carry on in the function's environment
+        try:
+            return get_eval(interpreter, body)
+        finally:
+            interpreter.env = last_env
 
     return anon
 
 
-def handle_function_call(interpreter, context):
-    fn = get_eval(interpreter, context, 0)
-
-    if get_str(context, 1) == "`":
-        # image call
-        args = get(context, 3)
-        args = [get_eval(interpreter, args, i) for i in range(0, count(args), 2)]
-        result = []
+def call(fn, args: list):
+    return fn(*args)
 
-        if len(args) > 0:
-            for i in range(len(args[0])):
-                curr_args = [x[i] for x in args]
-                result.append(fn(*curr_args))
-
-        return result
-    else:
-        # normal call
-        args = get(context, 2)
-        args = [get_eval(interpreter, args, i) for i in range(0, count(args), 2)]
-
-        return fn(*args)
 
+def image_call(fn, args: list) -> list:
+    # fn`(args) calls fn on the i-th element of every argument, for each i
+    result = []
 
-def handle_starred_function_call(interpreter, context):
-    return_stars = len(get_str(context, 1))
+    if len(args) > 0:
+        for i in range(len(args[0])):
+            curr_args = [x[i] for x in args]
+            result.append(fn(*curr_args))
 
-    fn = get_eval(interpreter, context, 0)
+    return result
 
-    pargs = get(context, 3)
-    pargs = [get(pargs, i) for i in range(0, count(pargs), 2)]
 
-    arg_v = [get_eval(interpreter, parg, 1) for parg in pargs]
-    arg_s = [len(get_str(parg, 0)) for parg in pargs]
-    
+def starred_call(fn, return_stars: int, arg_v: list, arg_s: list[int]):
+    # fn*(*args) calls fn on the elements of each argument down to its number of stars
     if max(arg_s) != return_stars:
         raise RuntimeError("Return level must match highest input level")
     
@@ -117,42 +103,74 @@ def handle_starred_function_call(interpreter, context):
 
     return result
 
+
+def handle_function_call(interpreter, context):
+    fn = get_eval(interpreter, context, 0)
+
+    if get_str(context, 1) == "`":
+        # image call
+        args = get(context, 3)
+        args = [get_eval(interpreter, args, i) for i in range(0, count(args), 2)]
+
+        return image_call(fn, args)
+    else:
+        # normal call
+        args = get(context, 2)
+        args = [get_eval(interpreter, args, i) for i in range(0, count(args), 2)]
+
+        return call(fn, args)
+
+
+def handle_starred_function_call(interpreter, context):
+    return_stars = len(get_str(context, 1))
+
+    fn = get_eval(interpreter, context, 0)
+
+    pargs = get(context, 3)
+    pargs = [get(pargs, i) for i in range(0, count(pargs), 2)]
+
+    arg_v = [get_eval(interpreter, parg, 1) for parg in pargs]
+    arg_s = [len(get_str(parg, 0)) for parg in pargs]
+
+    return starred_call(fn, return_stars, arg_v, arg_s)
+
+def handle_parenthesis(interpreter, context):
+    # (expr)
+    return get_eval(interpreter, context, 1)
+
+
+def handle_index(interpreter, context):
+    # list[index]
+    return index_list(get_eval(interpreter, context, 0), get_eval(interpreter, context, 2))
+
+
+def handle_lambda(interpreter, context):
+    # (params) -> block
+    return anonymous_fn(interpreter, get(context, 1), get(context, 3))
+
+
+def handle_length(interpreter, context):
+    # #expr
+    return len(get_eval(interpreter, context, 1))
+
+
+def handle_single(interpreter, context):
+    # if the expression has only one token, it's probably a datatype
+    return get_eval(interpreter, context, 0)
+
+
+def handle_unknown(interpreter, context):
+    raise RuntimeError("Failed to handle expression: {}".format(context.getText()))
+
+
+# how to evaluate each kind of expression
+handlers = {
+    kinds.PARENTHESIS: handle_parenthesis, kinds.BINARY: binary_operator, kinds.INDEX: handle_index,
+    kinds.LAMBDA: handle_lambda, kinds.CALL: handle_function_call, kinds.IMAGE_CALL: handle_function_call,
+    kinds.STARRED_CALL: handle_starred_function_call, kinds.LENGTH: handle_length, kinds.SINGLE: handle_single,
+    kinds.UNKNOWN: handle_unknown
+}
+
+
 def handle_expression(interpreter, context):
-    expression_len = count(context)
-
-    if expression_len == 3:
-        # is wrapping parenthesis?
-        if get_str(context, 0) == "(":
-            return get_eval(interpreter, context, 1)
-
-        # if not, must be a binary operator
-        return binary_operator(interpreter, context)
-
-    elif expression_len == 4:
-        if get_str(context, 1) == "[":
-            # list[index]
-            return index_list(get_eval(interpreter, context, 0), get_eval(interpreter, context, 2))
-        elif get_str(context, 2) == ") ->":
-            # (params) -> block
-            return anonymous_fn(interpreter, get(context, 1), get(context, 3))
-        elif get_str(context, 1) == "(":
-            # var(args)
-            return handle_function_call(interpreter, context)
-
-    elif expression_len == 5:
-        if get_str(context, 1) == "`":
-            # var`(args)
-            return handle_function_call(interpreter, context)
-        elif isinstance(get(context, 1), ExprParser.StarsContext):
-            return handle_starred_function_call(interpreter, context)
-
-    elif expression_len == 2:
-        if get_str(context, 0) == "#":
-            # #expr
-            return len(get_eval(interpreter, context, 1))
-
-    elif expression_len == 1:
-        # if the expression has only one token, it's probably a datatype
-        return get_eval(interpreter, context, 0)
-
-    raise RuntimeError("Failed to handle expression: {}".format(context.getText()))
\ No newline at end of file
+    return handlers[expression_kind(context)](interpreter, context)
@@ -0,0 +1,61 @@
+"""
+Works out the value of arithmetic done only on numbers (e.g., 9.81 * 2 or 1 / (3 ~ 0.1)) ahead of time, so that the
+compiler can fold it into a single value
+
+A folded expression still gives a new MeasuredData every time it's run, since assigning it to a variable labels it.
+While LaTeX steps are being tracked (see physics_utils.data.track_steps), the result also has to hold the steps of the
+calculation, made from MeasuredDatas of its own which are told apart by identity, so expressions are only folded when
+they're compiled while steps aren't tracked (e.g., inside of no_steps(), or with --no-steps), and are otherwise run as
+they're written. Transpiled scripts are cached for whichever way they're run later, so they aren't folded.
+"""
+from physics_utils import MeasuredData
+from physics_utils.data import no_steps
+
+from .antlr_build.ExprParser import ExprParser
+from .datatypes import parse_number
+from .expressions import operators
+from . import kinds
+from .kinds import expression_kind
+from .util import *
+
+# the operators which are folded when both of their operands are constants
+folded_operators = ("+", "-", "*", "/", "^")
+
+def constant_value(context) -> MeasuredData | None:
+    """
+    Returns the value of an expression made only of numbers, parentheses and arithmetic on them, or None if it isn't
+    one (or if working it out raises an error, which is left to be raised when the expression is run)
+
+    This is worked out once, and then kept on the expression's node of the parse tree.
+    """
+    try:
+        return context.constant
+    except AttributeError:
+        pass
+
+    context.constant = constant = _constant_value(context)
+    return constant
+
+def _constant_value(context) -> MeasuredData | None:
+    kind = expression_kind(context)
+
+    if kind == kinds.SINGLE:
+        number = get(context, 0)
+        return MeasuredData(*parse_number(number)) if isinstance(number, ExprParser.NumContext) else None
+    if kind == kinds.PARENTHESIS:
+        return constant_value(get(context, 1))
+    if kind != kinds.BINARY or get_str(context, 1) not in folded_operators:
+        return None
+
+    left, right = constant_value(get(context, 0)), constant_value(get(context, 2))
+
+    if left is None or right is None:
+        return None
+
+    try:
+        with no_steps():
+            result = operators[get_str(context, 1)](left, right)
+    except Exception:
+        return None
+
+    return result if isinstance(result, MeasuredData) else None
@@ -0,0 +1,103 @@
+"""
+Works out which alternative of its grammar rule a statement or expression is, once per node of the parse tree
+
+The grammar doesn't label the alternatives of stat and expr, so the kind of a node has to be worked out from how many
+children it has and the text of its tokens. This is done the first time the node is looked at, and then kept on the
+node, so that running it again (e.g., in a loop) only takes a lookup in a table of handlers by kind.
+"""
+from .antlr_build.ExprParser import ExprParser
+from .util import *
+
+# the kinds of statement
+ASSIGNMENT = "assignment"                          # var := expr
+UNCERTAINTY_ASSIGNMENT = "uncertainty assignment"  # var :~ expr
+LIST_ASSIGNMENT = "list assignment"                # expr [ expr ] := expr
+IF = "if"                                          # if expr then block (else if expr then block)* (else block)? end if
+FOR = "for"                                        # for var (in expr | from expr to expr) loop block end loop
+WHILE = "while"                                    # while expr loop block end loop
+DEFINE = "define"                                  # define var(params) as block end var
+IMPORT = "import"                                  # import package, or from package import symbol (, symbol)*
+CTRL = "ctrl"
+NOTHING = "nothing"
+
+# the kinds of expression
+PARENTHESIS = "parenthesis"                        # (expr)
+BINARY = "binary"                                  # expr operator expr
+INDEX = "index"                                    # expr[expr]
+LAMBDA = "lambda"                                  # (params) -> expr
+CALL = "call"                                      # expr(args)
+IMAGE_CALL = "image call"                          # expr`(args)
+STARRED_CALL = "starred call"                      # expr stars(pargs)
+LENGTH = "length"                                  # #expr
+SINGLE = "single"                                  # num, str, list or var
+UNKNOWN = "unknown"
+
+def statement_kind(context) -> str:
+    """
+    Returns the kind of a statement (one of the constants above)
+    """
+    kind = getattr(context, "kind", None)
+
+    if kind is None:
+        kind = context.kind = _statement_kind(context)
+
+    return kind
+
+def _statement_kind(context) -> str:
+    parts = count(context)
+    keyword = get_str(context, 0)
+
+    if parts == 3 and get_str(context, 1) == ":=":
+        return ASSIGNMENT
+    if parts == 3 and get_str(context, 1) == ":~":
+        return UNCERTAINTY_ASSIGNMENT
+    if parts == 5 and get_str(context, 3) == "] :=":
+        return LIST_ASSIGNMENT
+
+    if keyword in (IF, FOR, WHILE, DEFINE):
+        return keyword
+    if keyword == "import" or keyword == "from":
+        return IMPORT
+    if isinstance(get(context, 0), ExprParser.CtrlContext):
+        return CTRL
+
+    return NOTHING
+
+def expression_kind(context) -> str:
+    """
+    Returns the kind of an expression (one of the constants above)
+    """
+    kind = getattr(context, "kind", None)
+
+    if kind is None:
+        kind = context.kind = _expression_kind(context)
+
+    return kind
+
+def _expression_kind(context) -> str:
+    expression_len = count(context)
+
+    if expression_len == 3:
+        return PARENTHESIS if get_str(context, 0) == "(" else BINARY
+
+    if expression_len == 4:
+        if get_str(context, 1) == "[":
+            return INDEX
+        if get_str(context, 2) == ") ->":
+            return LAMBDA
+        if get_str(context, 1) == "(":
+            return CALL
+
+    if expression_len == 5:
+        if get_str(context, 1) == "`":
+            return IMAGE_CALL
+        if isinstance(get(context, 1), ExprParser.StarsContext):
+            return STARRED_CALL
+
+    if expression_len == 2 and get_str(context, 0) == "#":
+        return LENGTH
+
+    if expression_len == 1:
+        return SINGLE
+
+    return UNKNOWN
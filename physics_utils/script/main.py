@@ -1,35 +1,103 @@
 import sys
 from antlr4 import CommonTokenStream, FileStream, InputStream
+from physics_utils.data import track_steps
 from .antlr_build.ExprLexer import ExprLexer
 from .antlr_build.ExprParser import ExprParser
+from .precedence_parser import PrecedenceParser
 from .visitor_interpreter import VisitorInterpreter
+from .transpiler import load_script, transpile_source
 import logging
 
+# the parsers a script can be parsed with (see parse_source)
+parsers = ("antlr", "precedence")
+
 def parse_stream(parser: ExprParser, stream: FileStream | InputStream) -> ExprParser.ProgContext:
     parser.setInputStream(CommonTokenStream(ExprLexer(stream)))
     return parser.block()
 
+def parse_source(source: str, parser="antlr") -> ExprParser.BlockContext | None:
+    """
+    Returns the parse tree of a script, or None if it has syntax errors
+
+    Parameters
+    ----------
+    source : str
+        The source of the script
+    parser : str
+        "antlr" to parse it with the parser ANTLR generates from the grammar, or "precedence" to parse it with the
+        hand-written one in precedence_parser.py, which builds the same tree many times faster
+    """
+    if parser == "precedence":
+        return PrecedenceParser(source).parse()
+    if parser != "antlr":
+        raise ValueError("Unknown parser {!r} (expected one of {})".format(parser, ", ".join(parsers)))
+
+    antlr_parser = ExprParser(None)
+    tree = parse_stream(antlr_parser, InputStream(source))
+
+    return None if antlr_parser.getNumberOfSyntaxErrors() > 0 else tree
+
 def main(argv):
     logger = logging.getLogger(__name__)
 
-    parser = ExprParser(None)
+    # --cache runs a file through a transpiled copy cached next to it, --transpile prints what it transpiles into,
+    # --parser=precedence parses it with the hand-written parser rather than ANTLR's, and --no-steps runs it without
+    # keeping track of the LaTeX steps of its calculations
+    flags = {arg for arg in argv[1:] if arg.startswith("--") and "=" not in arg}
+    options = dict(arg[2:].split("=", 1) for arg in argv[1:] if arg.startswith("--") and "=" in arg)
+    files = [arg for arg in argv[1:] if not arg.startswith("--")]
+
+    parser = options.get("parser", "antlr")
     interp = VisitorInterpreter()
 
-    reading_file = len(argv) > 1
+    if parser not in parsers:
+        logger.error("Unknown parser {!r} (expected one of {})".format(parser, ", ".join(parsers)))
+        return
+
+    if "--no-steps" in flags:
+        track_steps(False)
+
+    reading_file = len(files) > 0
     interp.output_expr = not reading_file
 
+    if reading_file and "--transpile" in flags:
+        with open(files[0], encoding="utf-8") as f:
+            module = transpile_source(f.read(), parser)
+
+        if module is None:
+            logger.error("Syntax Error: Parsing failed")
+        else:
+            print(module, end="")
+
+        return
+
+    if reading_file and "--cache" in flags:
+        run = load_script(files[0], parser=parser)
+
+        if run is None:
+            logger.error("Syntax Error: Parsing failed")
+            return
+
+        try:
+            run(interp)
+        except Exception as e:
+            logger.error("Runtime Error: {}".format(e))
+
+        return
+
     if reading_file:
-        tree = parse_stream(parser, FileStream(argv[1]))
+        with open(files[0], encoding="utf-8") as f:
+            tree = parse_source(f.read(), parser)
 
     while True:
         if not reading_file:
-            tree = parse_stream(parser, InputStream(input(">>> ")))
+            tree = parse_source(input(">>> "), parser)
 
-        if parser.getNumberOfSyntaxErrors() > 0:
+        if tree is None:
             logger.error("Syntax Error: Parsing failed")
         else:
             try:
-                interp.visit(tree)
+                interp.run(tree)
             except Exception as e:
                 logger.error("Runtime Error: {}".format(e))
 
@@ -0,0 +1,594 @@
+"""
+A hand-written lexer and precedence climbing parser for the scripting language (see Expr.g4), as a faster alternative
+to the lexer and parser ANTLR generates from the grammar
+
+The parse tree it builds is made of the same contexts and tokens as the one ExprParser.block builds, child for child, so
+anything which runs a parse tree (the interpreter, the compiler and the transpiler) runs the trees of either parser.
+Where the grammar is ambiguous, it makes the same choices ANTLR's prediction does (e.g., `5 print(x)` is a number with
+the unit print, which is then called, and `f*(x)` is a multiplication rather than a starred call), and like ANTLR, it
+stops without an error at the first token no statement or expression can start with.
+"""
+import re
+import sys
+
+from antlr4.Token import CommonToken, Token
+
+from .antlr_build.ExprParser import ExprParser
+
+# the token type of each literal of the grammar (e.g., ':=' or 'end loop') by its text
+literals = {name[1:-1]: token_type for token_type, name in enumerate(ExprParser.literalNames) if name != "<INVALID>"}
+
+EOF = Token.EOF
+SCI_NUM, MAG, SYMBOL, STRING = ExprParser.SCI_NUM, ExprParser.MAG, ExprParser.SYMBOL, ExprParser.STRING
+
+ASSIGN, UNCERTAINTY_ASSIGN, LIST_ASSIGN = literals[":="], literals[":~"], literals["] :="]
+IF, THEN, ELSE_IF, ELSE, END_IF = (literals[name] for name in ("if", "then", "else if", "else", "end if"))
+WHILE, FOR, IN, FROM, TO = (literals[name] for name in ("while", "for", "in", "from", "to"))
+LOOP, END_LOOP, DEFINE, AS, END = (literals[name] for name in ("loop", "end loop", "define", "as", "end"))
+IMPORT, BREAK, CONTINUE, RETURN, GOTO = (literals[name] for name in ("import", "break", "continue", "return", "goto"))
+LEFT_PAREN, RIGHT_PAREN, LAMBDA_ARROW = literals["("], literals[")"], literals[") ->"]
+LEFT_BRACKET, RIGHT_BRACKET = literals["["], literals["]"]
+COMMA, HASH, BACKTICK, STAR, DOT, TILDE = (literals[name] for name in (",", "#", "`", "*", ".", "~"))
+
+# the precedence of each alternative of expr, as ANTLR numbers them (the first alternative binds the tightest.) the
+# right operand of a binary operator is parsed one level higher, since they're all left associative
+LENGTH_OPERAND = 18
+INDEX = 17
+CALL = 16
+STARRED_CALL = 15
+MULTIPLICATION = 13
+MEMBER = 7
+LAMBDA_BODY = 6
+
+binary_operators = {
+    literals[operator]: precedence
+    for operators, precedence in (
+        ("^", 14), ("* /", 13), ("+ -", 12), ("|", 11), ("= != > >= < <=", 10), ("and or", 9), ("|>", 8)
+    )
+    for operator in operators.split()
+}
+
+expression_starts = {HASH, LEFT_PAREN, SCI_NUM, STRING, LEFT_BRACKET, SYMBOL}
+statement_keywords = {IF, WHILE, FOR, DEFINE, IMPORT, FROM}
+control_keywords = {BREAK, CONTINUE, RETURN, GOTO}
+
+opening_brackets = {LEFT_PAREN, LEFT_BRACKET}
+closing_brackets = {RIGHT_PAREN, LAMBDA_ARROW, RIGHT_BRACKET, LIST_ASSIGN}
+
+# the alternatives are ordered so that the first one to match is the longest any rule of the lexer matches (as ANTLR's
+# lexer picks), e.g. numbers come before '-' and '.', and 'end loop' before the symbol end
+token_pattern = re.compile("|".join((
+    r"(?P<skip>[ \t\r\n]+|/\*.*?\*/|//[^\r\n]*[\r\n])",
+    r"(?P<number>-?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:\*10\^-?[0-9]+)?)",
+    r"(?P<magnitude>\*10\^-?[0-9]+)",
+    r"(?P<symbol>else if|end if|end loop|[A-Za-z_][A-Za-z_0-9]*)",
+    r"(?P<string>\"[^\"]*\")",
+    r"(?P<literal>:=|:~|\] :=|\) ->|!=|>=|<=|\|>|[\[\]()#`^*/+\-|=<>.,~])",
+)), re.DOTALL)
+
+class ScriptSyntaxError(Exception):
+    pass
+
+def tokenize(source: str) -> list[CommonToken]:
+    """
+    Splits the source of a script into the tokens ExprLexer would, ending with an EOF token
+
+    Characters no token can start with are reported (as ANTLR's lexer reports them, to stderr) and skipped.
+    """
+    tokens = []
+    position, line, line_start = 0, 1, 0
+    end = len(source)
+
+    while position < end:
+        match = token_pattern.match(source, position)
+
+        if match is None:
+            # like ANTLR, skip up to and including the character the token couldn't continue with
+            failed = end if source[position] == '"' else position + 1 if source[position] in ":!" else position
+            print("line {}:{} token recognition error at: '{}'".format(
+                line, position - line_start, source[position:failed + 1]
+            ), file=sys.stderr)
+            next_position = min(failed + 1, end)
+        else:
+            kind, next_position = match.lastgroup, match.end()
+
+            if kind != "skip":
+                text = match.group()
+
+                if kind == "number":
+                    token_type = SCI_NUM
+                elif kind == "symbol":
+                    token_type = literals.get(text, SYMBOL)
+                elif kind == "literal":
+                    token_type = literals[text]
+                else:
+                    token_type = MAG if kind == "magnitude" else STRING
+
+                token = CommonToken(type=token_type, start=position, stop=next_position - 1)
+                token.text, token.line, token.column, token.tokenIndex = text, line, position - line_start, len(tokens)
+                tokens.append(token)
+
+                if kind != "string":
+                    # only strings, whitespace and comments can go over more than one line
+                    position = next_position
+                    continue
+
+        newlines = source.count("\n", position, next_position)
+
+        if newlines:
+            line += newlines
+            line_start = source.rfind("\n", position, next_position) + 1
+
+        position = next_position
+
+    token = CommonToken(type=EOF, start=end, stop=end - 1)
+    token.text, token.line, token.column, token.tokenIndex = "<EOF>", line, end - line_start, len(tokens)
+    tokens.append(token)
+
+    return tokens
+
+class PrecedenceParser:
+    """
+    Parses the source of a script into the parse tree ExprParser.block would, with a recursive descent parser for the
+    statements and precedence climbing for the expressions
+
+    Attributes
+    ----------
+    tokens : list[CommonToken]
+        The tokens of the script, ending with an EOF token
+    position : int
+        The index of the next token to be parsed
+    errors : list[str]
+        The syntax errors found while parsing (it stops at the first, so there's at most one)
+    """
+    def __init__(self, source: str):
+        self.tokens = tokenize(source)
+        self.position = 0
+        self.errors = []
+
+    def parse(self) -> ExprParser.BlockContext | None:
+        """
+        Returns the parse tree of the script, or None if it has a syntax error (which is reported to stderr)
+        """
+        try:
+            return self.block(None)
+        except ScriptSyntaxError as e:
+            self.errors.append(str(e))
+            print(e, file=sys.stderr)
+            return None
+
+    def type_at(self, index: int) -> int:
+        return self.tokens[min(index, len(self.tokens) - 1)].type
+
+    def error(self, message: str) -> ScriptSyntaxError:
+        token = self.tokens[self.position]
+        return ScriptSyntaxError("line {}:{} {}".format(token.line, token.column, message))
+
+    def consume(self, context):
+        context.addTokenNode(self.tokens[self.position])
+        self.position += 1
+
+    def match(self, context, token_type: int):
+        token = self.tokens[self.position]
+
+        if token.type != token_type:
+            raise self.error("mismatched input {} expecting {}".format(token_name(token), type_name(token_type)))
+
+        context.addTokenNode(token)
+        self.position += 1
+
+    def block(self, parent) -> ExprParser.BlockContext:
+        context = ExprParser.BlockContext(None, parent)
+
+        while True:
+            token_type = self.tokens[self.position].type
+
+            if token_type in statement_keywords or token_type == SYMBOL and self.starts_assignment(self.position):
+                context.addChild(self.stat(context))
+            elif token_type in control_keywords:
+                context.addChild(self.ctrl(context))
+            elif token_type in expression_starts:
+                context.addChild(self.expr(context, 0))
+            else:
+                # the end of a nested block is checked by the statement it's in
+                return context
+
+    def stat(self, parent) -> ExprParser.StatContext:
+        context = ExprParser.StatContext(None, parent)
+        token_type = self.tokens[self.position].type
+
+        if token_type == SYMBOL:
+            context.addChild(self.var(context))
+
+            if self.tokens[self.position].type == LEFT_BRACKET:
+                # var [ expr ] := expr
+                self.consume(context)
+                context.addChild(self.expr(context, 0))
+                self.match(context, LIST_ASSIGN)
+            else:
+                # var := expr, or var :~ expr
+                self.consume(context)
+
+            context.addChild(self.expr(context, 0))
+        elif token_type == IF:
+            self.consume(context)
+            context.addChild(self.expr(context, 0))
+            self.match(context, THEN)
+            context.addChild(self.block(context))
+
+            while self.tokens[self.position].type == ELSE_IF:
+                self.consume(context)
+                context.addChild(self.expr(context, 0))
+                self.match(context, THEN)
+                context.addChild(self.block(context))
+
+            if self.tokens[self.position].type == ELSE:
+                self.consume(context)
+                context.addChild(self.block(context))
+
+            self.match(context, END_IF)
+        elif token_type == WHILE or token_type == FOR:
+            self.consume(context)
+
+            if token_type == FOR:
+                context.addChild(self.var(context))
+
+                if self.tokens[self.position].type == FROM:
+                    # for var from expr to expr
+                    self.consume(context)
+                    context.addChild(self.expr(context, 0))
+                    self.match(context, TO)
+                else:
+                    self.match(context, IN)
+
+            context.addChild(self.expr(context, 0))
+            self.match(context, LOOP)
+            context.addChild(self.block(context))
+            self.match(context, END_LOOP)
+        elif token_type == DEFINE:
+            self.consume(context)
+            context.addChild(self.var(context))
+            self.match(context, LEFT_PAREN)
+            context.addChild(self.params(context))
+            self.match(context, RIGHT_PAREN)
+            self.match(context, AS)
+            context.addChild(self.block(context))
+            self.match(context, END)
+            context.addChild(self.var(context))
+        elif token_type == IMPORT:
+            self.consume(context)
+            context.addChild(self.package(context))
+        else:
+            # from package import symbol (, symbol)*
+            self.consume(context)
+            context.addChild(self.package(context))
+            self.match(context, IMPORT)
+            context.addChild(self.symbol(context))
+
+            while self.tokens[self.position].type == COMMA:
+                self.consume(context)
+                context.addChild(self.symbol(context))
+
+        return context
+
+    def ctrl(self, parent) -> ExprParser.CtrlContext:
+        context = ExprParser.CtrlContext(None, parent)
+        token_type = self.tokens[self.position].type
+        self.consume(context)
+
+        if token_type == RETURN:
+            next_type = self.tokens[self.position].type
+
+            # a return followed by an assignment returns nothing, with the assignment being the next statement
+            if next_type in expression_starts and not (next_type == SYMBOL and self.starts_assignment(self.position)):
+                context.addChild(self.expr(context, 0))
+        elif token_type == GOTO:
+            context.addChild(self.var(context))
+
+        return context
+
+    def expr(self, parent, precedence: int) -> ExprParser.ExprContext:
+        left = self.primary(parent)
+
+        while True:
+            token_type = self.tokens[self.position].type
+
+            if token_type == STAR:
+                operation = self.star_operation(precedence)
+            elif token_type in binary_operators:
+                operation = "binary" if binary_operators[token_type] >= precedence else None
+            elif token_type == LEFT_PAREN:
+                operation = self.call_operation(precedence)
+            elif token_type == LEFT_BRACKET:
+                operation = "index" if INDEX >= precedence and self.indexes(self.position) else None
+            elif token_type == BACKTICK:
+                operation = "image call" if CALL >= precedence else None
+            elif token_type == DOT:
+                operation = "member" if MEMBER >= precedence else None
+            else:
+                operation = None
+
+            if operation is None:
+                return left
+
+            # the expression so far becomes the first child of the one it's part of, as in ANTLR's left recursion
+            context = ExprParser.ExprContext(None, parent)
+            context.addChild(left)
+            left.parentCtx = context
+
+            if operation == "binary":
+                self.consume(context)
+                context.addChild(self.expr(context, binary_operators[token_type] + 1))
+            elif operation == "index":
+                self.consume(context)
+                context.addChild(self.expr(context, 0))
+                self.match(context, RIGHT_BRACKET)
+            elif operation == "call" or operation == "image call":
+                if operation == "image call":
+                    self.consume(context)
+
+                self.match(context, LEFT_PAREN)
+                context.addChild(self.args(context))
+                self.match(context, RIGHT_PAREN)
+            elif operation == "starred call":
+                context.addChild(self.stars(context))
+                self.match(context, LEFT_PAREN)
+                context.addChild(self.pargs(context))
+                self.match(context, RIGHT_PAREN)
+            else:
+                self.consume(context)
+                context.addChild(self.symbol(context))
+
+            left = context
+
+    def star_operation(self, precedence: int) -> str | None:
+        """
+        Works out whether the '*' after an expression multiplies it, or starts the stars of a starred call
+
+        Where both are possible (e.g., `f*(x)`), ANTLR picks the multiplication.
+        """
+        after = self.position
+
+        while self.type_at(after) == STAR:
+            after += 1
+
+        multiplies, starred = after == self.position + 1, False
+
+        if self.type_at(after) == LEFT_PAREN:
+            close, commas, starred_args = self.scan_brackets(after)
+            arguments = self.type_at(close) == RIGHT_PAREN and close > after + 1
+
+            multiplies = multiplies and (self.starts_lambda(after) or arguments and not commas and not starred_args)
+            starred = arguments
+
+        if multiplies and MULTIPLICATION >= precedence:
+            return "binary"
+        if starred and STARRED_CALL >= precedence:
+            return "starred call"
+        if MULTIPLICATION >= precedence:
+            return "binary"
+
+        return None
+
+    def call_operation(self, precedence: int) -> str | None:
+        """
+        Works out whether the '(' after an expression calls it, and if so, whether as a normal or starred call (without
+        any stars after the function, which is one where any argument has stars)
+        """
+        close, _, starred_args = self.scan_brackets(self.position)
+
+        if self.type_at(close) == LAMBDA_ARROW:
+            # the parameters of an anonymous function starting the next expression
+            return None
+        if starred_args:
+            return "starred call" if STARRED_CALL >= precedence else None
+
+        return "call" if CALL >= precedence else None
+
+    def indexes(self, start: int) -> bool:
+        # rather than the next expression being a list
+        close, commas, _ = self.scan_brackets(start)
+        return not commas and close > start + 1 and self.type_at(close) == RIGHT_BRACKET
+
+    def scan_brackets(self, start: int) -> tuple[int, bool, bool]:
+        """
+        Returns the index of the token closing the bracket at start, and whether there's a comma, or an element starting
+        with a star, directly inside of them
+        """
+        depth, commas, starred = 0, False, False
+        index = start
+
+        while True:
+            token_type = self.type_at(index)
+
+            if token_type in opening_brackets:
+                depth += 1
+            elif token_type in closing_brackets:
+                depth -= 1
+
+                if depth == 0:
+                    return index, commas, starred
+            elif token_type == EOF:
+                return index, commas, starred
+            elif depth == 1:
+                if token_type == COMMA:
+                    commas = True
+                elif token_type == STAR and self.type_at(index - 1) in (LEFT_PAREN, COMMA):
+                    starred = True
+
+            index += 1
+
+    def starts_lambda(self, start: int) -> bool:
+        # ( var (, var)* ) ->
+        index = start + 1
+
+        while self.type_at(index) == SYMBOL:
+            if self.type_at(index + 1) != COMMA:
+                return self.type_at(index + 1) == LAMBDA_ARROW
+
+            index += 2
+
+        return self.type_at(index) == LAMBDA_ARROW and index == start + 1
+
+    def starts_assignment(self, start: int) -> bool:
+        # var := expr, var :~ expr, or var [ expr ] := expr
+        token_type = self.type_at(start + 1)
+
+        if token_type == ASSIGN or token_type == UNCERTAINTY_ASSIGN:
+            return True
+        if token_type != LEFT_BRACKET:
+            return False
+
+        depth = 0
+        index = start + 1
+
+        while True:
+            token_type = self.type_at(index)
+
+            if token_type == LEFT_BRACKET:
+                depth += 1
+            elif token_type == RIGHT_BRACKET or token_type == LIST_ASSIGN:
+                depth -= 1
+
+                if depth == 0:
+                    return token_type == LIST_ASSIGN
+            elif token_type == EOF:
+                return False
+
+            index += 1
+
+    def primary(self, parent) -> ExprParser.ExprContext:
+        context = ExprParser.ExprContext(None, parent)
+        token_type = self.tokens[self.position].type
+
+        if token_type == HASH:
+            self.consume(context)
+            context.addChild(self.expr(context, LENGTH_OPERAND))
+        elif token_type == LEFT_PAREN and self.starts_lambda(self.position):
+            self.consume(context)
+            context.addChild(self.params(context))
+            self.match(context, LAMBDA_ARROW)
+            context.addChild(self.expr(context, LAMBDA_BODY))
+        elif token_type == LEFT_PAREN:
+            self.consume(context)
+            context.addChild(self.expr(context, 0))
+            self.match(context, RIGHT_PAREN)
+        elif token_type == SCI_NUM:
+            context.addChild(self.num(context))
+        elif token_type == STRING:
+            string = ExprParser.StrContext(None, context)
+            self.consume(string)
+            context.addChild(string)
+        elif token_type == LEFT_BRACKET:
+            context.addChild(self.list_(context))
+        elif token_type == SYMBOL:
+            context.addChild(self.var(context))
+        else:
+            raise self.error("no viable alternative at input {}".format(token_name(self.tokens[self.position])))
+
+        return context
+
+    def num(self, parent) -> ExprParser.NumContext:
+        context = ExprParser.NumContext(None, parent)
+        self.consume(context)
+
+        if self.tokens[self.position].type == TILDE:
+            self.consume(context)
+            self.match(context, SCI_NUM)
+
+        # the symbol after a number is its unit, unless it's the variable of the next statement
+        if self.tokens[self.position].type == SYMBOL and not self.starts_assignment(self.position):
+            self.consume(context)
+
+        return context
+
+    def list_(self, parent) -> ExprParser.ListContext:
+        context = ExprParser.ListContext(None, parent)
+        self.consume(context)
+
+        if self.tokens[self.position].type in expression_starts:
+            context.addChild(self.expr(context, 0))
+
+            while self.tokens[self.position].type == COMMA:
+                self.consume(context)
+                context.addChild(self.expr(context, 0))
+
+        self.match(context, RIGHT_BRACKET)
+        return context
+
+    def args(self, parent) -> ExprParser.ArgsContext:
+        context = ExprParser.ArgsContext(None, parent)
+
+        if self.tokens[self.position].type in expression_starts:
+            context.addChild(self.expr(context, 0))
+
+            while self.tokens[self.position].type == COMMA:
+                self.consume(context)
+                context.addChild(self.expr(context, 0))
+
+        return context
+
+    def pargs(self, parent) -> ExprParser.PargsContext:
+        context = ExprParser.PargsContext(None, parent)
+        context.addChild(self.parg(context))
+
+        while self.tokens[self.position].type == COMMA:
+            self.consume(context)
+            context.addChild(self.parg(context))
+
+        return context
+
+    def parg(self, parent) -> ExprParser.PargContext:
+        context = ExprParser.PargContext(None, parent)
+        context.addChild(self.stars(context))
+        context.addChild(self.expr(context, 0))
+        return context
+
+    def stars(self, parent) -> ExprParser.StarsContext:
+        context = ExprParser.StarsContext(None, parent)
+
+        while self.tokens[self.position].type == STAR:
+            self.consume(context)
+
+        return context
+
+    def params(self, parent) -> ExprParser.ParamsContext:
+        context = ExprParser.ParamsContext(None, parent)
+
+        if self.tokens[self.position].type == SYMBOL:
+            context.addChild(self.var(context))
+
+            while self.tokens[self.position].type == COMMA:
+                self.consume(context)
+                context.addChild(self.var(context))
+
+        return context
+
+    def package(self, parent) -> ExprParser.PackageContext:
+        context = ExprParser.PackageContext(None, parent)
+        self.match(context, SYMBOL)
+
+        while self.tokens[self.position].type == DOT:
+            self.consume(context)
+            self.match(context, SYMBOL)
+
+        return context
+
+    def symbol(self, parent) -> ExprParser.SymbolContext:
+        context = ExprParser.SymbolContext(None, parent)
+        self.match(context, SYMBOL)
+        return context
+
+    def var(self, parent) -> ExprParser.VarContext:
+        context = ExprParser.VarContext(None, parent)
+        self.match(context, SYMBOL)
+        return context
+
+def token_name(token: Token) -> str:
+    return "<EOF>" if token.type == EOF else "'{}'".format(token.text)
+
+def type_name(token_type: int) -> str:
+    if token_type < len(ExprParser.literalNames) and ExprParser.literalNames[token_type] != "<INVALID>":
+        return ExprParser.literalNames[token_type]
+
+    return ExprParser.symbolicNames[token_type]
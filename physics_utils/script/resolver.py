@@ -0,0 +1,97 @@
+"""
+Works out where each variable used by a function lives when the function is compiled, so that the compiled code can
+read and write the slots of its Frame (and the Frames of the functions it's inside of) directly, instead of looking
+variables up by name through every environment up the chain
+"""
+from .antlr_build.ExprParser import ExprParser
+from .environment import make_frame
+from . import kinds
+from .kinds import statement_kind
+from .util import *
+
+def assigned_names(block) -> list[str]:
+    """
+    Returns every variable a block can add to the environment it's run in, in the order they first appear
+
+    These are the variables it assigns, loops over, defines and imports (including inside of its ifs and loops, but not
+    inside of the functions it defines, which have environments of their own.)
+    """
+    names = {}
+
+    for i in range(count(block)):
+        stat = get(block, i)
+
+        if not isinstance(stat, ExprParser.StatContext):
+            continue
+
+        kind = statement_kind(stat)
+
+        if kind == kinds.ASSIGNMENT:
+            # var := expr
+            names[get_str(stat, 0)] = None
+        elif kind == kinds.FOR or kind == kinds.DEFINE or kind == kinds.IMPORT and get_str(stat, 0) == "import":
+            names[get_str(stat, 1)] = None
+        elif kind == kinds.IMPORT:
+            # from package import symbol (, symbol)*
+            names.update((get_str(stat, j), None) for j in range(3, count(stat), 2))
+
+        if kind != kinds.DEFINE:
+            for j in range(count(stat)):
+                if isinstance(get(stat, j), ExprParser.BlockContext):
+                    names.update((name, None) for name in assigned_names(get(stat, j)))
+
+    return list(names)
+
+class Scope:
+    """
+    The variables of a function being compiled, as laid out in the slots of the Frames it's called with
+
+    Attributes
+    ----------
+    names : dict[str, int]
+        The slot of every parameter (which come first) and every other variable the function can assign
+    parameters : list[str]
+        The names of the parameters of the function, in order
+    parent : Scope | None
+        The scope of the function this one is defined in, or None if it's defined at the top of the script
+    """
+    def __init__(self, parameters: list[str], body, parent=None):
+        self.names = {}
+        self.parent = parent
+
+        self.parameters = parameters
+
+        for name in parameters:
+            self.names.setdefault(name, len(self.names))
+
+        # the slots below this are parameters, which are always set
+        self.parameter_slots = len(self.names)
+
+        if isinstance(body, ExprParser.BlockContext):
+            for name in assigned_names(body):
+                self.names.setdefault(name, len(self.names))
+
+    def resolve(self, variable: str) -> tuple[int, int, bool] | None:
+        """
+        Returns where a variable used in this scope lives, as how many Frames up the chain it is in, its slot there, and
+        whether it's always set, or None if it's in none of the Frames (and so is looked up in the globals)
+
+        A variable which isn't always set is one the function assigns, which until it has been is looked up further up
+        the chain by name, as it would be otherwise.
+        """
+        scope, depth = self, 0
+
+        while scope is not None:
+            if variable in scope.names:
+                slot = scope.names[variable]
+                return depth, slot, slot < scope.parameter_slots
+
+            scope, depth = scope.parent, depth + 1
+
+        return None
+
+    def frame(self, parent, args: tuple):
+        """
+        Returns the Frame for a call to the function with the given arguments
+        """
+        return make_frame(parent, self.parameters, self.names, args)
@@ -0,0 +1,71 @@
+"""
+Helpers called by the Python modules scripts are transpiled into (see transpiler.py)
+"""
+from importlib import import_module
+
+from physics_utils import MeasuredData
+
+from .builtin import show
+from .control import Break, Continue, BREAK, CONTINUE, raise_signal
+from .environment import make_frame, unset
+from .expressions import operators, index_list
+from . import expressions
+
+__all__ = [
+    "MeasuredData", "Break", "Continue", "BREAK", "CONTINUE", "raise_signal", "show", "operators", "index_list",
+    "expressions", "import_module", "assign", "assign_slot", "lookup", "list_assign", "make_function",
+    "unknown_operator", "fail"
+]
+
+def assign(interpreter, variable: str, value) -> None:
+    # var := expr
+    interpreter.env.add(variable, value)
+
+    if isinstance(value, MeasuredData):
+        value.label = variable
+
+def assign_slot(interpreter, slot: int, variable: str, value) -> None:
+    # var := expr, inside of a function
+    interpreter.env.slots[slot] = value
+
+    if isinstance(value, MeasuredData):
+        value.label = variable
+
+def lookup(frame, slot: int, variable: str):
+    # a variable which might not have been assigned yet in the Frame it's in (see resolver.Scope.resolve)
+    value = frame.slots[slot]
+
+    if value is unset:
+        return frame.parent.get(variable)
+
+    return value
+
+def list_assign(list_: list, index, value) -> None:
+    # list[index] := expr, with the operands given in the order they're run
+    list_[int(index)] = value
+
+def make_function(interpreter, parameters: list[str], names: dict[str, int], body):
+    """
+    Creates a function defined in a script, closing over the environment it's created in
+
+    body is called with the interpreter once the arguments have been put in a new Frame, with the given slots
+    """
+    curr_env = interpreter.env
+
+    def anon(*args):
+        last_env = interpreter.env
+        interpreter.env = make_frame(curr_env, parameters, names, args)
+
+        try:
+            return body(interpreter)
+        finally:
+            interpreter.env = last_env
+
+    return anon
+
+def unknown_operator(operator: str, left, right):
+    # both operands have already been run by the time this is called, as they are by the interpreter
+    raise RuntimeError("Binary operator '{}' does not exist".format(operator))
+
+def fail(message: str):
+    raise RuntimeError(message)
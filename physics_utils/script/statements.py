@@ -4,6 +4,8 @@ from .util import *
 from .expressions import anonymous_fn
 from importlib import import_module
 from .control import Break, Continue
+from . import kinds
+from .kinds import statement_kind
 
 def assignment(interpreter, variable: str, value) -> None:
     interpreter.env.add(variable, value)
@@ -147,42 +149,35 @@ def handle_import(interpreter, context) -> None:
             interpreter.env.add(part_name, getattr(package, part_name))
 
 
+def handle_assignment(interpreter, context) -> None:
+    # var := expr
+    assignment(interpreter, get_str(context, 0), get_eval(interpreter, context, 2))
+
+
+def handle_uncertainty_assignment(interpreter, context) -> None:
+    # var :~ expr
+    uncertainty_assignment(interpreter, get_str(context, 0), get_eval(interpreter, context, 2))
+
+
+def handle_list_assignment(interpreter, context) -> None:
+    # list[index] := expr
+    list_assignment(
+        interpreter, get_eval(interpreter, context, 0), get_eval(interpreter, context, 2),
+        get_eval(interpreter, context, 4)
+    )
+
+
+# how to run each kind of statement
+handlers = {
+    kinds.ASSIGNMENT: handle_assignment, kinds.UNCERTAINTY_ASSIGNMENT: handle_uncertainty_assignment,
+    kinds.LIST_ASSIGNMENT: handle_list_assignment, kinds.IF: handle_if, kinds.FOR: handle_for,
+    kinds.WHILE: handle_while, kinds.DEFINE: handle_define, kinds.IMPORT: handle_import,
+    kinds.CTRL: lambda interpreter, context: get_eval(interpreter, context, 0),
+    kinds.NOTHING: lambda interpreter, context: None
+}
+
 
 def handle_statement(interpreter, context):
-    parts = context.getChildCount()
-
-    assert parts != 0
-
-    keyword = context.getChild(0).getText()
-
-    if parts == 3:
-        # statements of this length typically have an operator in the middle
-        operator = get_str(context, 1)
-
-        if operator == ":=":
-            # var := expr
-            assignment(interpreter, get_str(context, 0), get_eval(interpreter, context, 2))
-        elif operator == ":~":
-            # var := expr
-            uncertainty_assignment(interpreter, get_str(context, 0), get_eval(interpreter, context, 2))
-
-    elif parts == 5:
-        if get_str(context, 3) == "] :=":
-            # list[index] := expr
-            list_assignment(interpreter, get_eval(interpreter, context, 0), get_eval(interpreter, context, 2), get_eval(interpreter, context, 4))
-
-    if keyword == "if":
-        handle_if(interpreter, context)
-    elif keyword == "for":
-        handle_for(interpreter, context)
-    elif keyword == "while":
-        handle_while(interpreter, context)
-    elif keyword == "define":
-        handle_define(interpreter, context)
-    elif keyword == "import" or keyword == "from":
-        handle_import(interpreter, context)
-
-    elif isinstance(get(context, 0), ExprParser.CtrlContext):
-        return get_eval(interpreter, context, 0)
-
-    return None
\ No newline at end of file
+    assert context.getChildCount() != 0
+
+    return handlers[statement_kind(context)](interpreter, context)
@@ -0,0 +1,483 @@
+"""
+Transpiles scripts into Python modules which call the physics_utils runtime directly, and caches them (compiled to
+bytecode) next to the script, so that running an unchanged script again doesn't have to lex or parse it
+
+The generated code has the same behaviour as compiler.Compiler (and so as VisitorInterpreter), down to the order things
+are run in. Each block of the script becomes its own Python function, since a return in a block only leaves that block,
+with the functions for the bodies of ifs and loops returning the signal of any break or continue run in them.
+"""
+import hashlib
+import marshal
+import math
+import os
+import sys
+from typing import Callable
+
+from .antlr_build.ExprParser import ExprParser
+from .datatypes import parse_number
+from .expressions import operators
+from . import kinds
+from .kinds import statement_kind, expression_kind
+from .resolver import Scope
+from .util import *
+
+# bumped whenever the generated code changes, so that caches made by older versions aren't used
+FORMAT_VERSION = 5
+
+# what the name of a cached script has after its own name, before the hash of its source
+cache_tag = "{}.phys{}".format(sys.implementation.cache_tag, FORMAT_VERSION)
+
+header = """\
+# transpiled from a physics_utils script by physics_utils.script.transpiler, do not edit
+from physics_utils.script.runtime import *
+"""
+
+# operators written out as Python operators, rather than going through the lambdas in expressions.operators
+python_operators = {"+": "+", "-": "-", "*": "*", "/": "/", "^": "**"}
+
+def _indent(lines: list[str], depth=1) -> list[str]:
+    return ["    " * depth + line for line in lines]
+
+def _literal(value) -> str:
+    if isinstance(value, float) and not math.isfinite(value):
+        return "float({!r})".format(repr(value))
+    return repr(value)
+
+class Transpiler:
+    """
+    Turns the parse tree of a script into the source of a Python module, with a run(interpreter) function which runs
+    the script on an interpreter (reading and writing its environment)
+
+    Attributes
+    ----------
+    functions : list[str]
+        The source of every function generated so far, in the order they were generated
+    scope : Scope | None
+        The scope of the function being transpiled, or None outside of functions
+    in_body : bool
+        Whether the block being transpiled is the body of an if or a loop, rather than a function or the whole script
+    """
+    def __init__(self):
+        self.functions = []
+        self.names = 0
+        self.scope = None
+        self.in_body = False
+
+        self.statements = {
+            ExprParser.BlockContext:   self.block_call,
+            ExprParser.StatContext:    self.stat,
+            ExprParser.CtrlContext:    self.ctrl,
+            ExprParser.ExprContext:    self.expr_statement,
+        }
+        self.expressions = {
+            ExprParser.ExprContext:    self.expr,
+            ExprParser.NumContext:     self.num,
+            ExprParser.StrContext:     self.string,
+            ExprParser.ListContext:    self.list_,
+            ExprParser.VarContext:     self.var,
+            ExprParser.SymbolContext:  self.text,
+            ExprParser.PackageContext: self.text,
+        }
+
+    def transpile(self, tree) -> str:
+        """
+        Returns the source of the module for the parse tree of a whole script (its prog, or the block under it)
+        """
+        if isinstance(tree, ExprParser.ProgContext):
+            # prog: block EOF
+            tree = get(tree, 0)
+
+        body = self.block_call(tree)
+
+        self.functions.append("\n".join(["def run(interpreter):"] + _indent(body)))
+
+        return header + "\n" + "\n\n".join(self.functions) + "\n"
+
+    def name(self, prefix: str) -> str:
+        self.names += 1
+        return "_{}_{}".format(prefix, self.names)
+
+    def function(self, prefix: str, body: list[str]) -> str:
+        """
+        Adds a function of the interpreter with the given body, and returns its name
+        """
+        name = self.name(prefix)
+        self.functions.append("\n".join(["def {}(interpreter):".format(name)] + _indent(body or ["pass"])))
+
+        return name
+
+    def statement(self, context) -> list[str]:
+        return self.statements[type(context)](context)
+
+    def expression(self, context) -> str:
+        return self.expressions[type(context)](context)
+
+    def child(self, context, pos: int) -> str:
+        return self.expression(get(context, pos))
+
+    def block(self, context, in_body=False) -> str:
+        """
+        Generates the function for a block, returning its name
+
+        The function returns what the block returns, or if the block is the body of an if or a loop, the signal of any
+        break or continue run in it (see compiler.Compiler.compile_body.)
+        """
+        outer, self.in_body = self.in_body, in_body
+        lines = []
+
+        if any(isinstance(get(context, i), ExprParser.ExprContext) for i in range(count(context))):
+            lines.append("output_expr = interpreter.output_expr")
+
+        for i in range(count(context)):
+            lines += self.statement(get(context, i))
+
+        self.in_body = outer
+
+        return self.function("block", lines)
+
+    def block_call(self, context) -> list[str]:
+        return ["{}(interpreter)".format(self.block(context))]
+
+    def body_call(self, context) -> list[str]:
+        # runs the body of an if, passing on any signal it returns
+        return [
+            "signal = {}(interpreter)".format(self.block(context, True)),
+            "if signal is not None:",
+            "    return signal" if self.in_body else "    raise_signal(signal)",
+        ]
+
+    def lookup(self, variable: str) -> str:
+        if self.scope is None:
+            return "interpreter.env.get({!r})".format(variable)
+
+        address = self.scope.resolve(variable)
+
+        if address is None:
+            return "interpreter.env.globals.get({!r})".format(variable)
+
+        depth, slot, always_set = address
+
+        if depth == 0 and always_set:
+            return "interpreter.env.slots[{}]".format(slot)
+
+        return "lookup(interpreter.env{}, {}, {!r})".format(".parent" * depth, slot, variable)
+
+    def store(self, variable: str, value: str) -> str:
+        if self.scope is None:
+            return "interpreter.env.add({!r}, {})".format(variable, value)
+
+        return "interpreter.env.slots[{}] = {}".format(self.scope.names[variable], value)
+
+    def expr_statement(self, context) -> list[str]:
+        # the result of an expression is printed in the REPL, and otherwise checked for a return like the interpreter
+        return [
+            "result = {}".format(self.expression(context)),
+            "if result is not None:",
+            "    if output_expr:",
+            "        print(show(result))",
+            "    else:",
+            "        assert len(result) > 0",
+            "        if result[0] == \"return\" and len(result) == 2:",
+            "            return" if self.in_body else "            return result[1]",
+        ]
+
+    def ctrl(self, context) -> list[str]:
+        keyword = get_str(context, 0)
+
+        if keyword == "return":
+            # a bare return is ignored by the block it's in, and a return in the body of an if or a loop only leaves it
+            if count(context) == 1:
+                return []
+
+            return [self.child(context, 1), "return"] if self.in_body else ["return " + self.child(context, 1)]
+        if keyword in ("break", "continue"):
+            signal = keyword.upper()
+            return ["return " + signal] if self.in_body else ["raise_signal({})".format(signal)]
+
+        return []
+
+    def stat(self, context) -> list[str]:
+        kind = statement_kind(context)
+
+        if kind == kinds.ASSIGNMENT:
+            if self.scope is None:
+                return ["assign(interpreter, {!r}, {})".format(get_str(context, 0), self.child(context, 2))]
+
+            return ["assign_slot(interpreter, {}, {!r}, {})".format(
+                self.scope.names[get_str(context, 0)], get_str(context, 0), self.child(context, 2)
+            )]
+        if kind == kinds.UNCERTAINTY_ASSIGNMENT:
+            # the uncertainty is run before the variable is looked up
+            return ["{}.reading_error = ({}).value".format(self.lookup(get_str(context, 0)), self.child(context, 2))]
+        if kind == kinds.LIST_ASSIGNMENT:
+            return ["list_assign({}, {}, {})".format(self.child(context, 0), self.child(context, 2),
+                                                     self.child(context, 4))]
+
+        if kind == kinds.IF:
+            return self.if_(context)
+        if kind == kinds.FOR:
+            return self.for_(context)
+        if kind == kinds.WHILE:
+            return self.loop("while {}:".format(self.child(context, 1)), get(context, 3))
+        if kind == kinds.DEFINE:
+            return self.define(context)
+        if kind == kinds.IMPORT:
+            return self.import_(context)
+
+        return []
+
+    def if_(self, context) -> list[str]:
+        # if expr then block (else if expr then block)* (else block)? end if
+        statement_len = count(context)
+        has_else = get_str(context, statement_len - 3) == "else"
+
+        lines = []
+
+        for base in range(0, statement_len - 4 - 2 * has_else, 4):
+            lines.append("{} {}:".format("if" if base == 0 else "elif", self.child(context, base + 1)))
+            lines += _indent(self.body_call(get(context, base + 3)))
+
+        if has_else:
+            lines.append("else:")
+            lines += _indent(self.body_call(get(context, statement_len - 2)))
+
+        return lines
+
+    def for_(self, context) -> list[str]:
+        # for var (in list | from x to y) loop block end loop
+        for_op = get_str(context, 2)
+        var_name = get_str(context, 1)
+
+        if for_op == "from":
+            return ["left_bound, right_bound = {}, {}".format(self.child(context, 3), self.child(context, 5))] + \
+                self.loop("for i in range(int(left_bound), int(right_bound) + 1):", get(context, 7),
+                          self.store(var_name, "MeasuredData(i, 0)"))
+        if for_op == "in":
+            return self.loop("for x in {}:".format(self.child(context, 3)), get(context, 5),
+                             self.store(var_name, "x"))
+
+        return ["fail({!r})".format("Unknown for operator \"{}\"".format(for_op))]
+
+    def loop(self, head: str, body, setup: str | None = None) -> list[str]:
+        lines = [] if setup is None else [setup]
+        lines += [
+            # a break or continue in a function called by the body is still raised
+            "try:",
+            "    signal = {}(interpreter)".format(self.block(body, True)),
+            "except Continue:",
+            "    continue",
+            "except Break:",
+            "    break",
+            "if signal is BREAK:",
+            "    break",
+        ]
+
+        return [head] + _indent(lines)
+
+    def define(self, context) -> list[str]:
+        # define var(params) as block end var
+        fn_name = get_str(context, 1)
+        end_name = get_str(context, 8)
+
+        if fn_name != end_name:
+            # raised when the definition is run, as the interpreter does
+            return ["fail({!r})".format(
+                "Function should end with \"end {}\", ends with \"end {}\" instead".format(fn_name, end_name)
+            )]
+
+        return [self.store(fn_name, self.make_function(get(context, 3), get(context, 6)))]
+
+    def make_function(self, parameters, body) -> str:
+        """
+        Generates the function for the body of a function defined in the script, returning the code which creates it
+        """
+        names = [get_str(parameters, i) for i in range(0, count(parameters), 2)]
+        scope = self.scope = Scope(names, body, self.scope)
+
+        if isinstance(body, ExprParser.BlockContext):
+            name = self.block(body)
+        else:
+            name = self.function("lambda", ["return " + self.expression(body)])
+
+        self.scope = scope.parent
+
+        return "make_function(interpreter, {!r}, {!r}, {})".format(names, scope.names, name)
+
+    def import_(self, context) -> list[str]:
+        package_name = get_str(context, 1)
+
+        if get_str(context, 0) == "import":
+            # import var
+            return [self.store(package_name, "import_module({!r})".format(package_name))]
+
+        # from var import var (, var)*
+        return ["package = import_module({!r})".format(package_name)] + [
+            self.store(get_str(context, i), "getattr(package, {!r})".format(get_str(context, i)))
+            for i in range(3, count(context), 2)
+        ]
+
+    def expr(self, context) -> str:
+        kind = expression_kind(context)
+
+        if kind == kinds.PARENTHESIS:
+            return self.child(context, 1)
+        if kind == kinds.BINARY:
+            return self.binary_operator(context)
+        if kind == kinds.INDEX:
+            return "index_list({}, {})".format(self.child(context, 0), self.child(context, 2))
+        if kind == kinds.LAMBDA:
+            return self.make_function(get(context, 1), get(context, 3))
+        if kind == kinds.CALL:
+            return self.call(context, 2, "call")
+        if kind == kinds.IMAGE_CALL:
+            return self.call(context, 3, "image_call")
+        if kind == kinds.STARRED_CALL:
+            return self.starred_call(context)
+        if kind == kinds.LENGTH:
+            return "len({})".format(self.child(context, 1))
+        if kind == kinds.SINGLE:
+            return self.child(context, 0)
+
+        return "fail({!r})".format("Failed to handle expression: {}".format(context.getText()))
+
+    def binary_operator(self, context) -> str:
+        operator = get_str(context, 1)
+        left, right = self.child(context, 0), self.child(context, 2)
+
+        if operator in python_operators:
+            return "({} {} {})".format(left, python_operators[operator], right)
+        if operator in operators:
+            return "operators[{!r}]({}, {})".format(operator, left, right)
+
+        # both sides are still run first, as they are by the interpreter
+        return "unknown_operator({!r}, {}, {})".format(operator, left, right)
+
+    def call(self, context, args_pos: int, call: str) -> str:
+        args_context = get(context, args_pos)
+        args = [self.child(args_context, i) for i in range(0, count(args_context), 2)]
+
+        # made through the expressions module, so that the calls can be counted by physics_utils.instrument
+        return "expressions.{}({}, [{}])".format(call, self.child(context, 0), ", ".join(args))
+
+    def starred_call(self, context) -> str:
+        return_stars = len(get_str(context, 1))
+
+        pargs = get(context, 3)
+        pargs = [get(pargs, i) for i in range(0, count(pargs), 2)]
+
+        return "expressions.starred_call({}, {}, [{}], {!r})".format(
+            self.child(context, 0), return_stars, ", ".join(self.child(parg, 1) for parg in pargs),
+            [len(get_str(parg, 0)) for parg in pargs]
+        )
+
+    def num(self, context) -> str:
+        # a new MeasuredData is made every time the number is run, since assigning it to a variable labels it
+        value, uncertainty = parse_number(context)
+        return "MeasuredData({}, {})".format(_literal(value), _literal(uncertainty))
+
+    def string(self, context) -> str:
+        return repr(get_str(context, 0)[1:-1])
+
+    def list_(self, context) -> str:
+        return "[{}]".format(", ".join(self.child(context, i) for i in range(1, count(context) - 1, 2)))
+
+    def var(self, context) -> str:
+        return self.lookup(get_str(context))
+
+    def text(self, context) -> str:
+        return repr(get_str(context))
+
+def transpile_source(source: str, parser="antlr") -> str | None:
+    """
+    Returns the source of the Python module a script is transpiled into, or None if it has syntax errors (parsed with
+    the given parser, see main.parse_source)
+    """
+    from .main import parse_source
+
+    tree = parse_source(source, parser)
+
+    if tree is None:
+        return None
+
+    return Transpiler().transpile(tree)
+
+def cache_path(file_name: str, source: bytes) -> str:
+    """
+    Returns where the transpiled script with the given source is cached, which is in the __pycache__ directory next to
+    it, keyed by the hash of the source
+    """
+    directory, base = os.path.split(os.path.abspath(file_name))
+    digest = hashlib.sha256(source).hexdigest()[:16]
+
+    return os.path.join(directory, "__pycache__", "{}.{}.{}.physc".format(base, cache_tag, digest))
+
+def _load_cache(path: str):
+    try:
+        with open(path, "rb") as f:
+            return marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+def _save_cache(path: str, code) -> None:
+    directory, base = os.path.split(path)
+    prefix = base.rsplit(".", 2)[0] + "."
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+
+        # written to a temporary file first, so a script being run at the same time never sees half of it
+        temp = "{}.{}.tmp".format(path, os.getpid())
+        with open(temp, "wb") as f:
+            marshal.dump(code, f)
+        os.replace(temp, path)
+
+        # older versions of the same script are no longer needed
+        for name in os.listdir(directory):
+            if name.startswith(prefix) and name.endswith(".physc") and name != base:
+                os.remove(os.path.join(directory, name))
+    except OSError:
+        # e.g., the directory being read-only, in which case the script is transpiled again next time
+        pass
+
+def load_script(file_name: str, cache=True, parser="antlr") -> Callable | None:
+    """
+    Returns a function which runs a script file on an interpreter, or None if it has syntax errors
+
+    The script is transpiled into Python (and compiled to bytecode) the first time it's loaded, and the result is
+    cached, so that later loads of the same source skip lexing and parsing it entirely.
+
+    Parameters
+    ----------
+    file_name : str
+        The path to the script
+    cache : bool
+        Whether to read and write the cache, rather than always transpiling the script
+    parser : str
+        Which parser to parse the script with when it isn't cached, "antlr" or "precedence" (see main.parse_source)
+
+    Examples
+    --------
+    >>> run = load_script("script.phys")  # doctest: +SKIP
+    >>> run(VisitorInterpreter())  # doctest: +SKIP
+    """
+    with open(file_name, "rb") as f:
+        source = f.read()
+
+    path = cache_path(file_name, source)
+    code = _load_cache(path) if cache else None
+
+    if code is None:
+        module = transpile_source(source.decode("utf-8"), parser)
+
+        if module is None:
+            return None
+
+        code = compile(module, file_name, "exec")
+
+        if cache:
+            _save_cache(path, code)
+
+    namespace = {"__name__": "physics_utils.script.transpiled"}
+    exec(code, namespace)
+
+    return namespace["run"]
@@ -9,6 +9,7 @@ from .block       import handle_block
 from .control     import handle_control
 from .datatypes   import make_list, make_number, make_string, make_symbol, make_package
 from .environment import Environment, default_environment
+from .compiler    import compile_tree
 
 
 class VisitorInterpreter(ExprVisitor):
@@ -23,6 +24,13 @@ class VisitorInterpreter(ExprVisitor):
     def pop_env(self) -> None:
         self.env = self.env.parent
 
+    def run(self, tree):
+        """
+        Runs a parse tree by first compiling it (see compiler.Compiler), which gives the same result as visiting it
+        but runs much faster for anything which loops or calls functions
+        """
+        return compile_tree(self, tree)()
+
     def visitNum(self, ctx: ExprParser.NumContext) -> MeasuredData:
         return make_number(ctx)
 
@@ -1,4 +1,5 @@
 from .data import MeasuredData
+from .data.formatting import latex_many
 
 class Table2D:
     """
@@ -39,9 +40,12 @@ class Table2D:
         sb += " & ".join(self.column_labels)
         sb += " \\\\\n\r\t\t\\hline\n\r\n\r"
 
+        # every measured cell in the table is formatted at once
+        cells = iter(latex_many(x for row in self.rows for x in row if isinstance(x, MeasuredData)))
+
         for row in self.rows:
             sb += "\t\t"
-            sb += " & ".join([x.latex() if isinstance(x, MeasuredData) else str(x) for x in row])
+            sb += " & ".join([next(cells) if isinstance(x, MeasuredData) else str(x) for x in row])
             sb += " \\\\\n\r\t\t\\hline\n\r\n\r"
 
         sb += "\t\\end {tabular}\n\r"
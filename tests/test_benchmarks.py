@@ -0,0 +1,18 @@
+import unittest
+import json
+import os
+from benchmarks.suite import benchmarks
+
+
+class TestBaseline(unittest.TestCase):
+
+    def test_every_benchmark_has_a_baseline(self):
+        # a benchmark without a baseline is left out of the comparison, so a regression in it would go unnoticed
+        with open(os.path.join(os.path.dirname(__file__), "..", "benchmarks", "baseline.json")) as f:
+            baseline = json.load(f)
+
+        self.assertEqual(set(benchmarks) - set(baseline["results"]), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from physics_utils import MeasuredData
+from physics_utils.data import CorrelatedData, MeasuredArray
+import numpy as np
+import math
+
+
+class TestCorrelatedData(unittest.TestCase):
+
+    def setUp(self):
+        self.x = CorrelatedData(5.0, 0.2, 0.1)
+        self.y = CorrelatedData(2.0, 0.1, 0.05)
+
+    def test_cancellation(self):
+        self.assertEqual((self.x - self.x).reading_error, 0)
+        self.assertEqual((self.x - self.x).standard_error, 0)
+        self.assertAlmostEqual((self.x / self.x).reading_error, 0)
+        self.assertAlmostEqual((2 * self.x - self.x - self.x).reading_error, 0)
+
+    def test_repeated_operand(self):
+        result = self.x * self.x
+        self.assertAlmostEqual(result.value, 25.0)
+        self.assertAlmostEqual(result.reading_error, 2 * 5.0 * 0.2)
+        self.assertAlmostEqual(result.standard_error, 2 * 5.0 * 0.1)
+
+    def test_independent_operands(self):
+        # with no shared measurements, results agree with MeasuredData
+        for a, b in [(self.x * self.y, MeasuredData(5.0, 0.2, 0.1) * MeasuredData(2.0, 0.1, 0.05)),
+                     (self.x + self.y, MeasuredData(5.0, 0.2, 0.1) + MeasuredData(2.0, 0.1, 0.05)),
+                     (self.x / self.y, MeasuredData(5.0, 0.2, 0.1) / MeasuredData(2.0, 0.1, 0.05))]:
+            self.assertAlmostEqual(a.value, b.value)
+            self.assertAlmostEqual(a.reading_error, b.reading_error)
+            self.assertAlmostEqual(a.standard_error, b.standard_error)
+
+    def test_trigonometry(self):
+        angle = CorrelatedData(0.4, 0.01)
+        self.assertAlmostEqual((angle.sine() ** 2 + angle.cosine() ** 2).reading_error, 0)
+        self.assertAlmostEqual(angle.tangent().reading_error, 0.01 / math.cos(0.4) ** 2)
+
+    def test_plain_measured_operands(self):
+        other = MeasuredData(1.0, 0.3)
+        result = other + self.x - self.x
+
+        self.assertIsInstance(result, CorrelatedData)
+        self.assertAlmostEqual(result.reading_error, 0.3)
+
+    def test_array_operands(self):
+        values = np.array([1.0, 2.0])
+        plain = MeasuredData(5.0, 0.2, 0.1)
+
+        for other in (values, MeasuredArray(values, 0.1)):
+            for op in (np.add, np.subtract, np.multiply, np.divide):
+                with self.subTest(op=op.__name__, other=type(other).__name__):
+                    for result, expected in ((op(self.x, other), op(plain, other)),
+                                             (op(other, self.x), op(other, plain))):
+                        self.assertIsInstance(result, MeasuredArray)
+                        np.testing.assert_allclose(result.value, expected.value)
+                        np.testing.assert_allclose(result.reading_error, expected.reading_error)
+
+            with self.subTest("operators", other=type(other).__name__):
+                self.assertIsInstance(self.x * other, MeasuredArray)
+                self.assertIsInstance(self.x + other, MeasuredArray)
+                self.assertIsInstance(self.x ** other, MeasuredArray)
+
+        # numpy scalars are still plain numbers
+        self.assertIsInstance(self.x * np.float64(2.0), CorrelatedData)
+        self.assertIsInstance(self.x / np.array(2.0), CorrelatedData)
+
+    def test_sensitivities(self):
+        result = 3 * self.x + self.y
+        self.assertEqual(len(result.sensitivities), 2)
+        self.assertAlmostEqual(result.sensitivities[id(self.x)][0], 3)
+        self.assertAlmostEqual(result.sensitivities[id(self.y)][0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
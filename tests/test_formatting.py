@@ -0,0 +1,47 @@
+import unittest
+from physics_utils import MeasuredData
+from physics_utils.data import MeasuredArray
+from physics_utils.data.formatting import format_many, latex_many
+from physics_utils.table import Table2D
+import numpy as np
+
+
+class TestFormatting(unittest.TestCase):
+
+    def test_matches_scalar(self):
+        rng = np.random.default_rng(0)
+
+        errors = np.concatenate([
+            10.0 ** rng.uniform(-10, 10, 2000),
+            # values right on the boundaries between rounding up and down
+            [d * 10.0 ** e for d in np.arange(0.5, 10, 0.5) for e in range(-8, 9)],
+            [0.0, 1.0, 0.95, 9.5, 0.25, 0.35, 5e-324, np.inf, np.nan]
+        ])
+        values = rng.normal(0, 1, len(errors)) * 10.0 ** rng.uniform(-4, 6, len(errors))
+
+        points = [MeasuredData(v, e) for v, e in zip(values.tolist(), errors.tolist())]
+
+        self.assertEqual(format_many(points), [str(x) for x in points])
+        self.assertEqual(format_many(MeasuredArray(values, errors)), [str(x) for x in points])
+
+    def test_plain_values(self):
+        points = [MeasuredData(1200, 30), MeasuredData(5, 0), MeasuredData(3, 0.0, 0.2)]
+        self.assertEqual(format_many(points), [str(x) for x in points])
+
+    def test_latex(self):
+        points = [MeasuredData(1234.56789, 0.05333), MeasuredData(2, 0)]
+
+        self.assertEqual(latex_many(points), [x.latex() for x in points])
+        self.assertEqual(latex_many(points, wrap=False), [x.latex(False) for x in points])
+        self.assertEqual(MeasuredArray.from_measured_datas(points[:1]).latex(), [points[0].latex()])
+
+    def test_table(self):
+        table = Table2D([[MeasuredData(1.23, 0.1), "a"], [3, MeasuredData(4.56, 0.02)]], ["x", "y"])
+        latex = table.latex()
+
+        self.assertIn("$1.2 \\pm 0.1$ & a \\\\", latex)
+        self.assertIn("3 & $4.56 \\pm 0.02$ \\\\", latex)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+import unittest
+import physics_utils
+
+
+def imported_modules(code: str) -> set[str]:
+    # run in a new interpreter, since this one has probably imported everything already
+    script = code + "\nimport sys\nprint(' '.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    return set(result.stdout.split())
+
+
+class TestImports(unittest.TestCase):
+
+    def test_lazy_modules(self):
+        modules = imported_modules("from physics_utils import MeasuredData\nMeasuredData(1, 0.1) * 2")
+
+        for module in ("matplotlib", "pandas", "antlr4", "physics_utils.graph", "physics_utils.table"):
+            with self.subTest(module):
+                self.assertNotIn(module, modules)
+
+        self.assertIn("matplotlib", imported_modules("import physics_utils\nphysics_utils.graph.SimpleGraph"))
+
+    def test_attributes(self):
+        from physics_utils import table
+
+        self.assertIs(physics_utils.table, table)
+        self.assertIn("graph", dir(physics_utils))
+
+        with self.assertRaises(AttributeError):
+            physics_utils.not_a_module
+
+
+if __name__ == '__main__':
+    unittest.main()
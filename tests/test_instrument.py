@@ -0,0 +1,113 @@
+import unittest
+import physics_utils
+from physics_utils import MeasuredData, instrumented, instrument, instrumenting, reset_stats, stats, steps_size
+from physics_utils.data import CorrelatedData, MeasuredArray
+
+
+class TestInstrument(unittest.TestCase):
+
+    def tearDown(self):
+        instrument(False)
+        reset_stats()
+
+    def test_ops(self):
+        x = MeasuredData(2.0, 0.1)
+
+        with instrumented():
+            (x * 3 + x) / x
+            -x
+            MeasuredArray([1.0, 2.0], 0.1) * x
+
+        counts = stats()
+        self.assertEqual(counts["data.ops"], {"mul": 2, "add": 1, "div": 1, "neg": 1})
+        self.assertEqual(counts["array.ops"], {"mul": 1})
+        # -x is worked out as x * -1
+        self.assertEqual(counts["data.allocations"], {"mul": 2, "add": 1, "div": 1})
+
+        with instrumented():
+            MeasuredData(1.0, 0.1) + 1
+
+        self.assertEqual(stats()["data.allocations"], {"new": 1, "add": 1})
+
+    def test_subclasses(self):
+        c = CorrelatedData(2.0, 0.1)
+
+        with instrumented():
+            c * c
+
+        self.assertEqual(stats()["data.ops"], {"mul": 1})
+        self.assertEqual(stats()["data.allocations"], {"mul": 1})
+
+    def test_script(self):
+        try:
+            from physics_utils.script.compiler import compile_tree
+            from physics_utils.script.main import parse_source
+            from physics_utils.script.visitor_interpreter import VisitorInterpreter
+        except ImportError:
+            self.skipTest("the script parser hasn't been generated (see build_antlr.bat)")
+
+        source = "define f(a) as return a * 2 end f\nfor i from 1 to 3 loop x := f(i) end loop"
+
+        for compiled in (True, False):
+            with self.subTest(compiled=compiled):
+                interpreter = VisitorInterpreter()
+                interpreter.output_expr = False
+
+                with instrumented():
+                    tree = parse_source(source)
+                    interpreter.run(tree) if compiled else interpreter.visit(tree)
+
+                counts = stats()
+                self.assertEqual(counts["script.calls"], {"call": 3})
+                self.assertEqual(counts["data.ops"], {"mul": 3})
+                self.assertGreaterEqual(counts["script.nodes"]["Stat"], 4)
+                self.assertGreaterEqual(counts["script.nodes"]["Expr"], 9)
+
+        # code compiled while counting doesn't count anything once counting is off
+        with instrumented():
+            code = compile_tree(interpreter, parse_source(source))
+
+        reset_stats()
+        code()
+        self.assertEqual(stats(), {})
+
+    def test_off(self):
+        self.assertFalse(instrumenting())
+
+        with instrumented():
+            self.assertTrue(instrumenting())
+
+        self.assertFalse(instrumenting())
+
+        # nothing is left wrapped once turned off
+        self.assertNotIn("__add__", vars(MeasuredData))
+        self.assertFalse(hasattr(MeasuredData.__init__, "__wrapped__"))
+
+        MeasuredData(1.0, 0.1) + 1
+        self.assertEqual(stats(), {})
+
+    def test_reset(self):
+        instrument(True)
+        MeasuredData(1.0, 0.1) + 1
+        self.assertEqual(stats()["data.ops"], {"add": 1})
+
+        reset_stats()
+        self.assertEqual(stats(), {})
+
+    def test_steps_size(self):
+        x = MeasuredData(2.0, 0.1)
+        result = x
+
+        for _ in range(10):
+            result = result + x
+
+        size = steps_size(result)
+        self.assertEqual(size["nodes"], 11)
+        self.assertGreater(size["bytes"], 0)
+
+    def test_exported(self):
+        self.assertIs(physics_utils.stats, stats)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+from physics_utils import MeasuredData
+from physics_utils.data import MeasuredArray, LazyData, lazy, evaluate, math as md_math
+from physics_utils.data import md_lazy
+
+
+class TestLazyData(unittest.TestCase):
+
+    def assertSame(self, a, b):
+        self.assertAlmostEqual(a.value, b.value)
+        self.assertAlmostEqual(a.reading_error, b.reading_error)
+        self.assertAlmostEqual(a.standard_error, b.standard_error)
+
+    def test_builds_graph(self):
+        x = lazy(MeasuredData(2.0, 0.1))
+        result = x * 3 + x
+
+        self.assertIsInstance(result, LazyData)
+        self.assertEqual(result.op, "add")
+
+    def test_matches_eager(self):
+        x, y = MeasuredData(0.7, 0.02, 0.01), MeasuredData(3.0, 0.1)
+        lx, ly = lazy(x, y)
+
+        self.assertSame(((lx * ly - 2) / lx ** 2).evaluate(), (x * y - 2) / x ** 2)
+        self.assertSame((2 - ly).evaluate(), 2 - y)
+        self.assertSame(md_math.tan(lx).evaluate(), x.tangent())
+        self.assertSame((-abs(lx)).arcsin().evaluate(), (-abs(x)).arcsin())
+
+    def test_same_steps(self):
+        x, y = MeasuredData(0.7, 0.02, 0.01), MeasuredData(3.0, 0.1)
+        lx, ly = lazy(x, y)
+
+        for result, expected in ((lx.tangent() * ly, x.tangent() * y), ((lx - ly).sine() / lx, (x - y).sine() / x)):
+            self.assertEqual(result.evaluate().all_steps_composite(False), expected.all_steps_composite(False))
+            self.assertEqual(result.evaluate().all_steps_sequential(False), expected.all_steps_sequential(False))
+
+    def test_mixed_operands(self):
+        x = MeasuredData(1.5, 0.1)
+        result = MeasuredData(2.0, 0.2) * lazy(x)
+
+        self.assertIsInstance(result, LazyData)
+        self.assertSame(result.evaluate(), MeasuredData(2.0, 0.2) * x)
+
+    def test_common_subexpressions(self):
+        calls = []
+        sine = md_lazy.operations["sine"]
+        md_lazy.operations["sine"] = lambda x: calls.append(x) or sine(x)
+
+        try:
+            x = lazy(MeasuredData(0.5, 0.01))
+            a, b = evaluate(x.sine() * x.sine(), x.tangent() + x.sine())
+        finally:
+            md_lazy.operations["sine"] = sine
+
+        self.assertEqual(len(calls), 1)
+        self.assertAlmostEqual(a.value, MeasuredData(0.5, 0.01).sine().value ** 2)
+
+    def test_arrays(self):
+        data = MeasuredArray([0.1, 0.2, 0.3], 0.01)
+        result = (lazy(data).cosine() * 2).evaluate()
+
+        self.assertIsInstance(result, MeasuredArray)
+        self.assertAlmostEqual(result[1].value, (data.cosine() * 2)[1].value)
+
+    def test_deep_chain(self):
+        total = lazy(MeasuredData(0, 0))
+        x = lazy(MeasuredData(1, 0.1))
+
+        for _ in range(5000):
+            total = total + x
+
+        self.assertEqual(total.evaluate().value, 5000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+import unittest
+from physics_utils import MeasuredData
+from physics_utils.data import MeasuredArray
+import numpy as np
+import math
+
+
+class TestMeasuredArray(unittest.TestCase):
+
+    def setUp(self):
+        self.x = MeasuredArray([10.0, 2.5, -3.0], [0.5, 0.1, 0.2], [0.2, 0.05, 0.0])
+        self.y = MeasuredArray([2.0, 4.0, 1.5], [0.1, 0.3, 0.0], [0.05, 0.0, 0.1])
+
+    def assertMatches(self, array, points):
+        self.assertEqual(len(array), len(points))
+
+        for a, p in zip(array, points):
+            self.assertAlmostEqual(a.value, p.value)
+            self.assertAlmostEqual(a.reading_error, p.reading_error)
+            self.assertAlmostEqual(a.standard_error, p.standard_error)
+
+    def test_construction(self):
+        data = MeasuredArray([1, 2, 3], 0.1)
+        self.assertEqual(data.value.dtype, np.float64)
+        self.assertTrue(data.reading_error.flags["C_CONTIGUOUS"])
+        self.assertEqual(list(data.reading_error), [0.1, 0.1, 0.1])
+        self.assertEqual(list(data.standard_error), [0.0, 0.0, 0.0])
+
+    def test_from_set(self):
+        values = [1.0, 2.5, 4.0]
+        self.assertMatches(MeasuredArray.from_set(values, 0.1, 0.2), MeasuredData.from_set(values, 0.1, 0.2))
+
+    def test_round_trip(self):
+        points = [MeasuredData(1.0, 0.1), MeasuredData(2.0, 0.2, 0.3)]
+        exploded = MeasuredArray.from_measured_datas(points).to_measured_datas()
+        self.assertTrue(all(isinstance(x, MeasuredData) for x in exploded))
+        self.assertMatches(exploded, points)
+
+    def test_indexing(self):
+        self.assertIsInstance(self.x[0], MeasuredData)
+        self.assertEqual(self.x[1].value, 2.5)
+        self.assertIsInstance(self.x[1:], MeasuredArray)
+        self.assertEqual(len(self.x[1:]), 2)
+
+    def test_binary_operations(self):
+        xs, ys = self.x.to_measured_datas(), self.y.to_measured_datas()
+
+        self.assertMatches(self.x + self.y, [a + b for a, b in zip(xs, ys)])
+        self.assertMatches(self.x - self.y, [a - b for a, b in zip(xs, ys)])
+        self.assertMatches(self.x * self.y, [a * b for a, b in zip(xs, ys)])
+        self.assertMatches(self.x / self.y, [a / b for a, b in zip(xs, ys)])
+        self.assertMatches(self.y ** self.y, [b ** b for b in ys])
+
+    def test_plain_operands(self):
+        xs = self.x.to_measured_datas()
+
+        self.assertMatches(self.x + 2, [a + 2 for a in xs])
+        self.assertMatches(2 - self.x, [2 - a for a in xs])
+        self.assertMatches(self.x * 3, [a * 3 for a in xs])
+        self.assertMatches(3 / self.x, [3 / a for a in xs])
+        self.assertMatches(self.x ** 2, [a ** 2 for a in xs])
+        self.assertMatches(-self.x, [-a for a in xs])
+        self.assertMatches(abs(self.x), [abs(a) for a in xs])
+
+    def test_scalar_measured_operands(self):
+        xs = self.x.to_measured_datas()
+        c = MeasuredData(4.0, 0.2, 0.1)
+
+        self.assertMatches(c + self.x, [c + a for a in xs])
+        self.assertMatches(c - self.x, [c - a for a in xs])
+        self.assertMatches(self.x * c, [a * c for a in xs])
+        self.assertMatches(c / self.x, [c / a for a in xs])
+        self.assertIsInstance(c * self.x, MeasuredArray)
+
+    def test_numpy_operands(self):
+        result = np.array([1.0, 2.0, 3.0]) + self.x
+        self.assertIsInstance(result, MeasuredArray)
+        self.assertEqual(list(result.value), [11.0, 4.5, 0.0])
+
+    def test_trigonometry(self):
+        angles = MeasuredArray([0.1, 0.5, 1.2], 0.01, 0.02)
+        points = angles.to_measured_datas()
+
+        self.assertMatches(angles.sine(), [a.sine() for a in points])
+        self.assertMatches(angles.cosine(), [a.cosine() for a in points])
+        self.assertMatches(angles.tangent(), [a.tangent() for a in points])
+        self.assertMatches(angles.arctan(), [a.arctan() for a in points])
+        self.assertMatches((angles / 2).arcsin(), [(a / 2).arcsin() for a in points])
+
+    def test_ufuncs(self):
+        angles = MeasuredArray([0.1, 0.5, 1.2], 0.01, 0.02)
+        points = angles.to_measured_datas()
+
+        self.assertMatches(np.sin(angles), [a.sine() for a in points])
+        self.assertMatches(np.arctan(angles), [a.arctan() for a in points])
+        self.assertMatches(np.sqrt(angles), [a ** 0.5 for a in points])
+        self.assertMatches(np.multiply(self.x, self.y), list(self.x * self.y))
+        self.assertMatches(np.negative(self.x), list(-self.x))
+
+        # scalars keep their steps, and are broadcast along with arrays
+        c = MeasuredData(0.5, 0.01)
+        self.assertIsInstance(np.sin(c), MeasuredData)
+        self.assertTrue(np.sin(c).has_steps)
+        self.assertMatches(np.arange(3.0) + c, [c, c + 1, c + 2])
+
+        with self.assertRaises(TypeError):
+            np.exp(angles)
+
+    def test_comparisons(self):
+        c = MeasuredData(2.0, 0.1)
+
+        # numpy scalars on the left go through __array_ufunc__, and compare against the value as the operators do
+        self.assertTrue(np.float64(1.0) < c)
+        self.assertTrue(np.float64(2.0) == c)
+        self.assertTrue(np.float64(2.0) <= c)
+        self.assertFalse(np.float64(2.0) != c)
+        self.assertFalse(np.float64(3.0) <= c)
+
+        for i, x in enumerate(np.arange(4.0)):
+            self.assertEqual(bool(x > c), i > 2)
+
+        np.testing.assert_array_equal(np.array([1.0, 2.5, -3.0]) < self.x, [True, False, False])
+        np.testing.assert_array_equal(np.greater(self.y, c), [False, True, False])
+
+    def test_array_functions(self):
+        xs = self.x.to_measured_datas()
+
+        total = np.sum(self.x)
+        self.assertIsInstance(total, MeasuredData)
+        self.assertMatches([total], [xs[0] + xs[1] + xs[2]])
+        self.assertMatches([np.mean(self.x)], [(xs[0] + xs[1] + xs[2]) / 3])
+        self.assertMatches(np.concatenate([self.x, self.y]), xs + self.y.to_measured_datas())
+
+        # other functions work on the array as a sequence of MeasuredDatas
+        self.assertEqual([p.value for p in np.sort(self.x)], [-3.0, 2.5, 10.0])
+        self.assertEqual(np.stack([self.x, self.y]).shape, (2, 3))
+
+        grid = MeasuredArray(np.ones((2, 3)), 0.1)
+        np.testing.assert_allclose(np.sum(grid, axis=0).reading_error, np.full(3, 0.1 * math.sqrt(2)))
+
+        # numpy's other arguments work as they do for arrays
+        self.assertEqual(np.sum(grid, axis=1, keepdims=True).value.shape, (2, 1))
+        self.assertAlmostEqual(np.mean(grid, dtype=np.float64).reading_error, 0.1 / math.sqrt(6))
+        self.assertAlmostEqual(np.mean(grid, axis=(0, 1)).reading_error, 0.1 / math.sqrt(6))
+
+        with self.assertRaises(TypeError):
+            np.sum(grid, out=np.zeros(3))
+
+        # scalars are joined on as single points
+        joined = np.concatenate([MeasuredData(1.0, 0.1), self.x, 4.0])
+        self.assertMatches(joined, [MeasuredData(1.0, 0.1)] + xs + [MeasuredData(4.0, 0.0)])
+
+    def test_math_module(self):
+        from physics_utils.data import math as md_math
+
+        c = MeasuredData(0.5, 0.01)
+
+        self.assertEqual(md_math.atan(1.0), math.atan(1.0))
+        self.assertEqual(md_math.atan(c).value, c.arctan().value)
+        self.assertMatches(md_math.sin(self.x), [a.sine() for a in self.x.to_measured_datas()])
+
+    def test_error(self):
+        self.assertEqual(list(self.x.error()), [0.5, 0.1, 0.2])
+
+    def test_str(self):
+        data = MeasuredArray([1234.56789, 100.4], [0.05333, 0.0], [0.0, 4.3])
+        self.assertEqual(str(data), '[1234.57±0.05, 100.0±4.]')
+
+
+if __name__ == '__main__':
+    unittest.main()
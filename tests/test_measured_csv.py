@@ -0,0 +1,106 @@
+import unittest
+import os
+import tempfile
+from unittest import mock
+import numpy as np
+from physics_utils.data import MeasuredArray, load_measured_csv
+from physics_utils.data import measured_csv
+
+
+class TestLoadMeasuredCsv(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.dir.name, "run.csv")
+
+        with open(self.file, "w") as f:
+            f.write("time,time_err,distance,distance_err,distance_std,note\n")
+
+            for i in range(25):
+                f.write("{},0.1,{},0.05,{},{}\n".format(i, 2 * i, i / 100, i % 3))
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_suffixes(self):
+        data = load_measured_csv(self.file, chunk_size=7)
+
+        self.assertEqual(list(data), ["time", "distance", "note"])
+        self.assertIsInstance(data["distance"], MeasuredArray)
+        np.testing.assert_array_equal(data["distance"].value, 2 * np.arange(25))
+        np.testing.assert_array_equal(data["distance"].reading_error, np.full(25, 0.05))
+        np.testing.assert_array_equal(data["distance"].standard_error, np.arange(25) / 100)
+        np.testing.assert_array_equal(data["time"].reading_error, np.full(25, 0.1))
+        np.testing.assert_array_equal(data["note"].reading_error, np.zeros(25))
+
+    def test_columns(self):
+        data = load_measured_csv(self.file, ["time"], reading_error=0.5, cache=False)
+        self.assertEqual(list(data), ["time"])
+
+        data = load_measured_csv(self.file, {"d": ("distance", None, "distance_std"), "n": "note"},
+                                 reading_error=0.5, cache=False)
+
+        np.testing.assert_array_equal(data["d"].reading_error, np.full(25, 0.5))
+        np.testing.assert_array_equal(data["d"].standard_error, np.arange(25) / 100)
+        np.testing.assert_array_equal(data["n"].value, np.arange(25) % 3)
+
+        self.assertEqual(os.listdir(self.dir.name), ["run.csv"])
+
+        with self.assertRaises(ValueError):
+            load_measured_csv(self.file, {"x": ("time", "missing")})
+
+    def test_cache(self):
+        parsed = load_measured_csv(self.file)
+        self.assertEqual(len([f for f in os.listdir(self.dir.name) if f.endswith(".cache.npy")]), 1)
+
+        with mock.patch.object(measured_csv, "_parse", side_effect=AssertionError("parsed again")):
+            cached = load_measured_csv(self.file)
+
+        for name in parsed:
+            np.testing.assert_array_equal(parsed[name].value, cached[name].value)
+            np.testing.assert_array_equal(parsed[name].reading_error, cached[name].reading_error)
+            np.testing.assert_array_equal(parsed[name].standard_error, cached[name].standard_error)
+
+        # changing the arrays doesn't change the cache
+        cached["time"].value[0] = 100
+        self.assertEqual(load_measured_csv(self.file)["time"].value[0], 0)
+
+    def test_text_columns(self):
+        with open(self.file, "w") as f:
+            f.write("run,time,time_err,date\n")
+
+            for i in range(150):
+                f.write("run {},{},0.1,2024-01-{:02}\n".format(i, i, i % 28 + 1))
+
+        # only numeric columns are loaded by default
+        data = load_measured_csv(self.file, chunk_size=40)
+        self.assertEqual(list(data), ["time"])
+        np.testing.assert_array_equal(data["time"].value, np.arange(150))
+
+        with self.assertRaisesRegex(ValueError, "run"):
+            load_measured_csv(self.file, ["time", "run"], cache=False)
+
+    def test_column_caches(self):
+        everything, time = load_measured_csv(self.file), load_measured_csv(self.file, ["time"])
+
+        # loading different columns in turn doesn't replace the cache of the others
+        with mock.patch.object(measured_csv, "_parse", side_effect=AssertionError("parsed again")):
+            for _ in range(2):
+                self.assertEqual(list(load_measured_csv(self.file)), list(everything))
+                self.assertEqual(list(load_measured_csv(self.file, ["time"])), list(time))
+
+    def test_stale_cache(self):
+        load_measured_csv(self.file)
+
+        with open(self.file, "a") as f:
+            f.write("25,0.1,50,0.05,0.25,1\n")
+
+        self.assertEqual(len(load_measured_csv(self.file)["time"].value), 26)
+
+        # loading other columns parses the file again
+        self.assertEqual(list(load_measured_csv(self.file, ["time"])), ["time"])
+        self.assertEqual(len(load_measured_csv(self.file)["distance"].value), 26)
+
+
+if __name__ == '__main__':
+    unittest.main()
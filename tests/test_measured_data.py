@@ -1,5 +1,7 @@
 import unittest
 from physics_utils import MeasuredData
+from physics_utils.data import no_steps, track_steps, tracking_steps
+from physics_utils.data.md_steps import at_format
 import math
 
 
@@ -110,6 +112,83 @@ class TestMeasuredData(unittest.TestCase):
         data = MeasuredData(1234.56789, 0.05333)
         self.assertEqual(data.latex(), '$1234.57 \\pm 0.05$')
 
+    def test_slots(self):
+        data = MeasuredData(1.0, 0.1) * MeasuredData(2.0, 0.2)
+        self.assertFalse(hasattr(data, "__dict__"))
+
+    def test_steps(self):
+        data = MeasuredData(1.0, 0.1)
+        result = data * 2
+        self.assertTrue(result.has_steps)
+        self.assertEqual(result.step_variables, (data, 2))
+        self.assertEqual(result.recent_step(True, False), r"\left(x\right)\cdot\left(y\right)")
+
+    def test_all_steps(self):
+        x, y = MeasuredData(3.2, 0.1), MeasuredData(1.5, 0.2)
+        result = (x * y + 2) / y
+
+        value_steps, _, data_points = result.all_steps_sequential(False)
+        self.assertEqual(value_steps, [
+            r"\left(x\right)\cdot\left(y\right)", r"\left(x\right)+\left(y\right)",
+            r"\frac{\left(x\right)}{\left(y\right)}"
+        ])
+        self.assertIs(data_points[0], result)
+
+        self.assertEqual(result.all_steps_composite(False)[0], r"\frac{ x \cdot y +2}{ y }")
+
+    def test_shared_steps(self):
+        shared = MeasuredData(3.2, 0.1) * MeasuredData(1.5, 0.2)
+        result = shared * (shared + 1) - shared
+
+        # the calculation of shared is only given once, before anything using it
+        value_steps = result.all_steps_sequential(False)[0]
+        self.assertEqual(len(value_steps), 4)
+        self.assertEqual(value_steps[0], r"\left(x\right)\cdot\left(y\right)")
+
+        self.assertEqual(
+            result.all_steps_composite(False)[0],
+            r"\left(\left( x \cdot y \right)\cdot\left( x \cdot y +1\right)\right)-\left( x \cdot y \right)"
+        )
+
+    def test_long_steps(self):
+        total = MeasuredData(0, 0.1)
+
+        for _ in range(5000):
+            total = total + MeasuredData(1, 0.1)
+
+        self.assertEqual(len(total.all_steps_sequential()[0]), 5000)
+        self.assertTrue(total.all_steps_composite()[0].startswith("0.0+1.0+1.0"))
+
+    def test_at_format(self):
+        self.assertEqual(at_format(r"\frac{@x@}{@y@}", {"x": "a+b", "y": 2}), r"\frac{\left(a+b\right)}{2}")
+        self.assertEqual(at_format(r"@x@@y@", {"x": "a", "y": "b"}, True), "ab")
+
+        with self.assertRaises(ValueError):
+            at_format("@x@ @y", {"x": 1, "y": 2})
+
+        with self.assertRaises(ValueError):
+            at_format("@z@", {"x": 1})
+
+    def test_no_steps(self):
+        with no_steps():
+            self.assertFalse(tracking_steps())
+            result = MeasuredData(10.0, 0.5, 0.2) * MeasuredData(2.0, 0.1, 0.05)
+
+        self.assertTrue(tracking_steps())
+        self.assertFalse(result.has_steps)
+        self.assertIsNone(result.step_variables)
+        self.assertAlmostEqual(result.reading_error, 20.0 * math.sqrt((0.5/10.0)**2 + (0.1/2.0)**2))
+
+    def test_track_steps(self):
+        track_steps(False)
+
+        try:
+            self.assertFalse((MeasuredData(1.0, 0.1) + 1).has_steps)
+        finally:
+            track_steps(True)
+
+        self.assertTrue((MeasuredData(1.0, 0.1) + 1).has_steps)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+import numpy as np
+from physics_utils.data import MeasuredArray, avg_from_set, avg_measured_datas
+from physics_utils.data.util import nan_mask, remove_nan, remove_nan_2d
+
+
+class TestMissingValues(unittest.TestCase):
+
+    def test_remove_nan(self):
+        data = np.array([1.0, np.nan, 3.0, np.nan, 5.0])
+
+        np.testing.assert_array_equal(remove_nan(data), [1.0, 3.0, 5.0])
+        np.testing.assert_array_equal(remove_nan([np.nan, 2.0]), [2.0])
+        self.assertEqual(avg_from_set(remove_nan(data), 0.1).value, 3.0)
+
+    def test_remove_nan_measured(self):
+        data = MeasuredArray([1.0, np.nan, 3.0, 4.0], [0.1, 0.1, np.nan, 0.1], [0.0, 0.0, 0.0, 0.2])
+
+        np.testing.assert_array_equal(nan_mask(data), [False, True, True, False])
+
+        kept = remove_nan(data)
+        self.assertIsInstance(kept, MeasuredArray)
+        np.testing.assert_array_equal(kept.value, [1.0, 4.0])
+        np.testing.assert_array_equal(kept.standard_error, [0.0, 0.2])
+        self.assertEqual(avg_measured_datas(kept).value, 2.5)
+
+    def test_remove_nan_2d(self):
+        data = np.array([[1.0, np.nan, 3.0], [np.nan, np.nan, np.nan], [4.0, 5.0, 6.0]])
+
+        rows, index = remove_nan_2d(data, return_index=True)
+
+        self.assertEqual([r.tolist() for r in rows], [[1.0, 3.0], [], [4.0, 5.0, 6.0]])
+        self.assertEqual([i.tolist() for i in index], [[0, 2], [], [0, 1, 2]])
+
+        for row, original, i in zip(rows, data, index):
+            np.testing.assert_array_equal(row, original[i])
+
+        self.assertEqual(len(remove_nan_2d(np.empty((0, 3)))), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from physics_utils import MeasuredData
+from physics_utils.data import monte_carlo
+import numpy as np
+
+
+def product(x, y):
+    return x * y
+
+
+class TestMonteCarlo(unittest.TestCase):
+
+    def test_linear_agrees_with_propagation(self):
+        x, y = MeasuredData(10.0, 0.5, 0.2), MeasuredData(2.0, 0.1, 0.05)
+        expected = x * y
+        result = monte_carlo(product, x, y, n=200_000, seed=0)
+
+        self.assertAlmostEqual(result.value, expected.value, delta=0.05)
+        self.assertAlmostEqual(result.reading_error, expected.reading_error, delta=0.02)
+        self.assertAlmostEqual(result.standard_error, expected.standard_error, delta=0.01)
+
+    def test_constants(self):
+        result = monte_carlo(lambda x, k: x * k, MeasuredData(1.0, 0.1), 3.0, n=50_000, seed=0)
+        self.assertAlmostEqual(result.reading_error, 0.3, delta=0.01)
+        self.assertEqual(result.standard_error, 0)
+
+    def test_reproducible(self):
+        x = MeasuredData(0.95, 0.03)
+        first = monte_carlo(np.arcsin, x, n=30_000, chunk_size=7_000, seed=42)
+        second = monte_carlo(np.arcsin, x, n=30_000, chunk_size=7_000, seed=42)
+
+        self.assertEqual(first.value, second.value)
+        self.assertEqual(first.reading_error, second.reading_error)
+
+    def test_process_pool(self):
+        x, y = MeasuredData(3.0, 0.2), MeasuredData(4.0, 0.1, 0.3)
+        serial = monte_carlo(product, x, y, n=40_000, chunk_size=10_000, seed=7)
+        pooled = monte_carlo(product, x, y, n=40_000, chunk_size=10_000, seed=7, processes=2)
+
+        self.assertAlmostEqual(serial.value, pooled.value)
+        self.assertAlmostEqual(serial.reading_error, pooled.reading_error)
+        self.assertAlmostEqual(serial.standard_error, pooled.standard_error)
+
+    def test_bad_sizes(self):
+        x = MeasuredData(1.0, 0.1)
+
+        for n, chunk_size in ((0, 100), (-5, 100), (100, 0), (100, -1)):
+            with self.subTest(n=n, chunk_size=chunk_size):
+                with self.assertRaises(ValueError):
+                    monte_carlo(np.sin, x, n=n, chunk_size=chunk_size)
+
+    def test_discards_non_finite(self):
+        # samples past 1 are outside the domain of arcsin
+        result = monte_carlo(np.arcsin, MeasuredData(0.99, 0.02), n=20_000, seed=3)
+        self.assertTrue(np.isfinite(result.value))
+        self.assertTrue(np.isfinite(result.reading_error))
+
+
+if __name__ == '__main__':
+    unittest.main()
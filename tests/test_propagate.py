@@ -0,0 +1,82 @@
+import unittest
+import math
+import numpy as np
+from physics_utils import MeasuredData
+from physics_utils.data import MeasuredArray, propagate
+from physics_utils.data import md_propagate
+
+
+class TestPropagate(unittest.TestCase):
+
+    def setUp(self):
+        self.x = MeasuredArray([0.5, 1.0, 2.0], [0.01, 0.02, 0.03], [0.0, 0.01, 0.05])
+
+    def test_matches_methods(self):
+        for fn, method in ((np.sin, "sine"), (np.arctan, "arctan")):
+            for result_method in ("complex", "central"):
+                result = propagate(fn, self.x, method=result_method)
+                expected = getattr(self.x, method)()
+
+                np.testing.assert_allclose(result.value, expected.value)
+                np.testing.assert_allclose(result.reading_error, expected.reading_error, rtol=1e-7)
+                np.testing.assert_allclose(result.standard_error, expected.standard_error, rtol=1e-7, atol=1e-15)
+
+    def test_scalar(self):
+        result = propagate(np.log, MeasuredData(2.0, 0.1, 0.2))
+
+        self.assertIsInstance(result, MeasuredData)
+        self.assertAlmostEqual(result.value, math.log(2.0))
+        self.assertAlmostEqual(result.reading_error, 0.05)
+        self.assertAlmostEqual(result.standard_error, 0.1)
+
+    def test_several_arguments(self):
+        y = MeasuredData(3.0, 0.2)
+        result = propagate(lambda a, b: a * b, self.x, y)
+        expected = self.x * y
+
+        np.testing.assert_allclose(result.value, expected.value)
+        np.testing.assert_allclose(result.reading_error, expected.reading_error)
+
+        # plain arguments are exact
+        result = propagate(np.power, self.x, 2)
+        np.testing.assert_allclose(result.reading_error, (self.x ** 2).reading_error)
+
+    def test_fallback(self):
+        # floor(0 * x) stops complex numbers from getting through
+        fn = lambda x: np.abs(x) ** 1.5 + np.floor(0 * x.real).astype(float)
+
+        result = propagate(fn, self.x)
+        np.testing.assert_allclose(result.reading_error, 1.5 * np.sqrt(self.x.value) * self.x.reading_error, rtol=1e-6)
+        self.assertEqual(md_propagate._cached_method(fn), "central")
+
+        with self.assertRaises(ValueError):
+            propagate(fn, self.x, method="complex")
+        with self.assertRaises(ValueError):
+            propagate(fn, self.x, method="forward")
+
+    def test_not_complex_differentiable(self):
+        # x * |x| takes complex numbers, but the complex step method gets its derivative wrong
+        fn = lambda x: x * np.abs(x)
+        expected = propagate(fn, MeasuredData(2.0, 0.1), method="central")
+
+        self.assertAlmostEqual(expected.reading_error, 0.4)
+        self.assertAlmostEqual(propagate(fn, MeasuredData(2.0, 0.1)).reading_error, 0.4)
+        self.assertEqual(md_propagate._cached_method(fn), "central")
+
+        # only the argument which goes through np.abs disagrees
+        fn = lambda a, b: np.exp(a) * np.abs(b)
+        result = propagate(fn, MeasuredData(0.0, 0.1), MeasuredData(-2.0, 0.1))
+
+        self.assertAlmostEqual(result.reading_error, math.hypot(0.2, 0.1), places=6)
+        self.assertEqual(md_propagate._cached_method(fn), "central")
+
+        propagate(np.sin, self.x)
+        self.assertEqual(md_propagate._cached_method(np.sin), "complex")
+
+    def test_exact(self):
+        result = propagate(np.exp, MeasuredArray([1.0, 2.0], 0.0))
+        np.testing.assert_array_equal(result.reading_error, [0.0, 0.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,452 @@
+import unittest
+import contextlib
+import io
+import os
+import tempfile
+from antlr4 import CommonTokenStream, InputStream, Token
+from antlr4.tree.Tree import TerminalNode
+from physics_utils import MeasuredData
+from physics_utils.data import no_steps
+
+try:
+    from physics_utils.script.main import parse_stream, parse_source
+    from physics_utils.script.antlr_build.ExprLexer import ExprLexer
+    from physics_utils.script.antlr_build.ExprParser import ExprParser
+    from physics_utils.script.precedence_parser import tokenize
+    from physics_utils.script.control import Break, Continue
+    from physics_utils.script.environment import Environment, Frame, default_environment
+    from physics_utils.script.folding import constant_value
+    from physics_utils.script.visitor_interpreter import VisitorInterpreter
+    from physics_utils.script.transpiler import transpile_source, load_script
+    parser_built = True
+except ImportError:
+    # the parser is generated from the grammar by build_antlr.bat, and isn't checked in
+    parser_built = False
+
+requires_parser = unittest.skipUnless(parser_built, "the script parser hasn't been generated (see build_antlr.bat)")
+
+PROGRAMS = {
+    "arithmetic": """
+x := 3 ~ 0.1
+y := x * 2 + 1 / x - x ^ 2
+x :~ 0.5
+z := x * y
+print(x, y, z, -2.5*10^3 ~ 1*10^-1)
+""",
+    "control flow": """
+total := 0
+for i from 1 to 20 loop
+    if i = 3 then
+        continue
+    else if i > 15 then
+        break
+    else if i < 2 then
+        total := total + 100
+    else
+        total := total + i
+    end if
+end loop
+n := 0
+while n < 10 loop
+    n := n + 1
+    if n > 4 then break end if
+end loop
+for x in [1, 2, 3] loop
+    total := total + x
+end loop
+print(total, n)
+""",
+    "functions": """
+define fib(n) as
+    a := 0
+    b := 1
+    for i from 1 to n loop
+        c := a + b
+        a := b
+        b := c
+    end loop
+    return a
+end fib
+define early(x) as
+    if x > 1 then
+        return 1
+    end if
+    return 2
+end early
+square := (x) -> x * x
+print(fib(10), early(3), square(4))
+""",
+    "lists": """
+values := [1, 2, 3, 4]
+values[1] := 10
+values := values | values[0]
+print(values, #values, values[2], [values, [1, "a"]])
+define momentum(mass, velocity) as
+    return mass * velocity
+end momentum
+print(momentum*(*values, 2), momentum*(*values, *values), momentum**(*[1, 2], **[[1, 2], [3]]))
+print(momentum`(values, values))
+""",
+    "imports": """
+from math import pi, sqrt
+import os.path
+print(sqrt(pi), pi = pi, 1 and 0, 1 or 0, 2 != 3, 2 >= 3)
+""",
+    "scopes": """
+x := 1
+define outer(a, b) as
+    define inner(c) as
+        if c > 1 then
+            x := c
+        end if
+        return sin(a) + x + b * c
+    end inner
+    y := inner(1)
+    z := inner(2)
+    for i in [1] loop
+        w := i
+    end loop
+    return [y, z, w]
+end outer
+r := outer(0.5, 2)
+same := (a, a) -> a
+adder := (n) -> ((m) -> n + m)
+print(r, x, same(1, 2), adder(2)(3))
+""",
+    "signals": """
+define stop(x) as
+    if x > 2 then
+        break
+    end if
+    return x
+end stop
+total := 0
+for i from 1 to 10 loop
+    total := total + stop(i)
+end loop
+for i in [1, 2, 3] loop
+    j := 0
+    while true loop
+        j := j + 1
+        if j > 3 then
+            break
+        else if i = 2 then
+            if j > 1 then
+                continue
+            end if
+        end if
+        total := total + j * i
+    end loop
+end loop
+print(total, i, j)
+""",
+    "repl": """
+x := 2
+x * 3
+for i from 1 to 2 loop
+    i
+end loop
+"bye"
+""",
+}
+
+
+def run(source: str, compiled: bool | str, output_expr=False, parser="antlr") -> tuple[str, dict]:
+    interpreter = VisitorInterpreter()
+    interpreter.output_expr = output_expr
+    interpreter.env = env = Environment(parent=default_environment)
+
+    tree = parse_source(source, parser)
+    output = io.StringIO()
+
+    with contextlib.redirect_stdout(output):
+        if compiled == "transpiled":
+            namespace = {}
+            exec(transpile_source(source, parser), namespace)
+            namespace["run"](interpreter)
+        elif compiled:
+            interpreter.run(tree)
+        else:
+            interpreter.visit(tree)
+
+    return output.getvalue(), {k: str(v) for k, v in env.values.items() if not callable(v)}
+
+
+@requires_parser
+class TestCompiler(unittest.TestCase):
+
+    def test_parity(self):
+        for name, source in PROGRAMS.items():
+            with self.subTest(name):
+                output_expr = name == "repl"
+                expected = run(source, False, output_expr)
+
+                self.assertEqual(run(source, True, output_expr), expected)
+                self.assertNotEqual(expected[0], "")
+
+    def test_labels(self):
+        interpreter = VisitorInterpreter()
+        interpreter.env = env = Environment(parent=default_environment)
+
+        interpreter.run(parse_stream(ExprParser(None), InputStream("for i from 1 to 2 loop x := 1 ~ 0.1 end loop")))
+
+        self.assertEqual(env.get("x").label, "x")
+
+    def test_frames(self):
+        interpreter = VisitorInterpreter()
+        interpreter.env = env = Environment(parent=default_environment)
+        interpreter.run(parse_stream(ExprParser(None), InputStream("""
+define f(a) as
+    b := a * 2
+    return frame(b)
+end f
+""")))
+        env.add("frame", lambda b: interpreter.env)
+
+        frame = env.get("f")(MeasuredData(1, 0))
+
+        self.assertIsInstance(frame, Frame)
+        self.assertEqual(frame.values.keys(), {"a", "b"})
+        self.assertEqual(frame.get("b").value, 2)
+        self.assertIs(frame.get("sin"), default_environment.get("sin"))
+
+    def test_errors(self):
+        for source in ("x := 1 |> 2", "y := undefined_variable", "define f() as return 1 end g",
+                       "define f(a) as return b end f\nf(1)"):
+            with self.subTest(source):
+                with self.assertRaises(RuntimeError) as visited:
+                    run(source, False)
+                with self.assertRaises(RuntimeError) as compiled:
+                    run(source, True)
+
+                self.assertEqual(str(visited.exception), str(compiled.exception))
+
+
+@requires_parser
+class TestTranspiler(unittest.TestCase):
+
+    def test_parity(self):
+        for name, source in PROGRAMS.items():
+            with self.subTest(name):
+                output_expr = name == "repl"
+                self.assertEqual(run(source, "transpiled", output_expr), run(source, False, output_expr))
+
+    def test_errors(self):
+        for source in ("x := 1 |> 2", "y := undefined_variable", "define f() as return 1 end g"):
+            with self.subTest(source):
+                with self.assertRaises(RuntimeError) as visited:
+                    run(source, False)
+                with self.assertRaises(RuntimeError) as transpiled:
+                    run(source, "transpiled")
+
+                self.assertEqual(str(visited.exception), str(transpiled.exception))
+
+        self.assertIsNone(transpile_source("x := := 1"))
+
+    def test_signals(self):
+        # a break or continue outside of a loop (after any function it's in returns) is still an error
+        for source in ("break", "if true then continue end if", "define f() as break end f\nx := f()"):
+            with self.subTest(source):
+                for compiled in (False, True, "transpiled"):
+                    with self.assertRaises(Exception) as e:
+                        run(source, compiled)
+
+                    self.assertIsInstance(e.exception, (Break, Continue))
+                    self.assertIn("placed outside of loop", str(e.exception))
+
+    def test_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "script.phys")
+            cache = os.path.join(directory, "__pycache__")
+
+            for source in ("x := 1 ~ 0.1", "x := 2 ~ 0.1"):
+                with open(file_name, "w") as f:
+                    f.write(source)
+
+                for _ in range(2):
+                    interpreter = VisitorInterpreter()
+                    interpreter.env = env = Environment(parent=default_environment)
+                    load_script(file_name)(interpreter)
+
+                    self.assertEqual(env.get("x").value, float(source[5]))
+
+                # only the cache of the latest version of the script is kept
+                self.assertEqual(len(os.listdir(cache)), 1)
+
+            with open(file_name, "w") as f:
+                f.write("x := := 1")
+
+            self.assertIsNone(load_script(file_name))
+
+
+# sources where the grammar is ambiguous, or which ANTLR lexes or parses in a surprising way
+AMBIGUOUS = (
+    "f*(x)", "f*(x, y)", "f**(x)", "a*(*b)", "f(*x)", "a^f*(x)", "f*(x) -> x", "2*(3+4)", "f(x) (y)", "f(x)`(y)",
+    "5 print(1)", "5 y[0]", "5 y := 1", "x := 1 ~ 2 y", "return x := 5", "return x y := 1", "return (x) := 1",
+    "#a[0]", "#a + b", "a ^ b ^ c", "a.b(c)", "a |> b . c", "x := (a, b) -> a (1)", "a [1]", "a[1] := 2",
+    "x := -1 - -2", "x-5", "x := 1*10^2", "x := 1 * 10^2", "a*10^2", "x := 1 ) y := 2", "end iffy", "else  if",
+    "// no newline", "x := 1 /* comment */ y := 2 // comment\n", "import a.b.c from x import y, z",
+)
+
+
+def shape(tree) -> tuple:
+    # the class of every context, and the type and text of every token, of a parse tree
+    if isinstance(tree, TerminalNode):
+        return tree.symbol.type, tree.getText()
+
+    return (type(tree).__name__,) + tuple(shape(child) for child in tree.children or ())
+
+
+@requires_parser
+class TestPrecedenceParser(unittest.TestCase):
+
+    def test_tokens(self):
+        for source in AMBIGUOUS + ('"unterminated', "a : b ! c $ d", "1*10^", "-.5 .5. 1.", "end loopy else if"):
+            with self.subTest(source):
+                stream = CommonTokenStream(ExprLexer(InputStream(source)))
+
+                with contextlib.redirect_stderr(io.StringIO()) as antlr_errors:
+                    stream.fill()
+                with contextlib.redirect_stderr(io.StringIO()) as errors:
+                    tokens = tokenize(source)
+
+                self.assertEqual([(t.type, t.text, t.line, t.column) for t in tokens[:-1]],
+                                 [(t.type, t.text, t.line, t.column) for t in stream.tokens[:-1]])
+                self.assertEqual(tokens[-1].type, Token.EOF)
+                self.assertEqual(errors.getvalue(), antlr_errors.getvalue())
+
+    def test_trees(self):
+        for source in tuple(PROGRAMS.values()) + AMBIGUOUS:
+            with self.subTest(source):
+                self.assertEqual(shape(parse_source(source, "precedence")), shape(parse_source(source)))
+
+    def test_syntax_errors(self):
+        for source in ("x := := 1", "if x then y ) end if", "a[b[1] := 2] := 3", "f(", "x := [1, ]", "1*10^",
+                       "define f() as return 1 end", "for i to 3 loop end loop", "x := 1 ~ y"):
+            with self.subTest(source):
+                with contextlib.redirect_stderr(io.StringIO()):
+                    self.assertIsNone(parse_source(source))
+                    self.assertIsNone(parse_source(source, "precedence"))
+
+        with self.assertRaises(ValueError):
+            parse_source("x := 1", "yacc")
+
+    def test_parity(self):
+        for name, source in PROGRAMS.items():
+            with self.subTest(name):
+                output_expr = name == "repl"
+                expected = run(source, True, output_expr)
+
+                self.assertEqual(run(source, True, output_expr, "precedence"), expected)
+                self.assertEqual(run(source, False, output_expr, "precedence"), expected)
+                self.assertEqual(run(source, "transpiled", output_expr, "precedence"), expected)
+
+
+# a loop which runs the same literals and arithmetic on them each time through
+LITERALS = """
+values := [0.312249, 0.343593 ~ 0.01, 2*10^-3]
+for i from 1 to 3 loop
+    x := (9.81 ~ 0.02 * 2 - 1) / (3 ^ 2)
+    values | x
+    values[0] := values[0] + x * i
+end loop
+print(values, x, 1 + [2][0], (2 + 3) * 4 ~ 0.5)
+"""
+
+
+@requires_parser
+class TestFolding(unittest.TestCase):
+
+    def expression(self, source: str):
+        # the expression assigned by the first statement of the source
+        return parse_source(source).getChild(0).getChild(2)
+
+    def test_parity(self):
+        expected = run(LITERALS, False)
+
+        for compiled in (True, "transpiled"):
+            with self.subTest(compiled):
+                self.assertEqual(run(LITERALS, compiled), expected)
+
+                with no_steps():
+                    self.assertEqual(run(LITERALS, compiled), expected)
+
+    def test_constants(self):
+        for source, expected in (("x := 9.81 ~ 0.02 * 2 - 1", MeasuredData(9.81, 0.02) * 2 - 1),
+                                 ("x := (1 + 2) ^ 2 / 4", (MeasuredData(1, 0) + 2) ** 2 / 4), ("x := 2*10^-3", 0.002)):
+            with self.subTest(source):
+                expression = self.expression(source)
+                constant = constant_value(expression)
+
+                self.assertEqual(str(constant), str(expected))
+                # worked out once for each expression
+                self.assertIs(constant_value(expression), constant)
+
+        for source in ("x := 1 / 0", "x := a * 2", "x := 1 < 2", "x := [1] | 2", "x := sin(1) + 1"):
+            with self.subTest(source):
+                self.assertIsNone(constant_value(self.expression(source)))
+
+    def test_fresh_values(self):
+        interpreter = VisitorInterpreter()
+        interpreter.env = env = Environment(parent=default_environment)
+        interpreter.run(parse_source("define f() as return [1, 2 ~ 0.1] end f\ndefine g() as return 2 * 3 end g"))
+
+        for name in ("f", "g"):
+            with self.subTest(name):
+                with no_steps():
+                    first, second = env.get(name)(), env.get(name)()
+
+                self.assertEqual(str(first), str(second))
+                self.assertIsNot(first, second)
+
+        # a list of literals can still be changed without changing the list the next call returns
+        env.get("f")().append(3)
+        self.assertEqual(len(env.get("f")()), 2)
+
+    def test_compiled_without_steps(self):
+        from physics_utils import instrumented, stats
+
+        interpreter = VisitorInterpreter()
+        interpreter.env = Environment(parent=default_environment)
+        tree = parse_source("x := (9.81 ~ 0.02 * 2 - 1) / 4")
+
+        # only folded when compiled while steps aren't tracked, so the default path is left as it's written
+        with instrumented():
+            interpreter.run(tree)
+
+        self.assertEqual(stats()["data.ops"], {"mul": 1, "sub": 1, "div": 1})
+
+        with no_steps():
+            # the first compile works the constant out, and the rest reuse it
+            interpreter.run(tree)
+
+            with instrumented():
+                interpreter.run(tree)
+
+        self.assertNotIn("data.ops", stats())
+        self.assertEqual(str(interpreter.env.get("x")), str((MeasuredData(9.81, 0.02) * 2 - 1) / 4))
+
+    def test_steps(self):
+        interpreter = VisitorInterpreter()
+        interpreter.env = env = Environment(parent=default_environment)
+        interpreter.run(parse_source("x := 9.81 ~ 0.02 * 2"))
+
+        self.assertTrue(env.get("x").has_steps)
+
+        with no_steps():
+            interpreter.run(parse_source("y := 9.81 ~ 0.02 * 2"))
+
+        self.assertFalse(env.get("y").has_steps)
+        self.assertEqual(env.get("y").value, env.get("x").value)
+        self.assertEqual(env.get("y").reading_error, env.get("x").reading_error)
+
+    def test_errors(self):
+        # constants which can't be worked out are left to fail when they're run, like they would otherwise
+        for compiled in (False, True, "transpiled"):
+            with self.subTest(compiled):
+                with self.assertRaises(ZeroDivisionError):
+                    run("x := 1 / 0", compiled)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from physics_utils import MeasuredData
+from physics_utils.data import MeasuredArray, RunningStats, avg_from_set, avg_measured_datas
+import numpy as np
+
+
+class TestRunningStats(unittest.TestCase):
+
+    def setUp(self):
+        self.values = np.random.default_rng(0).normal(10.0, 3.0, 200_000)
+
+    def test_matches_numpy(self):
+        stats = RunningStats(self.values)
+
+        self.assertEqual(stats.count, len(self.values))
+        self.assertAlmostEqual(stats.mean, np.mean(self.values))
+        self.assertAlmostEqual(stats.std(), np.std(self.values))
+        self.assertAlmostEqual(stats.std(ddof=1), np.std(self.values, ddof=1))
+
+    def test_incremental(self):
+        stats = RunningStats()
+
+        for x in self.values[:1000]:
+            stats.add(x)
+
+        self.assertAlmostEqual(stats.mean, np.mean(self.values[:1000]))
+        self.assertAlmostEqual(stats.variance(), np.var(self.values[:1000]))
+
+    def test_generator(self):
+        stats = RunningStats(float(x) for x in self.values)
+        self.assertAlmostEqual(stats.std(), np.std(self.values))
+
+    def test_merge(self):
+        a, b = RunningStats(self.values[:1234]), RunningStats(self.values[1234:])
+        merged = a + b
+
+        self.assertEqual(merged.count, len(self.values))
+        self.assertAlmostEqual(merged.mean, np.mean(self.values))
+        self.assertAlmostEqual(merged.std(), np.std(self.values))
+
+        a.merge(RunningStats())
+        self.assertEqual(a.count, 1234)
+
+    def test_avg_from_set(self):
+        result = avg_from_set(iter(self.values.tolist()), 0.1)
+
+        self.assertAlmostEqual(result.value, np.mean(self.values))
+        self.assertEqual(result.reading_error, 0.1)
+        self.assertAlmostEqual(result.standard_error, np.std(self.values))
+
+    def test_avg_measured_datas(self):
+        points = MeasuredData.from_set(self.values[:100].tolist(), 0.1)
+
+        result = avg_measured_datas(points)
+        self.assertAlmostEqual(result.value, np.mean(self.values[:100]))
+        self.assertAlmostEqual(result.standard_error, np.std(self.values[:100]))
+
+        self.assertAlmostEqual(avg_measured_datas(MeasuredArray.from_measured_datas(points)).value, result.value)
+
+    def test_empty(self):
+        with self.assertRaises(ValueError):
+            avg_from_set([], 0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
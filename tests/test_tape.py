@@ -0,0 +1,131 @@
+import unittest
+import gc
+import weakref
+from physics_utils import MeasuredData
+from physics_utils.data import StepTape, recording
+
+
+class TestStepTape(unittest.TestCase):
+
+    def calculate(self, x, y, z):
+        return (x * y + x / y - 2 * x) ** 2 + z.sine() * x.cosine() - abs(-z).arctan() + z.arcsin() / z.tangent() + 3
+
+    def test_same_steps(self):
+        x, y, z = MeasuredData(3.2, 0.1), MeasuredData(1.5, 0.2, 0.05), MeasuredData(0.4, 0.01)
+
+        plain = self.calculate(x, y, z)
+
+        with recording():
+            recorded = self.calculate(x, y, z)
+
+        self.assertIsNone(recorded.step_variables)
+        self.assertTrue(recorded.has_steps)
+
+        for plug_in in (True, False):
+            for trunc in (True, False):
+                self.assertEqual(plain.all_steps_composite(plug_in, trunc), recorded.all_steps_composite(plug_in, trunc))
+                self.assertEqual(plain.all_steps_sequential(plug_in, trunc)[:2],
+                                 recorded.all_steps_sequential(plug_in, trunc)[:2])
+
+        self.assertEqual(plain.recent_step(True), recorded.recent_step(True))
+
+    def test_operands_not_held(self):
+        with recording():
+            x = MeasuredData(2.0, 0.1) * 3
+            ref = weakref.ref(x)
+            result = x + 1
+
+            del x
+            gc.collect()
+
+        self.assertIsNone(ref())
+        self.assertEqual(result.all_steps_composite(False)[0], r" x \cdot3+1")
+
+    def test_levels(self):
+        with recording(levels=2) as tape:
+            total = MeasuredData(0, 0.1)
+
+            for _ in range(10000):
+                total = total + MeasuredData(1, 0.1)
+
+        self.assertLess(len(tape), 2 * StepTape.min_compaction)
+        self.assertEqual(total.all_steps_composite(False)[0], " x + y + z ")
+        self.assertEqual(len(total.all_steps_sequential()[0]), 2)
+
+    def test_labels(self):
+        with recording(labels=True) as tape:
+            total = MeasuredData(0, 0.1)
+            total.label = "total"
+
+            for _ in range(5000):
+                total = total + MeasuredData(1, 0.1)
+                total.label = "total"
+
+        self.assertLess(len(tape), 2 * StepTape.min_compaction)
+        self.assertEqual(total.all_steps_composite(False)[0], " total + y ")
+
+    def test_keep_all(self):
+        with recording() as tape:
+            total = MeasuredData(0, 0.1)
+            x = MeasuredData(1, 0.1)
+
+            for _ in range(3000):
+                total = total + x
+
+        tape.compact()
+
+        # every addition is still needed, along with the two measurements
+        self.assertEqual(len(tape), 3002)
+        self.assertEqual(len(total.all_steps_sequential()[0]), 3000)
+        self.assertTrue(total.all_steps_composite(False)[0].startswith(" x + y + y "))
+
+    def test_after_recording(self):
+        with recording():
+            x = MeasuredData(2.0, 0.1).sine()
+
+        result = x * MeasuredData(3.0, 0.2)
+
+        self.assertIs(result.step_variables[0], x)
+        self.assertEqual(result.all_steps_composite(False)[0], r"\left(\sin  x \right)\cdot y ")
+
+    def test_measurements_unchanged(self):
+        x = MeasuredData(2.0, 0.1)
+
+        with recording() as first:
+            a = x * 3
+
+        with recording() as second:
+            b = x + 1
+
+        # recording doesn't mark measurements as belonging to the first tape they're used on
+        self.assertIsNone(x.tape)
+        self.assertIs(a.tape, first)
+        self.assertIs(b.tape, second)
+        self.assertIs(b._operands()[0], x)
+
+    def test_other_tapes(self):
+        plain = (MeasuredData(2.0, 0.1) * 3 + 1).sine()
+
+        with recording():
+            a = MeasuredData(2.0, 0.1) * 3 + 1
+
+        with recording() as tape:
+            c = a.sine()
+
+        # the history of a result from another tape is copied along with it
+        self.assertIs(c.tape, tape)
+        self.assertEqual(c.all_steps_composite(False), plain.all_steps_composite(False))
+        self.assertEqual(c.all_steps_sequential(False), plain.all_steps_sequential(False))
+
+        with recording(levels=1):
+            d = a.sine()
+
+        self.assertEqual(d.all_steps_composite(False)[0], r"\sin  x ")
+
+    def test_bad_levels(self):
+        with self.assertRaises(ValueError):
+            StepTape(levels=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import numpy as np
+from physics_utils import MeasuredData
+from physics_utils.data import MeasuredArray, avg_weighted, avg_weighted_groups
+
+
+class TestWeightedAverages(unittest.TestCase):
+
+    def test_weighted(self):
+        result = avg_weighted([MeasuredData(1.0, 0.1), MeasuredData(2.0, 0.2), MeasuredData(4.0, 0.1, 0.4)])
+
+        weights = np.array([100, 25, 1 / 0.16])
+        self.assertAlmostEqual(result.value, (weights * [1.0, 2.0, 4.0]).sum() / weights.sum())
+        self.assertAlmostEqual(result.standard_error, 1 / np.sqrt(weights.sum()))
+        self.assertEqual(result.reading_error, 0.0)
+
+        # equal errors give the plain mean
+        self.assertAlmostEqual(avg_weighted(MeasuredArray([1.0, 2.0, 6.0], 0.5)).value, 3.0)
+
+    def test_groups(self):
+        rng = np.random.default_rng(3)
+        keys = rng.integers(0, 50, 5000)
+        data = MeasuredArray(rng.normal(10, 1, 5000), rng.uniform(0.5, 2, 5000))
+
+        groups, means, chi2 = avg_weighted_groups(keys, data)
+
+        np.testing.assert_array_equal(groups, np.unique(keys))
+
+        for i, key in enumerate(groups):
+            points = data[keys == key]
+            single = avg_weighted(points)
+            weights = 1 / points.error() ** 2
+
+            self.assertAlmostEqual(means.value[i], single.value)
+            self.assertAlmostEqual(means.standard_error[i], single.standard_error)
+            self.assertAlmostEqual(chi2[i], (weights * (points.value - single.value) ** 2).sum() / (len(points) - 1))
+
+    def test_string_keys(self):
+        groups, means, chi2 = avg_weighted_groups(["b", "a", "b"], MeasuredArray([1.0, 2.0, 3.0], 1.0))
+
+        self.assertEqual(groups.tolist(), ["a", "b"])
+        np.testing.assert_array_equal(means.value, [2.0, 2.0])
+        self.assertTrue(np.isnan(chi2[0]))
+
+    def test_bad_input(self):
+        with self.assertRaises(ValueError):
+            avg_weighted([MeasuredData(1.0, 0.0)])
+        with self.assertRaises(ValueError):
+            avg_weighted([])
+        with self.assertRaises(ValueError):
+            avg_weighted_groups([0, 1], MeasuredArray([1.0, 2.0, 3.0], 0.1))
+
+
+if __name__ == '__main__':
+    unittest.main()